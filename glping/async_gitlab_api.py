@@ -1,23 +1,96 @@
 import asyncio
 import json
+from collections import deque
+from itertools import islice
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
 
 import aiohttp
 from .base_gitlab_api import BaseGitLabAPI
+from .concurrency import AdaptiveLimiter
 from .config import Config
+from .http_cache import ValidatorCache
+from .rate_limit import RateLimiter, RateLimitError
+from .resilience import APIRequestError, CircuitBreaker, RetryPolicy, is_retryable_status
+from .singleflight import SingleFlight
+from .utils.pagination import (
+    ENDPOINT_ORDER, Watermark, get_next_page, get_total_pages, split_at_watermark
+)
 
 
 class AsyncGitLabAPI(BaseGitLabAPI):
     """Асинхронный класс для работы с GitLab API."""
 
-    def __init__(self, url: str, token: str):
-        """Инициализация подключения к GitLab."""
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        max_parallel_pages: int = 4,
+        keyset_projects: bool = False,
+        validator_cache: Optional[ValidatorCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker_factory: Optional[Callable[[], CircuitBreaker]] = None,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        prewarm_connections: int = 0,
+        timeout: float = 60.0,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 30.0,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+    ):
+        """
+        Инициализация подключения к GitLab.
+
+        Args:
+            url: URL GitLab
+            token: Токен доступа
+            max_parallel_pages: Сколько страниц списка запрашивать одновременно
+            keyset_projects: Получать список проектов keyset-пагинацией
+            validator_cache: Кеш ETag для условных GET запросов
+                (по умолчанию создается кеш в памяти)
+            rate_limiter: Ограничитель частоты запросов, общий для всех запросов клиента
+            rate_limit_retries: Сколько раз повторять запрос после ответа 429
+            retry_policy: Политика повторов GET запросов после сетевых ошибок и 5xx
+            breaker_factory: Фабрика автоматического выключателя для каждого хоста
+            limit_per_host: Максимум одновременных соединений с GitLab
+                (по числу одновременно проверяемых проектов)
+            keepalive_timeout: Сколько секунд держать простаивающее соединение
+            dns_cache_ttl: Сколько секунд кешировать разрешение имени хоста
+            prewarm_connections: Сколько соединений открыть заранее при создании сессии
+            timeout: Таймаут запроса целиком (сек)
+            connect_timeout: Таймаут установки соединения (сек)
+            read_timeout: Таймаут чтения из сокета (сек)
+            concurrency_limiter: Адаптивный ограничитель одновременных запросов
+        """
         # Создаем временную конфигурацию для обратной совместимости
         config = type('Config', (), {'gitlab_url': url, 'private_token': token})()
         super().__init__(config)
         self.url = url.rstrip("/")
         self.token = token
+        self.max_parallel_pages = max_parallel_pages
+        self.keyset_projects = keyset_projects
+        self.validator_cache = validator_cache if validator_cache is not None else ValidatorCache()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.concurrency_limiter = (
+            concurrency_limiter if concurrency_limiter is not None else AdaptiveLimiter()
+        )
+        self.rate_limit_retries = rate_limit_retries
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.breaker_factory = breaker_factory or CircuitBreaker
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # Одинаковые одновременные GET запросы выполняются один раз
+        self.singleflight = SingleFlight()
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.prewarm_connections = prewarm_connections
+        self.timeout = aiohttp.ClientTimeout(
+            total=timeout, connect=connect_timeout, sock_read=read_timeout
+        )
         self.session = None
         self.headers = {
             "Authorization": f"Bearer {token}",
@@ -26,43 +99,470 @@ class AsyncGitLabAPI(BaseGitLabAPI):
 
     async def __aenter__(self):
         """Асинхронный контекстный менеджер"""
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        await self.init_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Закрытие сессии"""
+        await self.close()
+
+    async def init_session(self):
+        """
+        Создать сессию с настроенным пулом соединений.
+
+        Сессия создается один раз и переиспользуется во всех циклах
+        проверки, поэтому TLS рукопожатия не повторяются каждый цикл.
+        """
+        if self.session is not None and not self.session.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        self.session = aiohttp.ClientSession(
+            headers=self.headers, connector=connector, timeout=self.timeout
+        )
+        if self.prewarm_connections > 0:
+            await self._prewarm()
+
+    async def _prewarm(self):
+        """Заранее открыть соединения с GitLab одновременными легкими запросами"""
+        url = f"{self.url}/api/v4/version"
+
+        async def warm():
+            async with self.session.get(url) as response:
+                await response.read()
+
+        count = min(self.prewarm_connections, self.limit_per_host or self.prewarm_connections)
+        results = await asyncio.gather(*(warm() for _ in range(count)), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            print(f"⚠️  Не удалось заранее открыть {len(errors)} соединений: {errors[0]!r}")
+
+    async def close(self):
+        """Закрыть сессию и сохранить кеш ETag"""
         if self.session:
             await self.session.close()
-
-    async def _make_request(
-        self, method: str, endpoint: str, params: Optional[Dict] = None
-    ) -> List[Dict[str, Any]]:
-        """Выполнить запрос к API"""
+            self.session = None
+        self.validator_cache.save()
+
+    def _get_breaker(self, url: str) -> CircuitBreaker:
+        """Получить автоматический выключатель хоста запроса"""
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = self.breaker_factory()
+        return breaker
+
+    async def _request_page(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], Mapping[str, str]]:
+        """
+        Выполнить запрос к API и вернуть данные вместе с заголовками ответа.
+
+        GET запросы после сетевых ошибок, таймаутов и ответов 5xx повторяются
+        по retry_policy. Если хост раз за разом не отвечает, его выключатель
+        размыкается, и запросы сразу завершаются ошибкой. Ответы 4xx
+        (кроме 408 и 429) означают, что данных нет, и дают пустой список.
+        Одинаковые GET запросы, отправленные одновременно, выполняются
+        один раз, и все вызовы получают общий результат.
+
+        Args:
+            method: HTTP метод
+            endpoint: Путь относительно /api/v4 или полный URL следующей страницы
+            params: Параметры запроса
+            json_body: Тело запроса в JSON
+            idempotent: Можно ли повторять запрос (по умолчанию только GET)
+
+        Returns:
+            Кортеж (список объектов, заголовки ответа)
+
+        Raises:
+            APIRequestError: Данные не получены после всех повторов
+                (CircuitOpenError, если выключатель хоста разомкнут)
+        """
         if not self.session:
             raise RuntimeError(
                 "Session not initialized. Use async with or call init_session()"
             )
 
-        url = f"{self.url}/api/v4/{endpoint}"
+        if endpoint.startswith(("http://", "https://")):
+            url = endpoint
+        else:
+            url = f"{self.url}/api/v4/{endpoint}"
 
-        try:
-            async with self.session.request(method, url, params=params) as response:
-                response.raise_for_status()
+        if method == "GET" and json_body is None:
+            return await self.singleflight.do(
+                self.validator_cache.make_key(url, params),
+                lambda: self._request_with_retries(method, url, params, json_body, idempotent),
+            )
+        return await self._request_with_retries(method, url, params, json_body, idempotent)
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        json_body: Optional[Dict[str, Any]],
+        idempotent: Optional[bool],
+    ) -> Tuple[List[Dict[str, Any]], Mapping[str, str]]:
+        """Выполнить запрос с повторами и учетом выключателя хоста"""
+        breaker = self._get_breaker(url)
+        # Повторять безопасно только идемпотентные запросы
+        if idempotent is None:
+            idempotent = method == "GET"
+        retries = self.retry_policy.max_retries if idempotent else 0
+        error: Optional[BaseException] = None
+
+        for attempt in range(retries + 1):
+            breaker.before_request()
+            # Исход попытки учитывается на любом пути выхода, иначе пробный
+            # запрос полуоткрытого выключателя не освободится никогда.
+            # Любое неожиданное исключение (RateLimitError, ошибка разбора
+            # ответа) считается ошибкой хоста, отмена исход не определяет
+            failed: Optional[bool] = True
+            try:
+                result = await self._send_request(method, url, params, json_body)
+                failed = False
+                return result
+            except aiohttp.ClientResponseError as e:
+                if not is_retryable_status(e.status):
+                    # Хост отвечает, но объекта нет или нет доступа
+                    failed = False
+                    print(f"API request error: {e}")
+                    return [], {}
+                error = e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+            except asyncio.CancelledError:
+                failed = None
+                raise
+            finally:
+                if failed is None:
+                    breaker.release_probe()
+                elif failed:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+            if attempt < retries:
+                await self.retry_policy.wait(attempt)
+
+        raise APIRequestError(
+            f"Запрос к {url} не выполнен после {retries + 1} попыток: {error!r}"
+        ) from error
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Mapping[str, str]]:
+        """
+        Отправить запрос с учетом лимита частоты, лимита одновременных запросов и кеша ETag.
+
+        Raises:
+            RateLimitError: GitLab отвечает 429 после всех повторов
+            aiohttp.ClientError: Сетевая ошибка или ответ с кодом ошибки
+        """
+        # Условный запрос: если ответ не изменился, GitLab вернет 304 без тела
+        cache_key = (
+            self.validator_cache.make_key(url, params)
+            if method == "GET" and self.validator_cache.is_cacheable(url)
+            else None
+        )
+        etag = self.validator_cache.get_etag(cache_key) if cache_key else None
+        request_headers = {"If-None-Match": etag} if etag else None
+        body = {"json": json_body} if json_body is not None else {}
+
+        for _ in range(self.rate_limit_retries + 1):
+            # Все запросы клиента ждут общего разрешения ограничителя
+            await self.rate_limiter.acquire()
+            # Число одновременных запросов подбирается по задержке и ошибкам ответов
+            async with self.concurrency_limiter.slot() as slot:
+                async with self.session.request(
+                    method, url, params=params, headers=request_headers, **body
+                ) as response:
+                    slot.status = response.status
+                    self.rate_limiter.update(response.headers, response.status)
+                    if response.status == 429:
+                        # Ограничитель выдержит Retry-After перед повтором
+                        continue
+
+                    if response.status == 304 and cache_key:
+                        cached = self.validator_cache.reuse(cache_key)
+                        if cached is not None:
+                            return cached
+
+                    response.raise_for_status()
+
+                    # Обработка пагинации
+                    data = await response.json()
+                    if isinstance(data, dict) and "data" in data:
+                        # Если ответ - объект с пагинацией
+                        data = data["data"]
+                    elif not isinstance(data, list):
+                        data = [data] if data else []
+
+                    if cache_key:
+                        response_etag = response.headers.get("ETag")
+                        if response_etag:
+                            self.validator_cache.store(cache_key, response_etag, data, response.headers)
+                        else:
+                            self.validator_cache.discard(cache_key)
+
+                    return data, response.headers
+
+        # Пустой список здесь означал бы «нет событий» и потерю данных
+        raise RateLimitError(
+            f"GitLab ограничил частоту запросов к {url}: "
+            f"429 после {self.rate_limit_retries + 1} попыток"
+        )
+
+    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Выполнить запрос к GraphQL API (/api/graphql).
+
+        Запросы только читают данные, поэтому повторяются после ошибок как GET.
+
+        Returns:
+            Поле data ответа
+
+        Raises:
+            APIRequestError: Запрос не выполнен или GraphQL вернул ошибку без данных
+        """
+        data, _ = await self._request_page(
+            "POST",
+            f"{self.url}/api/graphql",
+            json_body={"query": query, "variables": variables or {}},
+            idempotent=True,
+        )
+        if not isinstance(data, dict):
+            raise APIRequestError("GraphQL запрос не вернул данных")
+        return data
+
+    async def _make_request(
+        self, method: str, endpoint: str, params: Optional[Dict] = None
+    ) -> List[Dict[str, Any]]:
+        """Выполнить запрос к API"""
+        data, _ = await self._request_page(method, endpoint, params)
+        return data
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Получить метрики клиента для подробного вывода.
+
+        Returns:
+            Словарь: rate_limit — состояние ограничителя частоты запросов,
+            concurrency — лимит одновременных запросов и задержка ответов,
+            retries — число повторов после ошибок, circuit_breakers —
+            состояние выключателей по хостам, http_cache — попадания
+            и промахи кеша ETag, singleflight — выполняемые GET запросы
+            и число вызовов, получивших результат уже выполняемого запроса
+        """
+        return {
+            "rate_limit": self.rate_limiter.get_state(),
+            "concurrency": self.concurrency_limiter.get_state(),
+            "retries": self.retry_policy.retries,
+            "circuit_breakers": {
+                host: breaker.get_state() for host, breaker in self._breakers.items()
+            },
+            "http_cache": {
+                "hits": self.validator_cache.hits,
+                "misses": self.validator_cache.misses,
+                "entries": len(self.validator_cache),
+            },
+            "singleflight": {
+                "in_flight": len(self.singleflight),
+                "shared": self.singleflight.shared,
+            },
+        }
 
-                # Обработка пагинации
-                data = await response.json()
-                if isinstance(data, list):
-                    return data
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        watermark: Watermark = None,
+        watermark_field: str = "updated_at",
+        order_by: Optional[str] = None,
+        per_page: int = 100,
+        keyset: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Получить все страницы списка до водяного знака одним списком.
+
+        Параметры совпадают с _iter_pages.
+
+        Returns:
+            Объекты новее водяного знака
+        """
+        items: List[Dict[str, Any]] = []
+        async for page_items in self._iter_pages(
+            endpoint, params, watermark, watermark_field, order_by, per_page, keyset
+        ):
+            items.extend(page_items)
+        return items
+
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        watermark: Watermark = None,
+        watermark_field: str = "updated_at",
+        order_by: Optional[str] = None,
+        per_page: int = 100,
+        keyset: bool = False,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Получать страницы списка до водяного знака по мере их загрузки.
+
+        Объекты запрашиваются по убыванию order_by (или в порядке по умолчанию,
+        если order_by не задан). Без водяного знака оставшиеся страницы
+        запрашиваются параллельно по X-Total-Pages/X-Total первого ответа.
+        Иначе следующая страница берется из X-Next-Page или Link rel="next";
+        без этих заголовков листание продолжается, пока страница заполнена.
+        Листание прекращается на первом объекте, который не новее водяного знака.
+
+        Args:
+            endpoint: Путь списка относительно /api/v4
+            params: Параметры фильтрации
+            watermark: Водяной знак (ID или дата ISO 8601)
+            watermark_field: Поле объекта, сравниваемое с водяным знаком
+            order_by: Поле сортировки по убыванию
+            per_page: Размер страницы
+            keyset: Список поддерживает keyset-пагинацию по id; объекты
+                запрашиваются по возрастанию id, и если GitLab не сообщает
+                число страниц, листание продолжается keyset-курсором.
+                С params["pagination"] == "keyset" курсор используется сразу
+
+        Yields:
+            Непустые страницы объектов новее водяного знака в порядке списка
+        """
+        params = dict(params or {})
+        params["per_page"] = str(per_page)
+        if params.get("pagination") != "keyset":
+            params.setdefault("page", "1")
+        if keyset:
+            params["order_by"] = "id"
+            params["sort"] = "asc"
+        elif order_by:
+            params["order_by"] = order_by
+            params["sort"] = "desc"
+
+        request_endpoint: str = endpoint
+        request_params: Optional[Dict[str, Any]] = params
+        first_page = True
 
-                # Если ответ - объект с пагинацией
-                if isinstance(data, dict) and "data" in data:
-                    return data["data"]
+        while True:
+            page_items, headers = await self._request_page(
+                "GET", request_endpoint, request_params
+            )
+            if not page_items:
+                break
 
-                return [data] if data else []
+            page_size = len(page_items)
+            page_items, reached = split_at_watermark(page_items, watermark, watermark_field)
+            if page_items:
+                yield page_items
+            if reached:
+                break
 
-        except aiohttp.ClientError as e:
-            print(f"API request error: {e}")
-            return []
+            next_page, next_url = get_next_page(headers)
+            if first_page and watermark is None and next_page:
+                total_pages = get_total_pages(headers, per_page)
+                if total_pages:
+                    async for rest in self._iter_page_range(
+                        endpoint, params, int(next_page), total_pages
+                    ):
+                        yield rest
+                    break
+                if keyset:
+                    # GitLab не считает страницы для больших списков (>10 000 строк):
+                    # продолжаем keyset-курсором после последнего id
+                    params.pop("page", None)
+                    params["pagination"] = "keyset"
+                    params["id_after"] = str(page_items[-1]["id"])
+                    request_endpoint, request_params = endpoint, params
+                    first_page = False
+                    continue
+            first_page = False
+
+            if next_page:
+                params["page"] = next_page
+                request_endpoint, request_params = endpoint, params
+            elif next_url:
+                # Keyset-пагинация передает курсор только в ссылке
+                request_endpoint, request_params = next_url, None
+            elif "X-Next-Page" in headers or page_size < per_page:
+                # Последняя страница
+                break
+            else:
+                params["page"] = str(int(params["page"]) + 1)
+                request_endpoint, request_params = endpoint, params
+
+    async def _iter_page_range(
+        self, endpoint: str, params: Dict[str, Any], first: int, last: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Параллельно запросить страницы first..last списка.
+
+        Одновременно запрашивается не больше max_parallel_pages страниц:
+        следующая страница запрашивается, когда получена самая ранняя из
+        запрошенных, поэтому в памяти не накапливается весь список.
+
+        Args:
+            endpoint: Путь списка относительно /api/v4
+            params: Параметры запроса первой страницы
+            first: Номер первой запрашиваемой страницы
+            last: Номер последней страницы
+
+        Yields:
+            Объекты страниц в порядке их номеров
+        """
+        pages = iter(range(first, last + 1))
+
+        def fetch(page: int) -> "asyncio.Future":
+            return asyncio.ensure_future(
+                self._request_page("GET", endpoint, dict(params, page=str(page)))
+            )
+
+        window = deque(fetch(page) for page in islice(pages, max(1, self.max_parallel_pages)))
+        try:
+            while window:
+                page_items, _ = await window.popleft()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    window.append(fetch(next_page))
+                if page_items:
+                    yield page_items
+        finally:
+            # Листание прервано: оставшиеся запросы больше не нужны
+            for task in window:
+                task.cancel()
+
+    async def _get_project_list(
+        self,
+        project_id: int,
+        resource: str,
+        params: Optional[Dict[str, Any]] = None,
+        watermark: Watermark = None,
+    ) -> List[Dict[str, Any]]:
+        """Получить список объектов проекта общим пагинатором"""
+        order_by, watermark_field = ENDPOINT_ORDER[resource]
+        return await self._paginate(
+            f"projects/{project_id}/{resource}",
+            params,
+            watermark=watermark,
+            watermark_field=watermark_field,
+            order_by=order_by,
+        )
 
     async def get_projects(
         self,
@@ -70,13 +570,43 @@ class AsyncGitLabAPI(BaseGitLabAPI):
         project_id: Optional[int] = None,
         fields: Optional[List[str]] = None,
         last_activity_after: Optional[str] = None,
+        keyset: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
-        """Получить список проектов с оптимизацией полей и фильтрацией по активности"""
+        """
+        Получить список проектов с оптимизацией полей и фильтрацией по активности.
+
+        С keyset-пагинацией (pagination=keyset&order_by=id) страницы
+        запрашиваются по ссылке Link rel="next", и стоимость страницы
+        не растет с глубиной листания. По умолчанию используется
+        значение keyset_projects.
+        """
         if project_id:
             endpoint = f"projects/{project_id}"
             projects = await self._make_request("GET", endpoint)
             return projects if projects else []
 
+        projects: List[Dict[str, Any]] = []
+        async for page in self.iter_projects(
+            membership, fields, last_activity_after, keyset
+        ):
+            projects.extend(page)
+        return projects
+
+    async def iter_projects(
+        self,
+        membership: bool = True,
+        fields: Optional[List[str]] = None,
+        last_activity_after: Optional[str] = None,
+        keyset: Optional[bool] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Получать список проектов по страницам, не дожидаясь всего списка.
+
+        Параметры совпадают с get_projects.
+
+        Yields:
+            Страницы проектов
+        """
         if fields is None:
             fields = [
                 "id",
@@ -86,7 +616,7 @@ class AsyncGitLabAPI(BaseGitLabAPI):
                 "last_activity_at",
             ]
 
-        params = {"membership": str(membership).lower(), "per_page": "100", "page": "1"}
+        params = {"membership": str(membership).lower()}
 
         if fields:
             params["fields"] = ",".join(fields)
@@ -94,33 +624,45 @@ class AsyncGitLabAPI(BaseGitLabAPI):
         if last_activity_after:
             params["last_activity_after"] = last_activity_after
 
-        projects = []
-        page = 1
+        if self.keyset_projects if keyset is None else keyset:
+            params["pagination"] = "keyset"
 
-        while True:
-            params["page"] = str(page)
-            page_projects = await self._make_request("GET", "projects", params)
-
-            if not page_projects:
-                break
-
-            projects.extend(page_projects)
-
-            # Проверяем, есть ли следующая страница
-            if len(page_projects) < 100:
-                break
-
-            page += 1
-
-        return projects
+        async for page in self._iter_pages("projects", params, keyset=True):
+            yield page
 
     async def get_project_events(
         self,
         project_id: int,
         after: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        since_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Получить события проекта с оптимизацией"""
+        """
+        Получить события проекта с оптимизацией.
+
+        Если указан since_id, события запрашиваются от новых к старым
+        и листание прекращается на первом событии с ID не выше since_id.
+        """
+        events: List[Dict[str, Any]] = []
+        async for page in self.iter_project_events(project_id, after, fields, since_id):
+            events.extend(page)
+        return events
+
+    async def iter_project_events(
+        self,
+        project_id: int,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        since_id: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Получать события проекта по страницам, не дожидаясь всего списка.
+
+        Параметры совпадают с get_project_events.
+
+        Yields:
+            Страницы событий
+        """
         if fields is None:
             fields = [
                 "id",
@@ -134,35 +676,61 @@ class AsyncGitLabAPI(BaseGitLabAPI):
                 "data",
             ]
 
-        params = {"per_page": "100", "page": "1"}
+        params = {}
 
         if after:
             params["after"] = after
 
+        if since_id is not None:
+            params["sort"] = "desc"
+
         if fields:
             params["fields"] = ",".join(fields)
 
-        events = []
-        page = 1
-
-        while True:
-            params["page"] = str(page)
-            page_events = await self._make_request(
-                "GET", f"projects/{project_id}/events", params
-            )
-
-            if not page_events:
-                break
+        # Дойдя до уже обработанных событий, листание прекращается
+        async for page in self._iter_pages(
+            f"projects/{project_id}/events",
+            params,
+            watermark=since_id,
+            watermark_field="id",
+        ):
+            yield page
 
-            events.extend(page_events)
+    async def get_user_events(
+        self,
+        after: Optional[str] = None,
+        since_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Получить ленту событий всех проектов пользователя одним списком.
 
-            # Проверяем, есть ли следующая страница
-            if len(page_events) < 100:
-                break
+        События запрашиваются от новых к старым, и листание прекращается
+        на первом событии с ID не выше since_id.
+        """
+        if fields is None:
+            fields = [
+                "id",
+                "project_id",
+                "created_at",
+                "target_type",
+                "target_id",
+                "target_iid",
+                "action_name",
+                "author",
+                "push_data",
+                "data",
+            ]
 
-            page += 1
+        params = {"scope": "all", "sort": "desc"}
+        if after:
+            params["after"] = after
+        if fields:
+            params["fields"] = ",".join(fields)
 
-        return events
+        return await self._paginate(
+            "events", params, watermark=since_id, watermark_field="id"
+        )
 
     async def get_recent_events(
         self, project_id: int, limit: int = 10, fields: Optional[List[str]] = None
@@ -215,92 +783,74 @@ class AsyncGitLabAPI(BaseGitLabAPI):
 
     # Методы форматирования дат и событий теперь наследуются от базового класса
 
-    def get_project(self, project_id: int) -> Dict[str, Any]:
+    async def get_project(self, project_id: int) -> Dict[str, Any]:
         """Получить информацию о проекте."""
-        return asyncio.run(self._async_get_project(project_id))
-
-    async def _async_get_project(self, project_id: int) -> Dict[str, Any]:
-        """Асинхронный метод получения информации о проекте."""
         endpoint = f"projects/{project_id}"
         projects = await self._make_request("GET", endpoint)
         return projects[0] if projects else {}
 
-    def get_project_merge_requests(
-        self, project_id: int, state: str = "opened", updated_after: Optional[str] = None
+    async def get_project_merge_requests(
+        self,
+        project_id: int,
+        state: str = "opened",
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Получить merge requests проекта."""
-        return asyncio.run(self._async_get_project_merge_requests(project_id, state, updated_after))
-
-    async def _async_get_project_merge_requests(
-        self, project_id: int, state: str = "opened", updated_after: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Асинхронный метод получения merge requests."""
         params = {"state": state}
         if updated_after:
             params["updated_after"] = updated_after
-        endpoint = f"projects/{project_id}/merge_requests"
-        return await self._make_request("GET", endpoint, params)
+        return await self._get_project_list(project_id, "merge_requests", params, watermark)
 
-    def get_project_issues(
-        self, project_id: int, state: str = "opened", updated_after: Optional[str] = None
+    async def get_project_issues(
+        self,
+        project_id: int,
+        state: str = "opened",
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Получить задачи проекта."""
-        return asyncio.run(self._async_get_project_issues(project_id, state, updated_after))
-
-    async def _async_get_project_issues(
-        self, project_id: int, state: str = "opened", updated_after: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Асинхронный метод получения задач."""
         params = {"state": state}
         if updated_after:
             params["updated_after"] = updated_after
-        endpoint = f"projects/{project_id}/issues"
-        return await self._make_request("GET", endpoint, params)
+        return await self._get_project_list(project_id, "issues", params, watermark)
 
-    def get_project_pipelines(
-        self, project_id: int, updated_after: Optional[str] = None
+    async def get_project_pipelines(
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Получить pipelines проекта."""
-        return asyncio.run(self._async_get_project_pipelines(project_id, updated_after))
-
-    async def _async_get_project_pipelines(
-        self, project_id: int, updated_after: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Асинхронный метод получения pipelines."""
         params = {}
         if updated_after:
             params["updated_after"] = updated_after
-        endpoint = f"projects/{project_id}/pipelines"
-        return await self._make_request("GET", endpoint, params)
+        return await self._get_project_list(project_id, "pipelines", params, watermark)
 
-    def get_project_jobs(
-        self, project_id: int, updated_after: Optional[str] = None
+    async def get_project_jobs(
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Получить jobs проекта."""
-        return asyncio.run(self._async_get_project_jobs(project_id, updated_after))
+        """
+        Получить jobs проекта.
 
-    async def _async_get_project_jobs(
-        self, project_id: int, updated_after: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Асинхронный метод получения jobs."""
-        params = {}
-        if updated_after:
-            params["updated_after"] = updated_after
-        endpoint = f"projects/{project_id}/jobs"
-        return await self._make_request("GET", endpoint, params)
+        API jobs не фильтрует по дате обновления, поэтому updated_after
+        используется как водяной знак по дате создания, если он не задан.
+        """
+        return await self._get_project_list(
+            project_id, "jobs", watermark=watermark or updated_after
+        )
 
-    def get_project_deployments(
-        self, project_id: int, updated_after: Optional[str] = None
+    async def get_project_deployments(
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Получить deployments проекта."""
-        return asyncio.run(self._async_get_project_deployments(project_id, updated_after))
-
-    async def _async_get_project_deployments(
-        self, project_id: int, updated_after: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Асинхронный метод получения deployments."""
         params = {}
         if updated_after:
             params["updated_after"] = updated_after
-        endpoint = f"projects/{project_id}/deployments"
-        return await self._make_request("GET", endpoint, params)
+        return await self._get_project_list(project_id, "deployments", params, watermark)
@@ -1,14 +1,23 @@
 import asyncio
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from .async_gitlab_api import AsyncGitLabAPI
 from .base_watcher import BaseWatcher
 from .cache import Cache
+from .concurrency import AdaptiveLimiter
 from .config import Config
+from .graphql_ci import GraphQLCIFetcher
+from .http_cache import ValidatorCache
 from .notifier import Notifier
+from .rate_limit import RateLimiter
+from .resilience import APIRequestError, CircuitBreaker, RetryPolicy
+from .scheduler import PollScheduler, has_active_ci
+from .singleflight import singleflight
 from .utils.url_utils import get_event_url
+from .worker_pool import WorkerPool
 
 
 class AsyncGitLabWatcher(BaseWatcher):
@@ -17,20 +26,58 @@ class AsyncGitLabWatcher(BaseWatcher):
     def __init__(self, config: Config):
         """Инициализация наблюдателя."""
         super().__init__(config)
-        self.api = AsyncGitLabAPI(config.gitlab_url, config.gitlab_token)
+        self.api = AsyncGitLabAPI(
+            config.gitlab_url,
+            config.gitlab_token,
+            validator_cache=ValidatorCache(**config.get_http_cache_options()),
+            rate_limiter=RateLimiter(**config.get_rate_limit_options()),
+            concurrency_limiter=AdaptiveLimiter(**config.get_concurrency_options()),
+            retry_policy=RetryPolicy(**config.get_retry_options()),
+            breaker_factory=partial(CircuitBreaker, **config.get_breaker_options()),
+            **config.get_api_options(),
+        )
+        # Пакетная загрузка pipelines и jobs через GraphQL вместо запросов по проектам
+        self.ci_fetcher = (
+            GraphQLCIFetcher(self.api, batch_size=config.graphql_batch_size)
+            if config.graphql_ci
+            else None
+        )
+        # Расписание проверки проектов: горячие проекты проверяются каждый цикл,
+        # остывающие все реже, пока не покинут расписание, а активность
+        # из списка проектов будит их сразу
+        self.scheduler = (
+            PollScheduler(**config.get_scheduler_options())
+            if config.adaptive_polling
+            else None
+        )
         self.notifier = Notifier()
-        self._semaphore = asyncio.Semaphore(10)  # Ограничение одновременных запросов
 
     async def check_projects(self, verbose: bool = False):
-        """Проверить проекты на наличие новых событий с серверной фильтрацией по активности"""
+        """
+        Проверить проекты на наличие новых событий с серверной фильтрацией по активности.
+
+        Список проектов получается по страницам: проверка проектов страницы
+        начинается сразу, пока загружаются следующие страницы. Затем
+        проверяются проекты, время проверки которых наступило по расписанию.
+        """
         if verbose:
             print(f"[{datetime.now().isoformat()}] Проверка новых событий...")
 
         # Получаем дату последней проверки для фильтрации
         last_checked = self.cache.get_last_checked()
         
-        # Если есть дата последней проверки, используем серверную фильтрацию
-        if last_checked:
+        fields = [
+            "id",
+            "name",
+            "name_with_namespace",
+            "path_with_namespace",
+            "last_activity_at",
+        ]
+
+        # Каталог проектов полностью сверяется раз в PROJECT_CATALOGUE_REFRESH_HOURS,
+        # в остальных циклах сервер возвращает только проекты с новой активностью
+        full_refresh = not last_checked or self.cache.is_catalogue_refresh_due()
+        if not full_refresh:
             if verbose:
                 last_checked_dt = datetime.fromisoformat(
                     last_checked.replace("Z", "+00:00")
@@ -38,40 +85,122 @@ class AsyncGitLabWatcher(BaseWatcher):
                 print(f"🔍 Фильтрация проектов с активностью после: {last_checked_dt}")
             
             # Получаем только активные проекты с сервера
-            projects = await self.api.get_projects(
+            pages = self.api.iter_projects(
                 **self.config.get_project_filter(),
-                fields=[
-                    "id",
-                    "name",
-                    "name_with_namespace", 
-                    "path_with_namespace",
-                    "last_activity_at",
-                ],
+                fields=fields,
                 last_activity_after=last_checked,
             )
-            
-            if verbose:
-                print(f"📊 Найдено {len(projects)} активных проектов (серверная фильтрация)")
         else:
-            # Первый запуск - получаем все проекты
+            # Первый запуск или полная сверка - получаем все проекты
             if verbose:
-                print("🔍 Первый запуск, получаем все проекты")
+                if last_checked:
+                    print("🔍 Полная сверка каталога проектов")
+                else:
+                    print("🔍 Первый запуск, получаем все проекты")
             
-            projects = await self.api.get_projects(
+            pages = self.api.iter_projects(
                 **self.config.get_project_filter(),
-                fields=[
-                    "id",
-                    "name",
-                    "name_with_namespace",
-                    "path_with_namespace", 
-                    "last_activity_at",
-                ],
+                fields=fields,
             )
-            
+
+        # В режиме ленты события всех проектов приходят одним списком,
+        # а запросы по проектам остаются только для CI/CD
+        events_by_project = None
+        feed_event_id = None
+        if self._use_events_feed():
+            events_by_project, feed_event_id = await self._fetch_events_feed(
+                last_checked, verbose
+            )
+
+        if self.ci_fetcher:
+            self.ci_fetcher.reset()
+
+        listed_ids: List[int] = []
+        scheduled_ids: Set[int] = set()
+        # Проекты проверяются пулом обработчиков по мере получения страниц;
+        # если список не получен целиком, начатые проверки отменяются
+        pool = WorkerPool(
+            lambda item: self._check_and_schedule(item, verbose),
+            **self.config.get_worker_options(),
+        )
+        # Без даты последней проверки все проекты проверяются впервые,
+        # и попадание в список еще не означает активности
+        woken = last_checked is not None
+        due_ids: List[int] = []
+        async with pool:
+            async for page in pages:
+                listed_ids.extend(project["id"] for project in page)
+                self.cache.update_catalogue(page)
+                projects = await self._filter_active_projects(page, last_checked)
+                scheduled_ids.update(project["id"] for project in projects)
+                await self._submit_project_checks(
+                    pool, projects, events_by_project, last_checked, woken
+                )
+            if events_by_project is not None:
+                extra = await self._get_feed_extra_projects(scheduled_ids, events_by_project)
+                scheduled_ids.update(project["id"] for project in extra)
+                await self._submit_project_checks(
+                    pool, extra, events_by_project, last_checked
+                )
+            if self.scheduler is not None:
+                due = self._get_due_projects(scheduled_ids)
+                due_ids = [project["id"] for project in due]
+                scheduled_ids.update(due_ids)
+                await self._submit_project_checks(
+                    pool, due, events_by_project, last_checked, woken=False
+                )
+
+            if full_refresh:
+                self.cache.prune_catalogue(listed_ids, datetime.now(timezone.utc).isoformat())
+
             if verbose:
-                print(f"📊 Найдено {len(projects)} проектов для первоначальной проверки")
+                if full_refresh:
+                    print(f"📊 Найдено {len(listed_ids)} проектов в каталоге")
+                else:
+                    print(f"📊 Найдено {len(listed_ids)} активных проектов (серверная фильтрация)")
+                if last_checked:
+                    print(f"✅ Отфильтровано {len(scheduled_ids)} проектов для проверки событий")
+                if self.scheduler is not None:
+                    state = self.scheduler.get_state()
+                    print(
+                        f"🗓  По расписанию проверено {len(due_ids)} проектов, "
+                        f"в расписании {state['scheduled']}, из них горячих {state['hot']}"
+                    )
+                if self.ci_fetcher:
+                    print(f"🧩 Pipelines загружены GraphQL запросами: {self.ci_fetcher.requests}")
+
+        for (project, *_), error in pool.errors:
+            if self.scheduler is not None:
+                self.scheduler.retry(project["id"])
+            if isinstance(error, asyncio.TimeoutError):
+                project_name = project.get("name_with_namespace", project.get("name"))
+                print(
+                    f"⏱️  Проверка проекта {project_name} не завершилась "
+                    f"за {pool.timeout:.0f}с и прервана"
+                )
+        failed = pool.failed
+
+        self._end_cache_cycle(verbose)
+        if verbose:
+            self._print_api_metrics()
+        if failed:
+            # Данные этих проектов не получены: не сдвигаем дату последней проверки,
+            # чтобы забрать их в следующем цикле
+            print(
+                f"⚠️  Не удалось получить данные {failed} проектов, "
+                f"они будут проверены в следующем цикле"
+            )
+        else:
+            await self.cache.set_last_checked_async(datetime.now(timezone.utc).isoformat())
+            if feed_event_id is not None:
+                await self.cache.set_feed_event_id_async(feed_event_id)
+        # Сохраняем все изменения цикла одной записью
+        await self.cache.flush_async()
 
-        # Обновляем кеш активности проектов и дополнительно фильтруем при необходимости
+    async def _filter_active_projects(
+        self, projects: List[Dict[str, Any]], last_checked: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Обновить кеш активности проектов и оставить проекты с активностью после last_checked"""
         filtered_projects = []
         for project in projects:
             project_id = project["id"]
@@ -94,130 +223,331 @@ class AsyncGitLabWatcher(BaseWatcher):
             else:
                 # Если нет даты последней проверки или активности, включаем проект
                 filtered_projects.append(project)
+        return filtered_projects
 
-        # Обновляем список проектов для проверки
-        projects = filtered_projects
-        
-        if verbose and last_checked:
-            print(f"✅ Отфильтровано {len(projects)} проектов для проверки событий")
+    async def _submit_project_checks(
+        self,
+        pool: WorkerPool,
+        projects: List[Dict[str, Any]],
+        events_by_project: Optional[Dict[int, List[Dict[str, Any]]]],
+        last_checked: Optional[str],
+        woken: bool = True,
+    ):
+        """
+        Поставить проверку проектов в очередь пула обработчиков.
 
-        # Создаем задачи для параллельной проверки проектов
-        tasks = []
+        События проекта из расписания отбираются с начала его последней
+        успешной проверки. woken — проекты попали в проверку из-за новой
+        активности.
+        """
+        since_by_project = {}
         for project in projects:
-            task = asyncio.create_task(self._check_project_events(project, verbose))
-            tasks.append(task)
+            checked_at = (
+                self.scheduler.get_checked_at(project["id"])
+                if self.scheduler is not None
+                else None
+            )
+            since_by_project[project["id"]] = checked_at or last_checked
+        if self.ci_fetcher and projects:
+            await self.ci_fetcher.prefetch(
+                projects, updated_after=self._oldest_timestamp(since_by_project.values())
+            )
 
-        # Ждем завершения всех задач
-        await asyncio.gather(*tasks, return_exceptions=True)
+        for project in projects:
+            project_events = (
+                events_by_project.get(project["id"], [])
+                if events_by_project is not None
+                else None
+            )
+            await pool.submit(
+                (project, project_events, since_by_project[project["id"]], woken)
+            )
 
-        await self.cache.set_last_checked_async(datetime.now(timezone.utc).isoformat())
+    async def _check_and_schedule(
+        self,
+        item: Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]], Optional[str], bool],
+        verbose: bool = False,
+    ):
+        """Проверить проект из очереди пула и запланировать его следующую проверку"""
+        project, events, since, woken = item
+        started = datetime.now(timezone.utc).isoformat()
+        active = await self._check_project_events(project, verbose, events, since=since)
+        if self.scheduler is not None:
+            self.scheduler.record(project["id"], woken or active, started)
+
+    def _get_due_projects(self, known_ids: Set[int]) -> List[Dict[str, Any]]:
+        """Получить проекты, время проверки которых наступило по расписанию"""
+        due = []
+        for project_id in self.scheduler.pop_due():
+            if project_id in known_ids:
+                # Проект уже проверяется в этом цикле
+                continue
+            project = self._project_from_catalogue(project_id)
+            if project:
+                due.append(project)
+            else:
+                # Проект удален из каталога при полной сверке
+                self.scheduler.forget(project_id)
+        return due
+
+    @staticmethod
+    def _oldest_timestamp(timestamps) -> Optional[str]:
+        """Самая ранняя из дат ISO 8601 (None, если дат нет)"""
+        values = [value for value in timestamps if value]
+        if not values:
+            return None
+        return min(values, key=lambda value: datetime.fromisoformat(value.replace("Z", "+00:00")))
+
+    async def _fetch_events_feed(
+        self, last_checked: Optional[str], verbose: bool = False
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], Optional[int]]:
+        """
+        Получить новые события ленты пользователя, разложенные по проектам.
+
+        Returns:
+            Кортеж (события по ID проекта, ID самого нового события ленты)
+        """
+        since_id = self.cache.get_feed_event_id()
+        if since_id is None:
+            events = await self.api.get_user_events(after=self._get_feed_after(last_checked))
+        else:
+            events = await self.api.get_user_events(since_id=since_id)
+
+        if verbose:
+            print(f"📰 Лента событий пользователя: получено {len(events)}")
+
+        newest_id = max((event.get("id", 0) for event in events), default=None)
+        return self._group_events_by_project(events), newest_id or since_id
+
+    async def _get_feed_extra_projects(
+        self,
+        known_ids: Set[int],
+        events_by_project: Dict[int, List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Получить проекты, события которых есть в ленте, но не в списке активных"""
+        missing = [project_id for project_id in events_by_project if project_id not in known_ids]
+        extra = []
+        unknown = []
+        for project_id in missing:
+            project = self._project_from_catalogue(project_id)
+            if project:
+                extra.append(project)
+            else:
+                unknown.append(project_id)
+        if unknown:
+            fetched = await asyncio.gather(*(self.api.get_project(pid) for pid in unknown))
+            fetched = [project for project in fetched if project]
+            self.cache.update_catalogue(fetched)
+            extra.extend(fetched)
+        return extra
 
     async def _check_project_events(
-        self, project: Dict[str, Any], verbose: bool = False
-    ):
-        """Проверить события конкретного проекта"""
-        async with self._semaphore:  # Ограничиваем одновременные запросы
-            project_id = project["id"]
-            project_name = project.get(
-                "name_with_namespace", project.get("name", f"Проект {project_id}")
-            )
+        self,
+        project: Dict[str, Any],
+        verbose: bool = False,
+        events: Optional[List[Dict[str, Any]]] = None,
+        since: Optional[str] = None,
+    ) -> bool:
+        """
+        Проверить события конкретного проекта.
+
+        Args:
+            project: Проект
+            verbose: Выводить подробную информацию
+            events: События проекта из ленты пользователя; если не заданы,
+                они запрашиваются у API проекта
+            since: Дата, после которой отбираются события (по умолчанию
+                дата последней проверки)
+
+        Returns:
+            True, если найдены новые события или незавершенные pipelines,
+            jobs или deployments
+        """
+        project_id = project["id"]
+        project_name = project.get(
+            "name_with_namespace", project.get("name", f"Проект {project_id}")
+        )
 
+        if verbose:
+            print(f"  Проверка проекта: {project_name}")
+
+        last_event_id = self.cache.get_last_event_id(project_id)
+        last_checked = since or self.cache.get_last_checked()
+
+        try:
             if verbose:
-                print(f"  Проверка проекта: {project_name}")
+                if events is not None:
+                    print(f"    Событий из ленты пользователя: {len(events)}")
+                elif last_event_id is None:
+                    last_checked_dt = datetime.fromisoformat(
+                        last_checked.replace("Z", "+00:00")
+                    ).strftime("%Y-%m-%d %H:%M:%S")
+                    print(f"    Первый запуск, проверка событий с {last_checked_dt}")
 
-            last_event_id = self.cache.get_last_event_id(project_id)
-            last_checked = self.cache.get_last_checked()
+            # Фильтруем события по дате последней проверки
+            last_checked_dt = datetime.fromisoformat(
+                last_checked.replace("Z", "+00:00")
+            )
+            received = 0
+            new_events = 0
+            skipped_old_events = 0
+            latest_event_id = None
 
-            try:
-                if last_event_id is None:
-                    # Всегда используем дату последней проверки как фильтр
-                    events = await self.api.get_project_events(
-                        project_id, after=last_checked
-                    )
-                    if verbose:
-                        last_checked_dt = datetime.fromisoformat(
-                            last_checked.replace("Z", "+00:00")
-                        ).strftime("%Y-%m-%d %H:%M:%S")
-                        print(f"    Первый запуск, проверка событий с {last_checked_dt}")
-                else:
-                    events = await self.api.get_project_events(project_id)
-                    if verbose:
-                        print(
-                            f"    Проверка всех событий (последний известный ID: {last_event_id})"
-                        )
+            # События обрабатываются по мере получения страниц
+            async for page in self._iter_event_pages(
+                project_id, events, last_event_id, last_checked
+            ):
+                received += len(page)
+                filtered_events, skipped = self._filter_new_events(
+                    page, last_event_id, last_checked_dt
+                )
+                skipped_old_events += skipped
+                if not filtered_events:
+                    continue
+                latest_event_id = max(
+                    latest_event_id or 0,
+                    max(event.get("id", 0) for event in filtered_events),
+                )
 
-                # Фильтруем события по дате последней проверки
-                last_checked_dt = datetime.fromisoformat(
-                    last_checked.replace("Z", "+00:00")
+                # События, уведомление о которых уже отправлено до обрыва
+                # листания в прошлом цикле, есть в индексе событий
+                filtered_events = [
+                    event for event in filtered_events
+                    if self._is_new_event(event, project_id)
+                ]
+                if not filtered_events:
+                    continue
+                new_events += len(filtered_events)
+
+                await self._process_events_in_order(
+                    sorted(filtered_events, key=lambda x: x.get("id", 0)),
+                    project_name,
+                    project_id,
                 )
-                filtered_events = []
-                skipped_old_events = 0
 
-                for event in events:
-                    event_id = event.get("id")
-                    created_at = event.get("created_at", "")
+            if verbose and events is None and last_event_id is not None:
+                print(
+                    f"    Проверка событий после ID {last_event_id}: получено {received}"
+                )
 
-                    if created_at:
-                        try:
-                            event_dt = datetime.fromisoformat(
-                                created_at.replace("Z", "+00:00")
-                            )
-                            if event_dt > last_checked_dt:
-                                if event_id and (
-                                    last_event_id is None or event_id > last_event_id
-                                ):
-                                    filtered_events.append(event)
-                            else:
-                                skipped_old_events += 1
-                        except (ValueError, TypeError):
-                            # Если не удалось распарсить дату, включаем событие
-                            if event_id and (
-                                last_event_id is None or event_id > last_event_id
-                            ):
-                                filtered_events.append(event)
-                    else:
-                        # Если нет даты, включаем событие
-                        if event_id and (
-                            last_event_id is None or event_id > last_event_id
-                        ):
-                            filtered_events.append(event)
+            if verbose and skipped_old_events > 0:
+                print(
+                    f"    Пропущено {skipped_old_events} старых событий (до последней проверки)"
+                )
 
-                if verbose and skipped_old_events > 0:
-                    print(
-                        f"    Пропущено {skipped_old_events} старых событий (до последней проверки)"
-                    )
+            if latest_event_id is not None:
+                if verbose:
+                    print(f"    Найдено {new_events} новых событий")
+                # Все страницы обработаны: водяной знак сдвигается только теперь,
+                # иначе прерванное листание пропустило бы более старые страницы
+                await self.cache.set_last_event_id_async(
+                    project_id, latest_event_id
+                )
+            else:
+                if verbose:
+                    print(f"    Нет новых событий")
 
-                if filtered_events:
-                    if verbose:
-                        print(f"    Найдено {len(filtered_events)} новых событий")
+            # Проверяем CI/CD события параллельно
+            ci_results = await asyncio.gather(
+                self._check_pipeline_events(project, verbose, last_checked_dt),
+                self._check_job_events(project, verbose, last_checked_dt),
+                self._check_deployment_events(project, verbose, last_checked_dt),
+                return_exceptions=True,
+            )
+            for result in ci_results:
+                if isinstance(result, BaseException):
+                    raise result
+            return new_events > 0 or any(ci_results)
 
-                    # Обрабатываем события параллельно
-                    tasks = []
-                    for event in sorted(filtered_events, key=lambda x: x.get("id", 0)):
-                        task = asyncio.create_task(
-                            self._process_event_async(event, project_name, project_id)
-                        )
-                        tasks.append(task)
+        except APIRequestError as e:
+            print(f"Ошибка при проверке проекта {project_name}: {e}")
+            raise
+        except Exception as e:
+            print(f"Ошибка при проверке проекта {project_name}: {e}")
+            return False
 
-                    await asyncio.gather(*tasks, return_exceptions=True)
+    async def _iter_event_pages(
+        self,
+        project_id: int,
+        events: Optional[List[Dict[str, Any]]],
+        last_event_id: Optional[int],
+        last_checked: str,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Получать события проекта страницами: из ленты пользователя или у API проекта"""
+        if events is not None:
+            yield events
+        elif last_event_id is None:
+            # Всегда используем дату последней проверки как фильтр
+            async for page in self.api.iter_project_events(project_id, after=last_checked):
+                yield page
+        else:
+            async for page in self.api.iter_project_events(project_id, since_id=last_event_id):
+                yield page
 
-                    latest_event_id = max(
-                        event.get("id", 0) for event in filtered_events
-                    )
-                    await self.cache.set_last_event_id_async(
-                        project_id, latest_event_id
+    @staticmethod
+    def _filter_new_events(
+        events: List[Dict[str, Any]],
+        last_event_id: Optional[int],
+        last_checked_dt: datetime,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Оставить события новее последней проверки и последнего обработанного ID.
+
+        Returns:
+            Кортеж (новые события, число пропущенных старых событий)
+        """
+        filtered_events = []
+        skipped_old_events = 0
+
+        for event in events:
+            event_id = event.get("id")
+            created_at = event.get("created_at", "")
+
+            if created_at:
+                try:
+                    event_dt = datetime.fromisoformat(
+                        created_at.replace("Z", "+00:00")
                     )
-                else:
-                    if verbose:
-                        print(f"    Нет новых событий")
+                    if event_dt > last_checked_dt:
+                        if event_id and (
+                            last_event_id is None or event_id > last_event_id
+                        ):
+                            filtered_events.append(event)
+                    else:
+                        skipped_old_events += 1
+                except (ValueError, TypeError):
+                    # Если не удалось распарсить дату, включаем событие
+                    if event_id and (
+                        last_event_id is None or event_id > last_event_id
+                    ):
+                        filtered_events.append(event)
+            else:
+                # Если нет даты, включаем событие
+                if event_id and (
+                    last_event_id is None or event_id > last_event_id
+                ):
+                    filtered_events.append(event)
+
+        return filtered_events, skipped_old_events
 
-                # Проверяем CI/CD события отдельно
-                await self._check_pipeline_events(project, verbose, last_checked_dt)
-                await self._check_job_events(project, verbose, last_checked_dt)
-                await self._check_deployment_events(project, verbose, last_checked_dt)
+    async def _process_events_in_order(
+        self, events: List[Dict[str, Any]], project_name: str, project_id: int
+    ):
+        """
+        Обработать события проекта по порядку.
 
+        Проект уже проверяется в обработчике пула, поэтому отдельная задача
+        на каждое событие не создается. Ошибка одного события не мешает
+        обработке остальных. Каждое событие сразу попадает в индекс
+        событий: если следующая страница не будет получена, водяной знак
+        не сдвинется, но повторного уведомления в следующем цикле не будет.
+        """
+        for event in events:
+            try:
+                await self._process_event_async(event, project_name, project_id)
             except Exception as e:
-                print(f"Ошибка при проверке проекта {project_name}: {e}")
+                print(f"Ошибка обработки события {event.get('id')}: {e}")
+            self._save_event_to_cache(event, project_id)
 
     async def _process_event_async(
         self, event: Dict[str, Any], project_name: str, project_id: int
@@ -256,30 +586,28 @@ class AsyncGitLabWatcher(BaseWatcher):
             icon_url=icon_url,
         )
 
+    @singleflight()
     async def _get_project_path_async(self, project_id: int) -> Optional[str]:
-        """Асинхронно получить путь проекта по его ID"""
-        # Проверяем кэш в памяти
-        if project_id in self._project_paths_cache:
-            return self._project_paths_cache[project_id]
+        """
+        Асинхронно получить путь проекта по его ID.
 
-        # Проверяем кэш в файле
-        cached_path = self.cache.get_project_path(project_id)
+        События проекта обрабатываются одновременно, поэтому одновременные
+        вызовы для одного проекта объединяются в один запрос к API.
+        """
+        # Путь берется из каталога проектов без запросов к API
+        cached_path = self._get_project_path(project_id)
         if cached_path:
-            self._project_paths_cache[project_id] = cached_path
             return cached_path
 
         try:
-            # Получаем данные проекта
+            # Проекта нет в каталоге: получаем его данные
             projects = await self.api.get_projects(project_id=project_id)
             if projects:
                 project = projects[0]
                 path_with_namespace = project.get("path_with_namespace")
                 if path_with_namespace:
-                    # Сохраняем в оба кэша
-                    self._project_paths_cache[project_id] = path_with_namespace
-                    await self.cache.set_project_path_async(
-                        project_id, path_with_namespace
-                    )
+                    self.cache.update_catalogue([project])
+                    self._project_paths[project_id] = path_with_namespace
                     return path_with_namespace
         except Exception as e:
             print(f"Ошибка получения пути проекта {project_id}: {e}")
@@ -364,7 +692,11 @@ class AsyncGitLabWatcher(BaseWatcher):
             print(
                 f"[{datetime.now().isoformat()}] Запуск GitLab watcher (однократный запуск)..."
             )
-            await self.check_projects(verbose)
+            try:
+                await self.check_projects(verbose)
+            finally:
+                await self.cache.flush_async()
+                self.cache.close()
             print(f"[{datetime.now().isoformat()}] Проверка завершена")
             return True
 
@@ -378,15 +710,93 @@ class AsyncGitLabWatcher(BaseWatcher):
                 f"[{datetime.now().isoformat()}] Запуск GitLab watcher (режим демона)..."
             )
             print(f"Интервал проверки: {self.config.check_interval} секунд")
+            if self.scheduler is not None:
+                print(
+                    f"Проекты с недавней активностью проверяются по расписанию, "
+                    f"остывая до интервала {self.scheduler.max_interval:.0f} секунд"
+                )
             print("Нажмите Ctrl+C для остановки")
 
+            flush_task = asyncio.create_task(self._flush_cache_periodically())
             try:
                 while True:
-                    await self.check_projects(verbose)
-                    await asyncio.sleep(self.config.check_interval)
+                    try:
+                        await self.check_projects(verbose)
+                    except APIRequestError as e:
+                        print(f"⚠️  Цикл проверки пропущен: {e}")
+                    await asyncio.sleep(self._next_cycle_delay())
             except KeyboardInterrupt:
                 print(f"\n[{datetime.now().isoformat()}] Остановка GitLab watcher...")
                 return True
+            finally:
+                flush_task.cancel()
+                await self.cache.flush_async()
+                self.cache.close()
+
+    def _next_cycle_delay(self) -> float:
+        """
+        Секунд до следующего цикла.
+
+        Список проектов запрашивается раз в CHECK_INTERVAL секунд. Отдельный
+        цикл раньше нужен, только если проверка по расписанию наступает
+        заметно раньше: проверки в пределах допуска расписания выполняются
+        в обычном цикле.
+        """
+        delay = float(self.config.check_interval)
+        if self.scheduler is not None:
+            due_in = self.scheduler.seconds_until_due()
+            if due_in is not None and due_in < delay - self.scheduler.tolerance:
+                delay = max(1.0, due_in)
+        return delay
+
+    def _print_api_metrics(self):
+        """Вывести состояние ограничения частоты, параллельности, повторов, выключателей и кеша ETag"""
+        metrics = self.api.get_metrics()
+        concurrency = metrics["concurrency"]
+        p95 = concurrency["p95"]
+        print(
+            f"🎚  Одновременных запросов: лимит {concurrency['limit']} "
+            f"({concurrency['min_limit']}–{concurrency['max_limit']})"
+            + (f", p95 {p95 * 1000:.0f} мс" if p95 is not None else "")
+            + f", повышений {concurrency['increases']}, снижений {concurrency['decreases']}"
+        )
+        rate_limit = metrics["rate_limit"]
+        if rate_limit["limit"] is not None:
+            reset_in = rate_limit["reset_in"]
+            print(
+                f"🚦 RateLimit: осталось {rate_limit['remaining']}/{rate_limit['limit']}"
+                + (f", сброс через {reset_in:.0f}с" if reset_in is not None else "")
+            )
+        if metrics["retries"]:
+            print(f"🔁 Повторов запросов после ошибок: {metrics['retries']}")
+        for host, breaker in metrics["circuit_breakers"].items():
+            if breaker["state"] != "closed" or breaker["rejected"]:
+                print(
+                    f"🔌 Выключатель {host}: {breaker['state']}, ошибок подряд "
+                    f"{breaker['failures']}, отклонено запросов {breaker['rejected']}"
+                )
+        if rate_limit["waits"] or rate_limit["throttled_responses"]:
+            print(
+                f"🚦 Ожиданий ограничителя: {rate_limit['waits']} "
+                f"({rate_limit['wait_time']:.1f}с), ответов 429: {rate_limit['throttled_responses']}"
+            )
+        http_cache = metrics["http_cache"]
+        if http_cache["hits"] or http_cache["misses"]:
+            print(
+                f"🗃  Кеш ETag: попаданий {http_cache['hits']}, промахов {http_cache['misses']}"
+            )
+        if metrics["singleflight"]["shared"]:
+            print(
+                f"🤝 Одинаковых одновременных запросов объединено: "
+                f"{metrics['singleflight']['shared']}"
+            )
+
+    async def _flush_cache_periodically(self):
+        """Периодически сохранять отложенные изменения кеша"""
+        while True:
+            await asyncio.sleep(self.cache.flush_interval or self.config.check_interval)
+            if self.cache.has_unsaved_changes():
+                await self.cache.flush_async()
 
     def reset_cache(self):
         """Сбросить кеш"""
@@ -395,8 +805,8 @@ class AsyncGitLabWatcher(BaseWatcher):
 
     async def _check_pipeline_events(
         self, project: Dict[str, Any], verbose: bool = False, last_checked_dt: Optional[datetime] = None
-    ):
-        """Отдельная проверка pipeline событий"""
+    ) -> bool:
+        """Отдельная проверка pipeline событий; True, если есть незавершенные pipelines"""
         from .utils.event_utils import pipeline_to_event, is_new_pipeline_event, save_pipeline_event_to_cache
         
         project_id = project["id"]
@@ -405,13 +815,19 @@ class AsyncGitLabWatcher(BaseWatcher):
         try:
             # Получаем pipelines, обновленные после последней проверки
             updated_after = last_checked_dt.isoformat() if last_checked_dt else None
-            pipelines = await self.api.get_project_pipelines(project_id, updated_after=updated_after)
+            watermark = self.cache.get_endpoint_watermark(project_id, "pipelines") or updated_after
+            pipelines = await (self.ci_fetcher or self.api).get_project_pipelines(
+                project_id, updated_after=updated_after, watermark=watermark
+            )
             
+            if self.scheduler is not None:
+                self.scheduler.track_ci(project_id, "pipeline", pipelines)
+
             if verbose:
                 print(f"    Найдено pipelines: {len(pipelines)}")
             
             if not pipelines:
-                return
+                return False
             
             # Фильтруем и обрабатываем pipelines
             new_pipeline_events = []
@@ -440,14 +856,11 @@ class AsyncGitLabWatcher(BaseWatcher):
                     print(f"    Найдено {len(new_pipeline_events)} новых pipeline событий")
                 
                 # Обрабатываем pipeline события
-                tasks = []
-                for event in sorted(new_pipeline_events, key=lambda x: x.get("created_at", "")):
-                    task = asyncio.create_task(
-                        self._process_event_async(event, project_name, project_id)
-                    )
-                    tasks.append(task)
-                
-                await asyncio.gather(*tasks, return_exceptions=True)
+                await self._process_events_in_order(
+                    sorted(new_pipeline_events, key=lambda x: x.get("created_at", "")),
+                    project_name,
+                    project_id,
+                )
                 
                 # Сохраняем pipeline события в кеш
                 for pipeline in pipelines:
@@ -455,17 +868,24 @@ class AsyncGitLabWatcher(BaseWatcher):
                 
                 if verbose:
                     print(f"    Pipeline события обработаны и сохранены в кеш")
+
+            self._update_endpoint_watermark(project_id, "pipelines", pipelines)
+            return has_active_ci(pipelines)
             
+        except APIRequestError:
+            # Сообщаем проекту, что данные не получены
+            raise
         except Exception as e:
             if verbose:
                 print(f"    Ошибка при проверке pipelines: {e}")
             else:
                 print(f"Ошибка при проверке pipelines для проекта {project_name}: {e}")
+            return False
 
     async def _check_job_events(
         self, project: Dict[str, Any], verbose: bool = False, last_checked_dt: Optional[datetime] = None
-    ):
-        """Отдельная проверка job событий"""
+    ) -> bool:
+        """Отдельная проверка job событий; True, если есть незавершенные jobs"""
         from .utils.event_utils import job_to_event, is_new_job_event, save_job_event_to_cache
         
         project_id = project["id"]
@@ -474,13 +894,19 @@ class AsyncGitLabWatcher(BaseWatcher):
         try:
             # Получаем jobs, обновленные после последней проверки
             updated_after = last_checked_dt.isoformat() if last_checked_dt else None
-            jobs = await self.api.get_project_jobs(project_id, updated_after=updated_after)
+            watermark = self.cache.get_endpoint_watermark(project_id, "jobs") or updated_after
+            jobs = await (self.ci_fetcher or self.api).get_project_jobs(
+                project_id, updated_after=updated_after, watermark=watermark
+            )
             
+            if self.scheduler is not None:
+                self.scheduler.track_ci(project_id, "job", jobs)
+
             if verbose:
                 print(f"    Найдено jobs: {len(jobs)}")
             
             if not jobs:
-                return
+                return False
             
             # Фильтруем и обрабатываем jobs
             new_job_events = []
@@ -509,15 +935,11 @@ class AsyncGitLabWatcher(BaseWatcher):
                     print(f"    Найдено {len(new_job_events)} новых job событий")
                 
                 # Обрабатываем job события
-                tasks = []
-                for event in sorted(new_job_events, key=lambda x: x.get("created_at", "")):
-                    task = asyncio.create_task(
-                        self._process_event_async(event, project_name, project_id, verbose)
-                    )
-                    tasks.append(task)
-                
-                if tasks:
-                    await asyncio.gather(*tasks)
+                await self._process_events_in_order(
+                    sorted(new_job_events, key=lambda x: x.get("created_at", "")),
+                    project_name,
+                    project_id,
+                )
                 
                 # Сохраняем job события в кеш
                 for job in jobs:
@@ -525,17 +947,24 @@ class AsyncGitLabWatcher(BaseWatcher):
                 
                 if verbose:
                     print(f"    Job события обработаны и сохранены в кеш")
+
+            self._update_endpoint_watermark(project_id, "jobs", jobs)
+            return has_active_ci(jobs)
             
+        except APIRequestError:
+            # Сообщаем проекту, что данные не получены
+            raise
         except Exception as e:
             if verbose:
                 print(f"    Ошибка при проверке jobs: {e}")
             else:
                 print(f"Ошибка при проверке jobs для проекта {project_name}: {e}")
+            return False
 
     async def _check_deployment_events(
         self, project: Dict[str, Any], verbose: bool = False, last_checked_dt: Optional[datetime] = None
-    ):
-        """Отдельная проверка deployment событий"""
+    ) -> bool:
+        """Отдельная проверка deployment событий; True, если есть незавершенные deployments"""
         from .utils.event_utils import deployment_to_event, is_new_deployment_event, save_deployment_event_to_cache
         
         project_id = project["id"]
@@ -544,13 +973,19 @@ class AsyncGitLabWatcher(BaseWatcher):
         try:
             # Получаем deployments, обновленные после последней проверки
             updated_after = last_checked_dt.isoformat() if last_checked_dt else None
-            deployments = await self.api.get_project_deployments(project_id, updated_after=updated_after)
+            watermark = self.cache.get_endpoint_watermark(project_id, "deployments") or updated_after
+            deployments = await self.api.get_project_deployments(
+                project_id, updated_after=updated_after, watermark=watermark
+            )
             
+            if self.scheduler is not None:
+                self.scheduler.track_ci(project_id, "deployment", deployments)
+
             if verbose:
                 print(f"    Найдено deployments: {len(deployments)}")
             
             if not deployments:
-                return
+                return False
             
             # Фильтруем и обрабатываем deployments
             new_deployment_events = []
@@ -579,15 +1014,11 @@ class AsyncGitLabWatcher(BaseWatcher):
                     print(f"    Найдено {len(new_deployment_events)} новых deployment событий")
                 
                 # Обрабатываем deployment события
-                tasks = []
-                for event in sorted(new_deployment_events, key=lambda x: x.get("created_at", "")):
-                    task = asyncio.create_task(
-                        self._process_event_async(event, project_name, project_id, verbose)
-                    )
-                    tasks.append(task)
-                
-                if tasks:
-                    await asyncio.gather(*tasks)
+                await self._process_events_in_order(
+                    sorted(new_deployment_events, key=lambda x: x.get("created_at", "")),
+                    project_name,
+                    project_id,
+                )
                 
                 # Сохраняем deployment события в кеш
                 for deployment in deployments:
@@ -595,12 +1026,19 @@ class AsyncGitLabWatcher(BaseWatcher):
                 
                 if verbose:
                     print(f"    Deployment события обработаны и сохранены в кеш")
+
+            self._update_endpoint_watermark(project_id, "deployments", deployments)
+            return has_active_ci(deployments)
             
+        except APIRequestError:
+            # Сообщаем проекту, что данные не получены
+            raise
         except Exception as e:
             if verbose:
                 print(f"    Ошибка при проверке deployments: {e}")
             else:
                 print(f"Ошибка при проверке deployments для проекта {project_name}: {e}")
+            return False
 
     def test_notification(self):
         """Отправить тестовое уведомление"""
@@ -88,6 +88,7 @@ class BaseGitLabAPI(ABC):
         after: Optional[str] = None,
         sort: str = "desc",
         action: Optional[str] = None,
+        since_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Получить события проекта.
@@ -97,15 +98,40 @@ class BaseGitLabAPI(ABC):
             after: Фильтр по дате (события после этой даты)
             sort: Направление сортировки ('asc' или 'desc')
             action: Фильтр по типу действия
+            since_id: Вернуть только события с ID больше указанного,
+                прекратив листание на первом известном событии
 
         Returns:
             Список событий проекта
         """
         pass
 
+    @abstractmethod
+    def get_user_events(
+        self,
+        after: Optional[str] = None,
+        since_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Получить ленту событий всех проектов пользователя (GET /events?scope=all).
+
+        Args:
+            after: Фильтр по дате (события после этой даты, YYYY-MM-DD)
+            since_id: Вернуть только события с ID больше указанного,
+                прекратив листание на первом известном событии
+
+        Returns:
+            Список событий от новых к старым, у каждого есть project_id
+        """
+        pass
+
     @abstractmethod
     def get_project_merge_requests(
-        self, project_id: int, state: str = "opened", updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        state: str = "opened",
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Получить merge requests проекта.
@@ -114,6 +140,7 @@ class BaseGitLabAPI(ABC):
             project_id: ID проекта
             state: Состояние MR ('opened', 'closed', 'merged', 'all')
             updated_after: Фильтр по дате обновления
+            watermark: Дата, на которой прекращается листание списка
 
         Returns:
             Список merge requests
@@ -122,7 +149,11 @@ class BaseGitLabAPI(ABC):
 
     @abstractmethod
     def get_project_issues(
-        self, project_id: int, state: str = "opened", updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        state: str = "opened",
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Получить задачи проекта.
@@ -131,6 +162,7 @@ class BaseGitLabAPI(ABC):
             project_id: ID проекта
             state: Состояние задачи ('opened', 'closed', 'all')
             updated_after: Фильтр по дате обновления
+            watermark: Дата, на которой прекращается листание списка
 
         Returns:
             Список задач
@@ -139,7 +171,10 @@ class BaseGitLabAPI(ABC):
 
     @abstractmethod
     def get_project_pipelines(
-        self, project_id: int, updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Получить pipelines проекта.
@@ -147,6 +182,7 @@ class BaseGitLabAPI(ABC):
         Args:
             project_id: ID проекта
             updated_after: Фильтр по дате обновления
+            watermark: Дата, на которой прекращается листание списка
 
         Returns:
             Список pipelines
@@ -154,7 +190,10 @@ class BaseGitLabAPI(ABC):
         pass
 
     def get_project_jobs(
-        self, project_id: int, updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Получить jobs проекта.
@@ -162,6 +201,7 @@ class BaseGitLabAPI(ABC):
         Args:
             project_id: ID проекта
             updated_after: Фильтр по дате обновления
+            watermark: Дата, на которой прекращается листание списка
 
         Returns:
             Список jobs
@@ -169,7 +209,10 @@ class BaseGitLabAPI(ABC):
         pass
 
     def get_project_deployments(
-        self, project_id: int, updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Получить deployments проекта.
@@ -177,6 +220,7 @@ class BaseGitLabAPI(ABC):
         Args:
             project_id: ID проекта
             updated_after: Фильтр по дате обновления
+            watermark: Дата, на которой прекращается листание списка
 
         Returns:
             Список deployments
@@ -1,11 +1,13 @@
 """Базовый класс для синхронных и асинхронных Watcher'ов."""
 
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from typing import Any, Dict, List, Optional
 from .config import Config
-from .cache import Cache
+from .cache import create_cache
 from .utils.url_utils import get_event_url
 from .utils.date_utils import parse_gitlab_date
+from .utils.pagination import ENDPOINT_ORDER, newest_value
 
 
 class BaseWatcher(ABC):
@@ -19,7 +21,7 @@ class BaseWatcher(ABC):
             config: Конфигурация приложения
         """
         self.config = config
-        self.cache = Cache(config.cache_file)
+        self.cache = create_cache(config.cache_file, **config.get_cache_options())
         self._project_paths = {}  # Кэш путей проектов в памяти
 
     def _get_project_path(self, project_id: int) -> str:
@@ -32,17 +34,42 @@ class BaseWatcher(ABC):
         Returns:
             Путь проекта в формате namespace/project
         """
-        # Проверяем кэш в памяти
-        if project_id in self._project_paths:
-            return self._project_paths[project_id]
-
-        # Проверяем кэш на диске
+        # Каталог проверяется первым: полная сверка находит переименованные
+        # и перенесенные проекты, и путь в памяти мог устареть
         cached_path = self.cache.get_project_path(project_id)
         if cached_path:
             self._project_paths[project_id] = cached_path
             return cached_path
 
-        return ""
+        return self._project_paths.get(project_id, "")
+
+    def _project_from_catalogue(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Получить проект из каталога в виде ответа API.
+
+        Returns:
+            Проект с полями id, path_with_namespace и name_with_namespace
+            или None, если проекта нет в каталоге
+        """
+        entry = self.cache.get_catalogue_project(project_id)
+        if not entry:
+            return None
+        return {
+            "id": project_id,
+            "path_with_namespace": entry.get("path"),
+            "name_with_namespace": entry.get("name"),
+            "last_activity_at": entry.get("last_activity_at"),
+        }
+
+    @staticmethod
+    def _is_active_since(project: Dict[str, Any], last_checked: str) -> bool:
+        """Проверить, была ли в проекте активность после last_checked"""
+        activity_dt = parse_gitlab_date(project.get("last_activity_at"))
+        last_checked_dt = parse_gitlab_date(last_checked)
+        if activity_dt is None or last_checked_dt is None:
+            # Если проблемы с датами, включаем проект
+            return True
+        return activity_dt > last_checked_dt
 
     def _cache_project_path(self, project_id: int, path: str):
         """
@@ -94,6 +121,7 @@ class BaseWatcher(ABC):
         # Проверяем кэш событий
         cached_events = self.cache.get_project_events(project_id)
         if cached_events and event_id in cached_events:
+            self.cache.touch_project_event(project_id, event_id)
             return False
 
         return True
@@ -110,6 +138,77 @@ class BaseWatcher(ABC):
         if event_id:
             self.cache.save_project_event(project_id, event_id)
 
+    def _update_endpoint_watermark(
+        self, project_id: int, endpoint: str, items: List[Dict[str, Any]]
+    ):
+        """
+        Сдвинуть водяной знак списка проекта на самый новый полученный объект.
+
+        Args:
+            project_id: ID проекта
+            endpoint: Имя списка ('pipelines', 'jobs', 'deployments', ...)
+            items: Объекты, полученные в этом цикле
+        """
+        _, field = ENDPOINT_ORDER[endpoint]
+        newest = newest_value(items, field)
+        if newest:
+            self.cache.set_endpoint_watermark(project_id, endpoint, newest)
+
+    def _use_events_feed(self) -> bool:
+        """Получать события одной лентой пользователя вместо запросов по проектам"""
+        return self.config.events_feed and not self.config.project_id
+
+    def _get_feed_after(self, last_checked: Optional[str]) -> Optional[str]:
+        """
+        Получить дату для параметра after ленты событий.
+
+        GitLab сравнивает after с датой без времени и не включает сам день,
+        поэтому берется предыдущий день; лишние события отсеются по дате
+        последней проверки.
+        """
+        last_checked_dt = parse_gitlab_date(last_checked) if last_checked else None
+        if last_checked_dt is None:
+            return None
+        return (last_checked_dt - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _group_events_by_project(
+        events: List[Dict[str, Any]]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Разложить события ленты пользователя по проектам"""
+        events_by_project: Dict[int, List[Dict[str, Any]]] = {}
+        for event in events:
+            project_id = event.get("project_id")
+            if project_id is not None:
+                events_by_project.setdefault(project_id, []).append(event)
+        return events_by_project
+
+    def _end_cache_cycle(self, verbose: bool = False):
+        """
+        Завершить цикл проверки для индексов дедупликации кеша.
+
+        Args:
+            verbose: Выводить подробную информацию
+        """
+        cycle_metrics = self.cache.end_cycle()
+        for kind, stats in sorted(cycle_metrics.items()):
+            if stats["live_evictions"]:
+                # Ключ вытеснен в том же цикле, в котором понадобился
+                print(
+                    f"⚠️  Индекс событий '{kind}' переполнен: вытеснено "
+                    f"{stats['live_evictions']} актуальных ключей, "
+                    f"увеличьте CACHE_EVENTS_CAPACITY_MAX"
+                )
+
+        if verbose:
+            for kind, stats in sorted(self.cache.get_dedup_metrics().items()):
+                if not stats["keys"] and not stats["evictions"]:
+                    continue
+                print(
+                    f"🗂  Индекс '{kind}': ключей {stats['keys']}/{stats['capacity']}, "
+                    f"вытеснено {stats['evictions']} (актуальных {stats['live_evictions']})"
+                )
+
     def _filter_events_by_date(
         self, events: List[Dict[str, Any]], last_check: Optional[str]
     ) -> List[Dict[str, Any]]:
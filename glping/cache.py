@@ -1,11 +1,20 @@
 import asyncio
 import json
 import os
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 import tempfile
 import platform
 
+from .event_index import (
+    EVENT_KINDS,
+    PROJECT_EVENTS_LIMIT,
+    PROJECT_EVENTS_LIMIT_MAX,
+    ProjectEventIndex,
+    encode_cache_value,
+)
+
 # Кроссплатформенный импорт fcntl
 try:
     import fcntl
@@ -18,15 +27,48 @@ except ImportError:
 class Cache:
     """Класс для управления кешем событий GitLab"""
 
-    def __init__(self, cache_file: str = "cache.json"):
-        """Инициализация кеша"""
-        # Если путь относительный, делаем его абсолютным относительно домашней директории
-        if not os.path.isabs(cache_file):
-            glping_dir = os.path.expanduser("~/glping")
-            os.makedirs(glping_dir, exist_ok=True)
-            self.cache_file = os.path.join(glping_dir, cache_file)
-        else:
-            self.cache_file = cache_file
+    def __init__(
+        self,
+        cache_file: str = "cache.json",
+        write_behind: bool = False,
+        flush_interval: float = 30.0,
+        max_dirty: int = 1000,
+        events_capacity: int = PROJECT_EVENTS_LIMIT,
+        events_capacity_max: int = PROJECT_EVENTS_LIMIT_MAX,
+        catalogue_refresh_interval: float = 24 * 3600,
+    ):
+        """
+        Инициализация кеша.
+
+        Args:
+            cache_file: Путь к файлу кеша
+            write_behind: Откладывать запись изменений до вызова flush()
+            flush_interval: Максимальное время (сек) хранения несохраненных изменений
+            max_dirty: Максимальное число несохраненных изменений
+            events_capacity: Минимальная емкость индекса событий одного типа
+            events_capacity_max: Максимальная емкость индекса событий одного типа
+            catalogue_refresh_interval: Период (сек) полной сверки каталога проектов
+        """
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.max_dirty = max_dirty
+        self.events_capacity = events_capacity
+        self.events_capacity_max = max(events_capacity_max, events_capacity)
+        self.catalogue_refresh_interval = catalogue_refresh_interval
+        # Номер цикла проверки и проекты, чьи индексы событий он затронул
+        self._cycle = 0
+        self._cycle_projects: Set[str] = set()
+        self.dedup_metrics: Dict[str, Dict[str, int]] = {
+            kind: {"evictions": 0, "live_evictions": 0} for kind in EVENT_KINDS
+        }
+        self.last_cycle_metrics: Dict[str, Dict[str, int]] = {}
+        self._dirty: Set[Tuple[str, str]] = set()
+        self._last_flush = time.monotonic()
+        # Очередь единственного фонового писателя для асинхронного режима
+        self._pending_changes: Set[Tuple[str, str]] = set()
+        self._pending_write: Optional[asyncio.Future] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self.cache_file = self._resolve_cache_path(cache_file)
         self.data: Dict[str, Any] = self._load_cache()
         self._migrate_old_cache_files()
         
@@ -43,11 +85,24 @@ class Cache:
         else:
             print("📂 Файл кеша не найден, будет создан новый")
 
+    def _resolve_cache_path(self, cache_file: str) -> str:
+        """Получить абсолютный путь к файлу кеша"""
+        # Если путь относительный, делаем его абсолютным относительно домашней директории
+        if not os.path.isabs(cache_file):
+            glping_dir = os.path.expanduser("~/glping")
+            os.makedirs(glping_dir, exist_ok=True)
+            return os.path.join(glping_dir, cache_file)
+        return cache_file
+
     def _load_cache(self) -> Dict[str, Any]:
         """Загрузка кеша из файла"""
-        if os.path.exists(self.cache_file):
+        return self._read_cache_file(self.cache_file)
+
+    def _read_cache_file(self, cache_file: str) -> Dict[str, Any]:
+        """Чтение JSON файла кеша с конвертацией старого формата"""
+        if os.path.exists(cache_file):
             try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
+                with open(cache_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
                     # Проверяем, что это новый формат кеша
                     if "metadata" in data and "projects" in data:
@@ -65,7 +120,7 @@ class Cache:
                             converted_data["metadata"]["last_checked"] = day_ago.isoformat()
                         return converted_data
             except (json.JSONDecodeError, IOError) as e:
-                print(f"⚠️  Ошибка при чтении кеша {self.cache_file}: {e}")
+                print(f"⚠️  Ошибка при чтении кеша {cache_file}: {e}")
                 print("🔄 Будет создан новый файл кеша")
         
         # Возвращаем структуру нового формата с датой 24 часа назад для первого запуска
@@ -138,6 +193,22 @@ class Cache:
 
     def _save_cache(self):
         """Сохранение кеша в файл с блокировкой для предотвращения состояний гонки"""
+        self._write_cache_file(self._dump_data())
+
+    def _dump_data(self) -> str:
+        """Сериализовать данные кеша в JSON"""
+        return json.dumps(self.data, indent=2, ensure_ascii=False, default=encode_cache_value)
+
+    def _write_cache_file(self, content: str) -> bool:
+        """
+        Атомарно записать сериализованный кеш в файл.
+
+        Args:
+            content: Содержимое файла кеша
+
+        Returns:
+            True если запись выполнена успешно
+        """
         try:
             # Атомарная запись через временный файл
             temp_file = None
@@ -152,7 +223,7 @@ class Cache:
                     # Блокируем файл на время записи (только на Unix системах)
                     if HAS_FCNTL:
                         fcntl.flock(f, fcntl.LOCK_EX)
-                    json.dump(self.data, f, indent=2, ensure_ascii=False)
+                    f.write(content)
                     f.flush()  # Принудительно записываем на диск
                     os.fsync(f.fileno())  # Синхронизация с файловой системой
                 
@@ -163,7 +234,7 @@ class Cache:
             except Exception:
                 # Если произошла ошибка, используем обычную запись
                 with open(self.cache_file, "w", encoding="utf-8") as f:
-                    json.dump(self.data, f, indent=2, ensure_ascii=False)
+                    f.write(content)
             finally:
                 # Удаляем временный файл если остался
                 if temp_file and os.path.exists(temp_file):
@@ -174,12 +245,202 @@ class Cache:
                         
         except IOError as e:
             print(f"Предупреждение: Не удалось сохранить кеш: {e}")
+            return False
+        return True
 
     async def _save_cache_async(self):
         """Асинхронное сохранение кеша"""
-        await asyncio.to_thread(self._save_cache)
+        await self._schedule_write_async(())
+
+    async def _schedule_write_async(self, changes: Iterable[Tuple[str, str]]):
+        """
+        Передать изменения фоновому писателю и дождаться их записи.
+
+        Запросы, поступившие до начала очередной записи, объединяются:
+        N одновременных вызовов приводят к одной записи на диск.
+
+        Args:
+            changes: Пары (раздел, ключ) измененных записей
+        """
+        await asyncio.shield(self._enqueue_write(changes))
+
+    def _enqueue_write(self, changes: Iterable[Tuple[str, str]]) -> asyncio.Future:
+        """
+        Передать изменения фоновому писателю, не дожидаясь записи.
+
+        Returns:
+            Future, завершающийся после записи изменений
+        """
+        self._pending_changes.update(changes)
+        if self._pending_write is None:
+            self._pending_write = asyncio.get_running_loop().create_future()
+        waiter = self._pending_write
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+        return waiter
+
+    async def _writer_loop(self):
+        """Фоновый писатель: снимок данных в цикле событий, запись в потоке"""
+        while self._pending_write is not None:
+            waiter = self._pending_write
+            changes = list(self._pending_changes)
+            self._pending_write = None
+            self._pending_changes.clear()
+            try:
+                # Снимок берется в цикле событий, пока другие корутины не могут
+                # изменять данные; в поток передается уже готовое содержимое
+                payload = self._prepare_write(changes)
+                await asyncio.to_thread(self._commit_write, payload)
+                self._after_write()
+            except Exception as e:
+                waiter.set_exception(e)
+            else:
+                waiter.set_result(None)
+
+    def _save_change(self, section: str, key: str):
+        """
+        Сохранить изменение одной записи кеша.
+
+        В режиме write-behind изменение только помечается как несохраненное
+        и записывается при следующем flush(). Запись выполняется досрочно,
+        если превышены flush_interval или max_dirty.
+
+        Внутри цикла событий запись не выполняется на месте, а передается
+        единственному фоновому писателю: файл не пишется в цикле событий,
+        и более старый снимок не может заменить более новый.
+
+        Args:
+            section: Раздел кеша (metadata, projects, project_activity, project_paths)
+            key: Ключ измененной записи внутри раздела
+        """
+        if self.write_behind:
+            self._dirty.add((section, key))
+            if not self._is_flush_due():
+                return
+            changes = self._take_dirty()
+        else:
+            changes = [(section, key)]
 
-    
+        if self._in_event_loop():
+            self._enqueue_write(changes).add_done_callback(self._report_write_error)
+        else:
+            self._write_changes(changes)
+
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Вызван ли метод из работающего цикла событий"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    @staticmethod
+    def _report_write_error(waiter: asyncio.Future):
+        """Сообщить об ошибке записи, результат которой никто не ждет"""
+        if not waiter.cancelled() and waiter.exception() is not None:
+            print(f"Предупреждение: Не удалось сохранить кеш: {waiter.exception()}")
+
+    async def _save_change_async(self, section: str, key: str):
+        """Асинхронно сохранить изменение одной записи кеша"""
+        if not self.write_behind:
+            await self._schedule_write_async([(section, key)])
+            return
+
+        self._dirty.add((section, key))
+        if self._is_flush_due():
+            await self.flush_async()
+
+    def _is_flush_due(self) -> bool:
+        """Проверить, исчерпан ли допустимый объем несохраненных изменений"""
+        if self.max_dirty and len(self._dirty) >= self.max_dirty:
+            return True
+        return time.monotonic() - self._last_flush >= self.flush_interval
+
+    def _take_dirty(self) -> List[Tuple[str, str]]:
+        """Забрать накопленные изменения для записи"""
+        changes = list(self._dirty)
+        self._dirty.clear()
+        self._last_flush = time.monotonic()
+        return changes
+
+    def _get_record(self, section: str, key: str) -> Any:
+        """Получить значение записи раздела кеша"""
+        records = self.data.get(section, {})
+        if section == "project_activity":
+            # Активность хранится в памяти по числовому ID проекта
+            return records.get(int(key), records.get(key))
+        return records.get(key)
+
+    def _set_record(self, section: str, key: str, value: Any):
+        """Установить значение записи раздела кеша"""
+        records = self.data.setdefault(section, {})
+        if section == "project_activity":
+            records.pop(key, None)
+            key = int(key)
+        if value is None:
+            records.pop(key, None)
+        else:
+            records[key] = value
+
+    def _write_changes(self, changes: Iterable[Tuple[str, str]]):
+        """
+        Записать изменения в хранилище.
+
+        Args:
+            changes: Пары (раздел, ключ) измененных записей
+        """
+        self._commit_write(self._prepare_write(changes))
+        self._after_write()
+
+    def _prepare_write(self, changes: Iterable[Tuple[str, str]]) -> Any:
+        """
+        Подготовить содержимое для записи изменений.
+
+        JSON-хранилище не умеет обновлять отдельные записи, поэтому
+        сериализуется весь кеш один раз на любое число изменений.
+        Наследники переопределяют метод для построчного сохранения.
+
+        Args:
+            changes: Пары (раздел, ключ) измененных записей
+
+        Returns:
+            Данные для _commit_write()
+        """
+        return self._dump_data()
+
+    def _commit_write(self, payload: Any):
+        """Записать подготовленное содержимое на диск"""
+        self._write_cache_file(payload)
+
+    def _after_write(self):
+        """Действия после записи изменений"""
+        pass
+
+    def flush(self):
+        """
+        Записать все несохраненные изменения.
+
+        Синхронная запись для завершения работы и синхронного кода;
+        в цикле событий используется flush_async().
+        """
+        if self._dirty:
+            self._write_changes(self._take_dirty())
+
+    async def flush_async(self):
+        """Асинхронно записать все несохраненные изменения и дождаться фонового писателя"""
+        if self._dirty:
+            await self._schedule_write_async(self._take_dirty())
+        elif self._writer_task is not None and not self._writer_task.done():
+            await asyncio.shield(self._writer_task)
+
+    def has_unsaved_changes(self) -> bool:
+        """Проверить наличие несохраненных изменений"""
+        return bool(self._dirty)
+
+    def close(self):
+        """Записать несохраненные изменения и освободить ресурсы хранилища"""
+        self.flush()
 
     def get_last_event_id(self, project_id: int) -> Optional[int]:
         """Получить ID последнего события для проекта"""
@@ -190,14 +451,59 @@ class Cache:
         if str(project_id) not in self.data["projects"]:
             self.data["projects"][str(project_id)] = {}
         self.data["projects"][str(project_id)]["last_event_id"] = event_id
-        self._save_cache()
+        self._advance_event_watermark(project_id, event_id)
+        self._save_change("projects", str(project_id))
 
     async def set_last_event_id_async(self, project_id: int, event_id: int):
         """Асинхронно установить ID последнего события для проекта"""
         if str(project_id) not in self.data["projects"]:
             self.data["projects"][str(project_id)] = {}
         self.data["projects"][str(project_id)]["last_event_id"] = event_id
-        await self._save_cache_async()
+        self._advance_event_watermark(project_id, event_id)
+        await self._save_change_async("projects", str(project_id))
+
+    def _advance_event_watermark(self, project_id: int, event_id: int):
+        """Поднять водяной знак индекса событий до последнего обработанного ID"""
+        events = self._get_event_set(project_id)
+        if events is not None:
+            events.advance(event_id)
+
+    def get_endpoint_watermark(self, project_id: int, endpoint: str) -> Optional[str]:
+        """
+        Получить водяной знак списка проекта.
+
+        Args:
+            project_id: ID проекта
+            endpoint: Имя списка ('pipelines', 'jobs', 'deployments', ...)
+
+        Returns:
+            Дата самого нового обработанного объекта списка или None
+        """
+        project = self.data["projects"].get(str(project_id), {})
+        return project.get("watermarks", {}).get(endpoint)
+
+    def set_endpoint_watermark(self, project_id: int, endpoint: str, value: str):
+        """Установить водяной знак списка проекта"""
+        project = self.data["projects"].setdefault(str(project_id), {})
+        watermarks = project.setdefault("watermarks", {})
+        if watermarks.get(endpoint) == value:
+            return
+        watermarks[endpoint] = value
+        self._save_change("projects", str(project_id))
+
+    def get_feed_event_id(self) -> Optional[int]:
+        """Получить ID последнего обработанного события ленты пользователя"""
+        return self.data["metadata"].get("feed_last_event_id")
+
+    def set_feed_event_id(self, event_id: int):
+        """Установить ID последнего обработанного события ленты пользователя"""
+        self.data["metadata"]["feed_last_event_id"] = event_id
+        self._save_change("metadata", "feed_last_event_id")
+
+    async def set_feed_event_id_async(self, event_id: int):
+        """Асинхронно установить ID последнего события ленты пользователя"""
+        self.data["metadata"]["feed_last_event_id"] = event_id
+        await self._save_change_async("metadata", "feed_last_event_id")
 
     def get_last_checked(self) -> Optional[str]:
         """Получить время последней проверки"""
@@ -206,12 +512,12 @@ class Cache:
     def set_last_checked(self, timestamp: str):
         """Установить время последней проверки"""
         self.data["metadata"]["last_checked"] = timestamp
-        self._save_cache()
+        self._save_change("metadata", "last_checked")
 
     async def set_last_checked_async(self, timestamp: str):
         """Асинхронно установить время последней проверки"""
         self.data["metadata"]["last_checked"] = timestamp
-        await self._save_cache_async()
+        await self._save_change_async("metadata", "last_checked")
 
     def reset(self):
         """Сбросить кеш"""
@@ -223,6 +529,8 @@ class Cache:
             "projects": {},
             "project_activity": {}
         }
+        self._dirty.clear()
+        self._cycle_projects.clear()
         self._save_cache()
 
     def is_empty(self) -> bool:
@@ -232,39 +540,213 @@ class Cache:
     
 
     def get_project_path(self, project_id: int) -> Optional[str]:
-        """Получить путь проекта из кеша"""
+        """Получить путь проекта из каталога или кеша путей"""
+        entry = self.get_catalogue_project(project_id)
+        if entry and entry.get("path"):
+            return entry["path"]
         project_paths = self.data.get("project_paths", {})
         return project_paths.get(str(project_id))
 
+    def get_catalogue_project(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Получить запись каталога проектов.
+
+        Returns:
+            Словарь с полями path, name и last_activity_at или None
+        """
+        return self.data.get("project_catalogue", {}).get(str(project_id))
+
+    def get_catalogue(self) -> Dict[int, Dict[str, Any]]:
+        """Получить все записи каталога проектов по ID проекта"""
+        return {
+            int(project_id): entry
+            for project_id, entry in self.data.get("project_catalogue", {}).items()
+        }
+
+    def update_catalogue(self, projects: Iterable[Dict[str, Any]]):
+        """
+        Обновить каталог проектов данными из списка проектов API.
+
+        Args:
+            projects: Проекты с полями path_with_namespace, name_with_namespace
+                и last_activity_at
+        """
+        catalogue = self.data.setdefault("project_catalogue", {})
+        for project in projects:
+            key = str(project["id"])
+            entry = {
+                "path": project.get("path_with_namespace"),
+                "name": project.get("name_with_namespace") or project.get("name"),
+                "last_activity_at": project.get("last_activity_at"),
+            }
+            previous = catalogue.get(key) or {}
+            # Поля, которых нет в ответе, берутся из прежней записи
+            entry = {field: value or previous.get(field) for field, value in entry.items()}
+            if entry != previous:
+                catalogue[key] = entry
+                self._save_change("project_catalogue", key)
+
+    def replace_catalogue(self, projects: List[Dict[str, Any]], refreshed_at: str):
+        """
+        Заменить каталог полным списком проектов.
+
+        Проекты, которых нет в списке (удалены или к ним больше нет доступа),
+        удаляются из каталога.
+
+        Args:
+            projects: Полный список отслеживаемых проектов
+            refreshed_at: Время полной сверки (ISO 8601)
+        """
+        self.update_catalogue(projects)
+        self.prune_catalogue([project["id"] for project in projects], refreshed_at)
+
+    def prune_catalogue(self, project_ids: Iterable[int], refreshed_at: str):
+        """
+        Завершить полную сверку каталога, полученного по страницам.
+
+        Страницы полного списка добавляются через update_catalogue, после
+        чего из каталога удаляются проекты, которых в списке не было.
+
+        Args:
+            project_ids: ID всех проектов полного списка
+            refreshed_at: Время полной сверки (ISO 8601)
+        """
+        catalogue = self.data.setdefault("project_catalogue", {})
+        current = {str(project_id) for project_id in project_ids}
+        for key in [key for key in catalogue if key not in current]:
+            del catalogue[key]
+            self._save_change("project_catalogue", key)
+        self.data["metadata"]["catalogue_refreshed_at"] = refreshed_at
+        self._save_change("metadata", "catalogue_refreshed_at")
+
+    def is_catalogue_refresh_due(self, now: Optional[datetime] = None) -> bool:
+        """Проверить, пора ли выполнить полную сверку каталога проектов"""
+        refreshed_at = self.data["metadata"].get("catalogue_refreshed_at")
+        if not refreshed_at or not self.data.get("project_catalogue"):
+            return True
+        try:
+            refreshed_dt = datetime.fromisoformat(refreshed_at.replace("Z", "+00:00"))
+        except ValueError:
+            return True
+        now = now or datetime.now(timezone.utc)
+        return (now - refreshed_dt).total_seconds() >= self.catalogue_refresh_interval
+
     def save_project_path(self, project_id: int, path: str):
         """Сохранить путь проекта в кеш"""
         if "project_paths" not in self.data:
             self.data["project_paths"] = {}
         self.data["project_paths"][str(project_id)] = path
-        self._save_cache()
+        self._save_change("project_paths", str(project_id))
+
+    def _get_event_set(self, project_id: int, create: bool = False) -> Optional[ProjectEventIndex]:
+        """
+        Получить индекс обработанных событий проекта.
+
+        Данные из файла кеша превращаются в ProjectEventIndex при первом обращении.
+
+        Args:
+            project_id: ID проекта
+            create: Создать индекс, если его еще нет
+
+        Returns:
+            Индекс событий или None, если его нет и create=False
+        """
+        projects = self.data.setdefault("projects", {}) if create else self.data.get("projects", {})
+        project_data = projects.get(str(project_id))
+        if project_data is None:
+            if not create:
+                return None
+            project_data = projects[str(project_id)] = {}
+
+        events = project_data.get("events")
+        if isinstance(events, ProjectEventIndex):
+            return events
+        if events is None and not create:
+            return None
+        events = ProjectEventIndex(
+            events,
+            capacity=self.events_capacity,
+            max_capacity=self.events_capacity_max,
+        )
+        project_data["events"] = events
+        return events
 
     def save_project_event(self, project_id: int, event_id: Any):
         """Сохранить событие проекта в кеш"""
-        if "projects" not in self.data:
-            self.data["projects"] = {}
-
-        project_id_str = str(project_id)
-        if project_id_str not in self.data["projects"]:
-            self.data["projects"][project_id_str] = {"events": []}
-
-        events = self.data["projects"][project_id_str]["events"]
-        if event_id not in events:
-            events.append(event_id)
-            # Ограничиваем количество сохраняемых событий
-            if len(events) > 100:
-                events[:] = events[-100:]
-            self._save_cache()
-
-    def get_project_events(self, project_id: int) -> Optional[List]:
-        """Получить список событий проекта из кеша"""
-        projects = self.data.get("projects", {})
-        project_data = projects.get(str(project_id), {})
-        return project_data.get("events", [])
+        events = self._get_event_set(project_id, create=True)
+        self._cycle_projects.add(str(project_id))
+        if events.add(event_id, self._cycle):
+            self._save_change("projects", str(project_id))
+
+    def touch_project_event(self, project_id: int, event_id: Any):
+        """
+        Отметить, что уже обработанное событие снова пришло от API.
+
+        Ключ переносится в конец очереди вытеснения и учитывается при
+        подборе емкости индекса, но на диск отдельно не записывается.
+        """
+        events = self._get_event_set(project_id)
+        if events is not None and event_id in events:
+            self._cycle_projects.add(str(project_id))
+            events.add(event_id, self._cycle)
+
+    def get_project_events(self, project_id: int) -> ProjectEventIndex:
+        """Получить индекс обработанных событий проекта из кеша"""
+        events = self._get_event_set(project_id)
+        if events is None:
+            return ProjectEventIndex(capacity=self.events_capacity)
+        return events
+
+    def end_cycle(self) -> Dict[str, Dict[str, int]]:
+        """
+        Завершить цикл проверки для индексов событий.
+
+        Емкость индексов затронутых проектов подстраивается под число
+        ключей за цикл, а вытеснения суммируются в dedup_metrics.
+
+        Returns:
+            Статистика вытеснений за цикл по типам событий
+        """
+        cycle_metrics: Dict[str, Dict[str, int]] = {}
+        for project_key in self._cycle_projects:
+            events = self._get_event_set(int(project_key))
+            if events is None:
+                continue
+            for kind, stats in events.end_cycle(self._cycle).items():
+                totals = cycle_metrics.setdefault(kind, {"evictions": 0, "live_evictions": 0})
+                totals["evictions"] += stats["evictions"]
+                totals["live_evictions"] += stats["live_evictions"]
+
+        for kind, stats in cycle_metrics.items():
+            totals = self.dedup_metrics.setdefault(kind, {"evictions": 0, "live_evictions": 0})
+            totals["evictions"] += stats["evictions"]
+            totals["live_evictions"] += stats["live_evictions"]
+
+        self._cycle_projects.clear()
+        self._cycle += 1
+        self.last_cycle_metrics = cycle_metrics
+        return cycle_metrics
+
+    def get_dedup_metrics(self) -> Dict[str, Dict[str, int]]:
+        """
+        Получить метрики индексов дедупликации по типам событий.
+
+        Returns:
+            Словарь по типам: evictions и live_evictions с момента запуска,
+            число хранимых ключей (keys) и суммарная емкость (capacity)
+        """
+        metrics = {kind: dict(stats, keys=0, capacity=0) for kind, stats in self.dedup_metrics.items()}
+        for project_key in list(self.data.get("projects", {})):
+            events = self._get_event_set(int(project_key))
+            if events is None:
+                continue
+            for kind, store in events.stores.items():
+                stats = metrics.setdefault(
+                    kind, {"evictions": 0, "live_evictions": 0, "keys": 0, "capacity": 0}
+                )
+                stats["keys"] += len(store)
+                stats["capacity"] += store.maxlen
+        return metrics
 
     def get_project_activity(self, project_id: int) -> Optional[str]:
         """Получить время последней активности проекта из кеша"""
@@ -273,12 +755,12 @@ class Cache:
     def set_project_activity(self, project_id: int, activity_time: str):
         """Установить время последней активности проекта в кеш"""
         self.data["project_activity"][project_id] = activity_time
-        self._save_cache()
+        self._save_change("project_activity", str(project_id))
 
     async def set_project_activity_async(self, project_id: int, activity_time: str):
         """Асинхронно установить время последней активности проекта в кеш"""
         self.data["project_activity"][project_id] = activity_time
-        await self._save_cache_async()
+        await self._save_change_async("project_activity", str(project_id))
 
     
 
@@ -291,3 +773,25 @@ class Cache:
         day_ago = datetime.now(timezone.utc) - timedelta(hours=24)
         self.data["metadata"]["last_checked"] = day_ago.isoformat()
         print("Дата последней проверки сброшена на 24 часа назад")
+
+
+def create_cache(cache_file: str = "cache.json", backend: str = "json", **options) -> Cache:
+    """
+    Создать кеш с указанным хранилищем.
+
+    Args:
+        cache_file: Путь к JSON файлу кеша
+        backend: Тип хранилища ('json', 'sqlite' или 'journal')
+        **options: Параметры хранилища (write_behind, flush_interval, max_dirty,
+            journal_max_bytes)
+
+    Returns:
+        Экземпляр кеша
+    """
+    if backend == "sqlite":
+        from .sqlite_cache import SQLiteCache
+        return SQLiteCache(cache_file, **options)
+    if backend == "journal":
+        from .journal_cache import JournalCache
+        return JournalCache(cache_file, **options)
+    return Cache(cache_file, **options)
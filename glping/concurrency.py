@@ -0,0 +1,224 @@
+"""Адаптивное ограничение числа одновременных запросов к GitLab (AIMD)."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """
+    Получить перцентиль выборки.
+
+    Args:
+        values: Значения
+        fraction: Доля (0.95 — 95-й перцентиль)
+
+    Returns:
+        Значение перцентиля или None для пустой выборки
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class _Slot:
+    """Место под лимитом на время одного запроса"""
+
+    def __init__(self, limiter: "AdaptiveLimiter"):
+        self._limiter = limiter
+        self._started = 0.0
+        # HTTP статус ответа; None, если ответ не получен
+        self.status: Optional[int] = None
+
+    async def __aenter__(self):
+        self._started = await self._limiter.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            # Отмена запроса не говорит о перегрузке GitLab
+            self._limiter.discard()
+        else:
+            self._limiter.release(self._started, self.status)
+        return False
+
+
+class AdaptiveLimiter:
+    """
+    Ограничитель одновременных запросов с подбором лимита по принципу AIMD.
+
+    Запросы оцениваются окнами по max(min_window, limit) ответов. Если
+    в окне лимит был полностью занят, ошибок не было, а p95 задержки не
+    превышает базовую задержку больше чем в latency_tolerance раз, лимит
+    растет на единицу. Ответ 429, 5xx или сетевая ошибка, а также всплеск
+    p95 сразу уменьшают лимит в decrease_factor раз. Ошибки запросов,
+    начатых до последнего уменьшения, лимит повторно не уменьшают.
+    Базовая задержка следует за p95 здоровых окон, поэтому подходит и для
+    небольшого собственного инстанса, и для gitlab.com.
+
+    При min_limit == max_limit лимит фиксирован.
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_tolerance: float = 2.0,
+        decrease_factor: float = 0.7,
+        min_window: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Инициализация ограничителя.
+
+        Args:
+            initial: Начальный лимит
+            min_limit: Нижняя граница лимита
+            max_limit: Верхняя граница лимита
+            latency_tolerance: Во сколько раз p95 может превысить базовую задержку
+            decrease_factor: Множитель лимита при перегрузке
+            min_window: Минимальное число ответов в окне оценки
+            clock: Монотонные часы
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(max(initial, self.min_limit), self.max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.min_window = min_window
+        self._clock = clock
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._latencies: List[float] = []
+        self._window_failures = 0
+        self._saturated = False
+        self._last_decrease = float("-inf")
+        self.baseline: Optional[float] = None
+        self.last_p95: Optional[float] = None
+        self.increases = 0
+        self.decreases = 0
+
+    async def acquire(self) -> float:
+        """
+        Дождаться свободного места под лимитом.
+
+        Returns:
+            Время начала запроса, которое передается в release()
+        """
+        if self.in_flight < self.limit and not self._waiters:
+            self._take()
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Место уже выделено: возвращаем его следующему
+                    self.in_flight -= 1
+                    self._wake()
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+        return self._clock()
+
+    def slot(self) -> _Slot:
+        """
+        Занять место на время запроса.
+
+        Использование: async with limiter.slot() as slot: ...; slot.status = status
+        """
+        return _Slot(self)
+
+    def discard(self):
+        """Освободить место, не учитывая результат запроса"""
+        self.in_flight -= 1
+        self._wake()
+
+    def release(self, started: float, status: Optional[int]):
+        """
+        Освободить место и учесть результат запроса.
+
+        Args:
+            started: Значение, которое вернул acquire()
+            status: HTTP статус ответа или None, если ответ не получен
+        """
+        self.in_flight -= 1
+        now = self._clock()
+        if status is None or status == 429 or status >= 500:
+            self._window_failures += 1
+            if started >= self._last_decrease:
+                self._decrease(now)
+        else:
+            self._latencies.append(now - started)
+            if len(self._latencies) + self._window_failures >= max(self.min_window, self.limit):
+                self._evaluate(now)
+        self._wake()
+
+    def _take(self):
+        """Занять место под лимитом"""
+        self.in_flight += 1
+        if self.in_flight >= self.limit:
+            self._saturated = True
+
+    def _wake(self):
+        """Пропустить ожидающие запросы, для которых освободилось место"""
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._take()
+                waiter.set_result(None)
+
+    def _evaluate(self, now: float):
+        """Оценить окно ответов и изменить лимит"""
+        p95 = percentile(self._latencies, 0.95)
+        self.last_p95 = p95
+        if self.baseline is None:
+            self.baseline = p95
+        elif p95 > self.baseline * self.latency_tolerance:
+            # Всплеск задержки: сервер или сеть перегружены
+            self._decrease(now)
+            return
+        else:
+            self.baseline = self.baseline * 0.8 + p95 * 0.2
+            if self._saturated and not self._window_failures and self.limit < self.max_limit:
+                self.limit += 1
+                self.increases += 1
+        self._reset_window()
+
+    def _decrease(self, now: float):
+        """Уменьшить лимит после перегрузки"""
+        if self.limit > self.min_limit:
+            self.limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+            self.decreases += 1
+        self._last_decrease = now
+        self._reset_window()
+
+    def _reset_window(self):
+        """Начать новое окно оценки"""
+        self._latencies = []
+        self._window_failures = 0
+        self._saturated = self.in_flight >= self.limit
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Получить состояние ограничителя для подробного вывода.
+
+        Returns:
+            Словарь: limit, min_limit, max_limit, in_flight, waiting,
+            p95 (последнего окна, сек), baseline (сек), increases, decreases
+        """
+        return {
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "p95": self.last_p95,
+            "baseline": self.baseline,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
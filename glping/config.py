@@ -47,6 +47,89 @@ class Config:
         # Всегда используем полный путь к файлу кеша в домашней директории
         cache_file_name = os.getenv("CACHE_FILE", "cache.json")
         self.cache_file: str = os.path.join(self.glping_dir, cache_file_name)
+        self.cache_backend: str = os.getenv("CACHE_BACKEND", "json").lower()
+        # Отложенная запись кеша: изменения сохраняются один раз за цикл проверки,
+        # а CACHE_FLUSH_INTERVAL и CACHE_MAX_DIRTY ограничивают потери при сбое
+        self.cache_write_behind: bool = os.getenv("CACHE_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+        self.cache_flush_interval: float = float(os.getenv("CACHE_FLUSH_INTERVAL", "30"))
+        self.cache_max_dirty: int = int(os.getenv("CACHE_MAX_DIRTY", "1000"))
+        # Размер журнала (байт), после которого он сворачивается в снимок
+        self.cache_journal_max_bytes: int = int(os.getenv("CACHE_JOURNAL_MAX_BYTES", str(1024 * 1024)))
+        # Границы емкости индекса дедупликации для каждого типа событий проекта;
+        # внутри границ емкость подбирается по числу событий за цикл
+        self.cache_events_capacity: int = int(os.getenv("CACHE_EVENTS_CAPACITY", "100"))
+        self.cache_events_capacity_max: int = int(os.getenv("CACHE_EVENTS_CAPACITY_MAX", "5000"))
+        # Период (часы) полной сверки каталога проектов: между сверками каталог
+        # обновляется только проектами с новой активностью
+        self.project_catalogue_refresh_hours: float = float(
+            os.getenv("PROJECT_CATALOGUE_REFRESH_HOURS", "24")
+        )
+        # Keyset-пагинация списка проектов: постоянная стоимость страницы
+        # на больших инстансах вместо параллельного постраничного листания
+        self.projects_keyset_pagination: bool = os.getenv(
+            "PROJECTS_KEYSET_PAGINATION", "false"
+        ).lower() in ("1", "true", "yes")
+        # Получать события одной лентой пользователя (GET /events?scope=all)
+        # вместо запроса событий каждого проекта
+        self.events_feed: bool = os.getenv("EVENTS_FEED", "false").lower() in ("1", "true", "yes")
+        # Получать pipelines и статусы jobs пакетами проектов через GraphQL API;
+        # GRAPHQL_BATCH_SIZE ограничивает сложность одного запроса
+        self.graphql_ci: bool = os.getenv("GRAPHQL_CI", "false").lower() in ("1", "true", "yes")
+        self.graphql_batch_size: int = int(os.getenv("GRAPHQL_BATCH_SIZE", "10"))
+        # Сохранять кеш ETag между запусками (в памяти он используется всегда)
+        self.http_cache_persist: bool = os.getenv("HTTP_CACHE_PERSIST", "false").lower() in ("1", "true", "yes")
+        self.http_cache_file: str = os.path.join(self.glping_dir, "http_cache.json")
+        # Доля бюджета RateLimit, ниже которой запросы распределяются до его сброса,
+        # и число повторов запроса после ответа 429
+        self.rate_limit_reserve: float = float(os.getenv("RATE_LIMIT_RESERVE", "0.1"))
+        self.rate_limit_retries: int = int(os.getenv("RATE_LIMIT_RETRIES", "3"))
+        # Повторы GET запросов после сетевых ошибок и 5xx с экспоненциальной задержкой
+        self.retry_max: int = int(os.getenv("RETRY_MAX", "3"))
+        self.retry_base_delay: float = float(os.getenv("RETRY_BASE_DELAY", "0.5"))
+        self.retry_max_delay: float = float(os.getenv("RETRY_MAX_DELAY", "10"))
+        # Выключатель: после стольких ошибок подряд запросы к GitLab
+        # приостанавливаются на CIRCUIT_BREAKER_RESET секунд
+        self.circuit_breaker_threshold: int = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5"))
+        self.circuit_breaker_reset: float = float(os.getenv("CIRCUIT_BREAKER_RESET", "30"))
+        # Пул обработчиков: сколько проектов проверяется одновременно
+        # и сколько секунд может длиться проверка одного проекта (0 — без ограничения)
+        self.worker_pool_size: int = int(os.getenv("WORKER_POOL_SIZE", "10"))
+        self.project_check_timeout: float = float(os.getenv("PROJECT_CHECK_TIMEOUT", "300"))
+        # Расписание проверки проектов в режиме демона: проекты с активностью
+        # за последние POLL_HOT_WINDOW секунд проверяются каждые CHECK_INTERVAL
+        # секунд, затем интервал удваивается до POLL_INTERVAL_MAX секунд
+        # (но не меньше CHECK_INTERVAL), после чего проект покидает расписание
+        self.adaptive_polling: bool = os.getenv(
+            "ADAPTIVE_POLLING", "false"
+        ).lower() in ("1", "true", "yes")
+        self.poll_interval_max: float = float(os.getenv("POLL_INTERVAL_MAX", "3600"))
+        self.poll_hot_window: float = float(os.getenv("POLL_HOT_WINDOW", "1800"))
+        # Адаптивный лимит одновременных запросов: растет, пока задержка
+        # и ошибки в норме, и снижается при 429/5xx и всплесках задержки.
+        # Без ADAPTIVE_CONCURRENCY лимит фиксирован и равен WORKER_POOL_SIZE
+        self.adaptive_concurrency: bool = os.getenv(
+            "ADAPTIVE_CONCURRENCY", "true"
+        ).lower() in ("1", "true", "yes")
+        self.concurrency_min: int = int(os.getenv("CONCURRENCY_MIN", "1"))
+        self.concurrency_max: int = int(os.getenv("CONCURRENCY_MAX", "32"))
+        self.concurrency_latency_tolerance: float = float(
+            os.getenv("CONCURRENCY_LATENCY_TOLERANCE", "2")
+        )
+        # Пул соединений: лимит соединений с GitLab по умолчанию равен верхней
+        # границе одновременных запросов, keep-alive и кеш DNS переживают циклы демона
+        self.http_limit_per_host: int = int(
+            os.getenv(
+                "HTTP_LIMIT_PER_HOST",
+                str(self.concurrency_max if self.adaptive_concurrency else self.worker_pool_size),
+            )
+        )
+        self.http_keepalive_timeout: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+        self.http_dns_cache_ttl: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+        self.http_prewarm_connections: int = int(os.getenv("HTTP_PREWARM_CONNECTIONS", "0"))
+        # Таймауты запроса целиком, установки соединения и чтения из сокета (сек)
+        self.http_timeout_total: float = float(os.getenv("HTTP_TIMEOUT_TOTAL", "60"))
+        self.http_timeout_connect: float = float(os.getenv("HTTP_TIMEOUT_CONNECT", "10"))
+        self.http_timeout_read: float = float(os.getenv("HTTP_TIMEOUT_READ", "30"))
         self.project_id: Optional[int] = None
 
         if not self.gitlab_token:
@@ -60,6 +143,8 @@ class Config:
         print(f"🔗 GitLab URL: {self.gitlab_url}")
         print(f"⏱️  Интервал проверки: {self.check_interval} секунд")
         print(f"💾 Файл кеша: {self.cache_file}")
+        if self.cache_backend != "json":
+            print(f"🗄️  Хранилище кеша: {self.cache_backend}")
         if self.project_id:
             print(f"🎯 Отслеживаемый проект ID: {self.project_id}")
 
@@ -82,9 +167,152 @@ class Config:
             raise ValueError("CHECK_INTERVAL должен быть положительным числом")
         if self.check_interval > 3600:
             print(f"⚠️  CHECK_INTERVAL={self.check_interval}с очень большой, рекомендуется не более 3600с (1 час)")
+
+        # Проверка хранилища кеша
+        if self.cache_backend not in ("json", "sqlite", "journal"):
+            raise ValueError("CACHE_BACKEND должен быть 'json', 'sqlite' или 'journal'")
+        if self.cache_flush_interval < 0:
+            raise ValueError("CACHE_FLUSH_INTERVAL не может быть отрицательным")
+        if self.cache_max_dirty < 0:
+            raise ValueError("CACHE_MAX_DIRTY не может быть отрицательным")
+        if self.cache_journal_max_bytes <= 0:
+            raise ValueError("CACHE_JOURNAL_MAX_BYTES должен быть положительным числом")
+        if self.cache_events_capacity <= 0:
+            raise ValueError("CACHE_EVENTS_CAPACITY должен быть положительным числом")
+        if self.cache_events_capacity_max < self.cache_events_capacity:
+            raise ValueError("CACHE_EVENTS_CAPACITY_MAX не может быть меньше CACHE_EVENTS_CAPACITY")
+
+        if not 1 <= self.graphql_batch_size <= 50:
+            raise ValueError("GRAPHQL_BATCH_SIZE должен быть в диапазоне от 1 до 50")
+
+        if self.project_catalogue_refresh_hours <= 0:
+            raise ValueError("PROJECT_CATALOGUE_REFRESH_HOURS должен быть положительным числом")
+
+        # Проверка ограничения частоты запросов
+        if not 0 <= self.rate_limit_reserve < 1:
+            raise ValueError("RATE_LIMIT_RESERVE должен быть в диапазоне [0, 1)")
+        if self.rate_limit_retries < 0:
+            raise ValueError("RATE_LIMIT_RETRIES не может быть отрицательным")
+
+        # Проверка политики повторов и выключателя
+        if self.retry_max < 0:
+            raise ValueError("RETRY_MAX не может быть отрицательным")
+        if self.retry_base_delay < 0 or self.retry_max_delay < self.retry_base_delay:
+            raise ValueError("RETRY_MAX_DELAY должен быть не меньше RETRY_BASE_DELAY >= 0")
+        if self.circuit_breaker_threshold < 1:
+            raise ValueError("CIRCUIT_BREAKER_THRESHOLD должен быть положительным числом")
+        if self.circuit_breaker_reset < 0:
+            raise ValueError("CIRCUIT_BREAKER_RESET не может быть отрицательным")
+
+        # Проверка пула обработчиков
+        if self.worker_pool_size < 1:
+            raise ValueError("WORKER_POOL_SIZE должен быть положительным числом")
+        if self.project_check_timeout < 0:
+            raise ValueError("PROJECT_CHECK_TIMEOUT не может быть отрицательным")
+
+        # Проверка расписания проверки проектов
+        if self.poll_interval_max <= 0:
+            raise ValueError("POLL_INTERVAL_MAX должен быть положительным числом")
+        if self.poll_hot_window < 0:
+            raise ValueError("POLL_HOT_WINDOW не может быть отрицательным")
+
+        # Проверка адаптивного лимита одновременных запросов
+        if self.concurrency_min < 1:
+            raise ValueError("CONCURRENCY_MIN должен быть положительным числом")
+        if self.concurrency_max < self.concurrency_min:
+            raise ValueError("CONCURRENCY_MAX не может быть меньше CONCURRENCY_MIN")
+        if self.concurrency_latency_tolerance <= 1:
+            raise ValueError("CONCURRENCY_LATENCY_TOLERANCE должен быть больше 1")
+
+        # Проверка пула соединений
+        if self.http_limit_per_host < 0:
+            raise ValueError("HTTP_LIMIT_PER_HOST не может быть отрицательным")
+        if self.http_prewarm_connections < 0:
+            raise ValueError("HTTP_PREWARM_CONNECTIONS не может быть отрицательным")
+        if min(self.http_timeout_total, self.http_timeout_connect, self.http_timeout_read) <= 0:
+            raise ValueError("Таймауты HTTP_TIMEOUT_* должны быть положительными")
     
     def get_project_filter(self) -> dict:
         """Получить фильтр для проектов"""
         if self.project_id:
             return {"project_id": self.project_id}
         return {"membership": True}
+
+    def get_cache_options(self) -> dict:
+        """Получить параметры создания кеша"""
+        options = {
+            "backend": self.cache_backend,
+            "write_behind": self.cache_write_behind,
+            "flush_interval": self.cache_flush_interval,
+            "max_dirty": self.cache_max_dirty,
+            "events_capacity": self.cache_events_capacity,
+            "events_capacity_max": self.cache_events_capacity_max,
+            "catalogue_refresh_interval": self.project_catalogue_refresh_hours * 3600,
+        }
+        if self.cache_backend == "journal":
+            options["journal_max_bytes"] = self.cache_journal_max_bytes
+        return options
+
+    def get_worker_options(self) -> dict:
+        """Получить параметры пула обработчиков проверки проектов"""
+        return {
+            "size": self.worker_pool_size,
+            "timeout": self.project_check_timeout or None,
+        }
+
+    def get_scheduler_options(self) -> dict:
+        """Получить параметры расписания проверки проектов"""
+        return {
+            "hot_interval": self.check_interval,
+            "max_interval": self.poll_interval_max,
+            "hot_window": self.poll_hot_window,
+        }
+
+    def get_api_options(self) -> dict:
+        """Получить параметры создания асинхронного клиента GitLab API"""
+        return {
+            "keyset_projects": self.projects_keyset_pagination,
+            "rate_limit_retries": self.rate_limit_retries,
+            "limit_per_host": self.http_limit_per_host,
+            "keepalive_timeout": self.http_keepalive_timeout,
+            "dns_cache_ttl": self.http_dns_cache_ttl,
+            "prewarm_connections": self.http_prewarm_connections,
+            "timeout": self.http_timeout_total,
+            "connect_timeout": self.http_timeout_connect,
+            "read_timeout": self.http_timeout_read,
+        }
+
+    def get_http_cache_options(self) -> dict:
+        """Получить параметры кеша ETag"""
+        return {"cache_file": self.http_cache_file if self.http_cache_persist else None}
+
+    def get_rate_limit_options(self) -> dict:
+        """Получить параметры ограничителя частоты запросов"""
+        return {"reserve": self.rate_limit_reserve}
+
+    def get_concurrency_options(self) -> dict:
+        """Получить параметры ограничителя одновременных запросов"""
+        if not self.adaptive_concurrency:
+            size = self.worker_pool_size
+            return {"initial": size, "min_limit": size, "max_limit": size}
+        return {
+            "initial": self.worker_pool_size,
+            "min_limit": self.concurrency_min,
+            "max_limit": self.concurrency_max,
+            "latency_tolerance": self.concurrency_latency_tolerance,
+        }
+
+    def get_retry_options(self) -> dict:
+        """Получить параметры повторов запросов"""
+        return {
+            "max_retries": self.retry_max,
+            "base_delay": self.retry_base_delay,
+            "max_delay": self.retry_max_delay,
+        }
+
+    def get_breaker_options(self) -> dict:
+        """Получить параметры автоматического выключателя"""
+        return {
+            "failure_threshold": self.circuit_breaker_threshold,
+            "reset_timeout": self.circuit_breaker_reset,
+        }
@@ -0,0 +1,438 @@
+"""Индексы обработанных событий для дедупликации уведомлений."""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+# Минимальная емкость индекса одного типа событий проекта
+PROJECT_EVENTS_LIMIT = 100
+# Максимальная емкость, до которой индекс растет автоматически
+PROJECT_EVENTS_LIMIT_MAX = 5000
+# Во сколько раз емкость превышает число ключей, затронутых за цикл проверки
+CAPACITY_HEADROOM = 3
+
+# Типы событий с отдельными индексами: обычные события и CI/CD объекты
+EVENT_KINDS = ("event", "pipeline", "job", "deployment")
+
+# Числовые коды типов CI/CD объектов и их статусов для компактных ключей
+CI_KIND_CODES = {"pipeline": 1, "job": 2, "deployment": 3}
+CI_KIND_NAMES = {code: kind for kind, code in CI_KIND_CODES.items()}
+CI_STATUS_CODES = {
+    status: code
+    for code, status in enumerate((
+        "created", "waiting_for_resource", "preparing", "pending", "running",
+        "success", "failed", "canceled", "skipped", "manual", "scheduled", "blocked",
+    ))
+}
+
+
+def encode_event_key(key: Any) -> Any:
+    """
+    Преобразовать ключ события в компактную форму.
+
+    Строки вида '{kind}_{id}_{status}' превращаются в кортежи
+    (код типа, id, код статуса). Неизвестный статус остается строкой.
+
+    Args:
+        key: Ключ события (ID события или строка CI/CD ключа)
+
+    Returns:
+        Ключ для хранения в индексе
+    """
+    if not isinstance(key, str):
+        return key
+    parts = key.split("_", 2)
+    if len(parts) != 3 or parts[0] not in CI_KIND_CODES:
+        return key
+    try:
+        item_id = int(parts[1])
+    except ValueError:
+        return key
+    return (CI_KIND_CODES[parts[0]], item_id, CI_STATUS_CODES.get(parts[2], parts[2]))
+
+
+class BoundedEventSet:
+    """
+    Ограниченное множество ключей событий с вытеснением давно не встречавшихся.
+
+    Проверка наличия и добавление выполняются за O(1). Повторное добавление
+    обновляет ключ, поэтому объекты, которые API возвращает каждый цикл,
+    не вытесняются. В файл кеша сериализуется списком.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), maxlen: int = PROJECT_EVENTS_LIMIT):
+        """
+        Инициализация множества.
+
+        Args:
+            items: Начальные ключи от старых к новым
+            maxlen: Максимальное число хранимых ключей
+        """
+        self.maxlen = maxlen
+        # Значение ключа — номер цикла проверки, в котором он встречался последним
+        self._items: "OrderedDict[Any, int]" = OrderedDict()
+        self.evictions = 0
+        self.live_evictions = 0
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Any, cycle: int = 0) -> bool:
+        """
+        Добавить или обновить ключ.
+
+        Args:
+            item: Ключ события
+            cycle: Номер текущего цикла проверки
+
+        Returns:
+            True если ключ новый, False если он уже был в множестве
+        """
+        is_new = item not in self._items
+        self._items[item] = cycle
+        self._items.move_to_end(item)
+        self._evict(cycle)
+        return is_new
+
+    def resize(self, maxlen: int, cycle: int = 0):
+        """Изменить емкость множества"""
+        self.maxlen = maxlen
+        self._evict(cycle)
+
+    def _evict(self, cycle: int):
+        """Вытеснить лишние ключи, подсчитывая вытеснения текущего цикла"""
+        while len(self._items) > self.maxlen:
+            _, item_cycle = self._items.popitem(last=False)
+            self.evictions += 1
+            if item_cycle == cycle:
+                # Ключ нужен в этом же цикле — емкости не хватает
+                self.live_evictions += 1
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"BoundedEventSet({list(self._items)!r}, maxlen={self.maxlen})"
+
+    def to_list(self) -> List[Any]:
+        """Сериализовать множество в список"""
+        return list(self._items)
+
+
+class EventIdRanges:
+    """
+    Множество обработанных ID событий в виде водяного знака и диапазонов.
+
+    ID событий GitLab растут монотонно, поэтому все ID не выше водяного
+    знака считаются обработанными, а выше него хранятся только исключения,
+    пришедшие не по порядку. Соседние ID склеиваются в диапазоны. Когда
+    диапазонов становится больше maxlen, младшие забываются.
+    """
+
+    def __init__(
+        self,
+        data: Any = None,
+        maxlen: int = PROJECT_EVENTS_LIMIT,
+    ):
+        """
+        Инициализация множества.
+
+        Args:
+            data: Сериализованное множество ({"w": ..., "r": [...]}) или список ID
+            maxlen: Максимальное число хранимых диапазонов
+        """
+        self.maxlen = maxlen
+        self.watermark: Optional[int] = None
+        # Непересекающиеся диапазоны [start, end] выше водяного знака по возрастанию
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self.evictions = 0
+        self.live_evictions = 0
+
+        if isinstance(data, dict):
+            self.watermark = data.get("w")
+            for item in data.get("r", []):
+                start, end = (item, item) if isinstance(item, int) else item
+                self._insert_range(start, end)
+            self._evict()
+        elif data:
+            for item in data:
+                self.add(item)
+
+    def add(self, item: int, cycle: int = 0) -> bool:
+        """
+        Добавить ID события.
+
+        Args:
+            item: ID события
+            cycle: Номер текущего цикла проверки (для совместимости интерфейса)
+
+        Returns:
+            True если ID новый
+        """
+        if item in self:
+            return False
+        self._insert_range(item, item)
+        self._evict()
+        return True
+
+    def _insert_range(self, start: int, end: int):
+        """Вставить диапазон, склеив его с соседними"""
+        if self.watermark is not None and end <= self.watermark:
+            return
+        if self.watermark is not None and start <= self.watermark:
+            start = self.watermark + 1
+
+        index = bisect_right(self._starts, start)
+        # Склеиваем с предыдущим диапазоном, если он пересекается или соседствует
+        if index > 0 and self._ends[index - 1] >= start - 1:
+            index -= 1
+            start = self._starts[index]
+            end = max(end, self._ends[index])
+            del self._starts[index], self._ends[index]
+        # Поглощаем следующие диапазоны
+        while index < len(self._starts) and self._starts[index] <= end + 1:
+            end = max(end, self._ends[index])
+            del self._starts[index], self._ends[index]
+        self._starts.insert(index, start)
+        self._ends.insert(index, end)
+
+    def advance(self, watermark: int):
+        """
+        Поднять водяной знак: все ID не выше него считаются обработанными.
+
+        Args:
+            watermark: Новый водяной знак
+        """
+        if self.watermark is not None and watermark <= self.watermark:
+            return
+        index = bisect_right(self._ends, watermark)
+        if index < len(self._starts) and self._starts[index] <= watermark + 1:
+            # Диапазон примыкает к водяному знаку и поглощается им
+            watermark = self._ends[index]
+            index += 1
+        del self._starts[:index], self._ends[:index]
+        self.watermark = watermark
+
+    def resize(self, maxlen: int, cycle: int = 0):
+        """Изменить максимальное число диапазонов"""
+        self.maxlen = maxlen
+        self._evict()
+
+    def _evict(self):
+        """
+        Забыть младшие диапазоны сверх maxlen.
+
+        Водяной знак при этом не сдвигается: ID в промежутках между
+        диапазонами не были получены, и поглощение молча считало бы их
+        обработанными. Забытый ID в худшем случае даст повторное уведомление.
+        """
+        excess = len(self._starts) - self.maxlen
+        if excess > 0:
+            self.evictions += excess
+            del self._starts[:excess], self._ends[:excess]
+
+    def __contains__(self, item: Any) -> bool:
+        if not isinstance(item, int):
+            return False
+        if self.watermark is not None and item <= self.watermark:
+            return True
+        index = bisect_right(self._starts, item) - 1
+        return index >= 0 and item <= self._ends[index]
+
+    def __len__(self) -> int:
+        """Число хранимых диапазонов"""
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[int]:
+        """ID событий выше водяного знака"""
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end + 1)
+
+    def __repr__(self) -> str:
+        return f"EventIdRanges(watermark={self.watermark!r}, ranges={self.to_dict()['r']!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Сериализовать множество; одиночные ID хранятся числом"""
+        ranges = [
+            start if start == end else [start, end]
+            for start, end in zip(self._starts, self._ends)
+        ]
+        if self.watermark is None:
+            return {"r": ranges}
+        return {"w": self.watermark, "r": ranges}
+
+
+class ProjectEventIndex:
+    """
+    Индекс обработанных событий проекта с отдельным множеством на каждый тип.
+
+    Ключи pipeline, job и deployment не вытесняют друг друга и обычные
+    события. Емкость каждого множества подстраивается под число ключей,
+    затронутых за цикл проверки. ID обычных событий хранятся в EventIdRanges,
+    CI/CD ключи — кортежами целых чисел.
+    """
+
+    def __init__(
+        self,
+        data: Any = None,
+        capacity: int = PROJECT_EVENTS_LIMIT,
+        max_capacity: int = PROJECT_EVENTS_LIMIT_MAX,
+    ):
+        """
+        Инициализация индекса.
+
+        Args:
+            data: Сериализованный индекс (словарь по типам или список старого формата)
+            capacity: Минимальная емкость множества одного типа
+            max_capacity: Максимальная емкость множества одного типа
+        """
+        self.capacity = capacity
+        self.max_capacity = max(max_capacity, capacity)
+        self.stores: Dict[str, Any] = {}
+        # Число ключей каждого типа, затронутых в текущем цикле
+        self.cycle_touches: Dict[str, int] = {}
+
+        if isinstance(data, dict):
+            for kind, items in data.items():
+                self._load_store(kind, items)
+        elif data:
+            # Старый формат: общий список ключей всех типов
+            grouped: Dict[str, List[Any]] = {}
+            for item in data:
+                grouped.setdefault(self.kind_of(encode_event_key(item)), []).append(item)
+            for kind, items in grouped.items():
+                self._load_store(kind, items)
+
+    def _load_store(self, kind: str, items: Any):
+        """Восстановить множество без вытеснения загруженных ключей"""
+        if kind == "event":
+            ranges = items.get("r", []) if isinstance(items, dict) else items
+            self.stores[kind] = EventIdRanges(items, maxlen=max(self.capacity, len(ranges)))
+            return
+        kind_code = CI_KIND_CODES.get(kind)
+        keys = [
+            (kind_code, *item) if kind_code is not None and isinstance(item, list) else encode_event_key(item)
+            for item in items
+        ]
+        self.stores[kind] = BoundedEventSet(keys, maxlen=max(self.capacity, len(keys)))
+
+    def _create_store(self, kind: str):
+        """Создать пустое множество для типа событий"""
+        if kind == "event":
+            return EventIdRanges(maxlen=self.capacity)
+        return BoundedEventSet(maxlen=self.capacity)
+
+    @staticmethod
+    def kind_of(key: Any) -> str:
+        """Определить тип события по ключу в компактной форме"""
+        if isinstance(key, tuple):
+            return CI_KIND_NAMES.get(key[0], "other")
+        if isinstance(key, int):
+            return "event"
+        return "other"
+
+    def add(self, key: Any, cycle: int = 0) -> bool:
+        """
+        Добавить или обновить ключ события.
+
+        Args:
+            key: Ключ события
+            cycle: Номер текущего цикла проверки
+
+        Returns:
+            True если ключ новый
+        """
+        key = encode_event_key(key)
+        kind = self.kind_of(key)
+        store = self.stores.get(kind)
+        if store is None:
+            store = self.stores[kind] = self._create_store(kind)
+        self.cycle_touches[kind] = self.cycle_touches.get(kind, 0) + 1
+        return store.add(key, cycle)
+
+    def advance(self, watermark: int):
+        """
+        Поднять водяной знак ID обычных событий.
+
+        Args:
+            watermark: ID, до которого включительно события обработаны
+        """
+        store = self.stores.get("event")
+        if store is None:
+            store = self.stores["event"] = self._create_store("event")
+        store.advance(watermark)
+
+    def end_cycle(self, cycle: int) -> Dict[str, Dict[str, int]]:
+        """
+        Подстроить емкость под нагрузку цикла и забрать статистику вытеснений.
+
+        Args:
+            cycle: Номер завершившегося цикла проверки
+
+        Returns:
+            Статистика по типам: evictions, live_evictions, capacity
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        for kind, store in self.stores.items():
+            touches = self.cycle_touches.get(kind, 0)
+            if touches:
+                target = min(max(touches * CAPACITY_HEADROOM, self.capacity), self.max_capacity)
+                # Емкость растет сразу, а уменьшается постепенно
+                if target < store.maxlen:
+                    target = max(target, store.maxlen // 2)
+                store.resize(target, cycle)
+            stats[kind] = {
+                "evictions": store.evictions,
+                "live_evictions": store.live_evictions,
+                "capacity": store.maxlen,
+            }
+            store.evictions = 0
+            store.live_evictions = 0
+        self.cycle_touches.clear()
+        return stats
+
+    def __contains__(self, key: Any) -> bool:
+        key = encode_event_key(key)
+        store = self.stores.get(self.kind_of(key))
+        return store is not None and key in store
+
+    def __len__(self) -> int:
+        return sum(len(store) for store in self.stores.values())
+
+    def __iter__(self) -> Iterator[Any]:
+        for store in self.stores.values():
+            yield from store
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Сериализовать индекс по типам.
+
+        Код типа в CI/CD ключах не сохраняется: он задан именем раздела.
+        """
+        result: Dict[str, Any] = {}
+        for kind, store in self.stores.items():
+            if isinstance(store, EventIdRanges):
+                if len(store) or store.watermark is not None:
+                    result[kind] = store.to_dict()
+            elif len(store):
+                result[kind] = [
+                    list(key[1:]) if isinstance(key, tuple) else key
+                    for key in store
+                ]
+        return result
+
+
+def encode_cache_value(value: Any) -> Any:
+    """Преобразовать структуры кеша в JSON-совместимые значения"""
+    if isinstance(value, ProjectEventIndex):
+        return value.to_dict()
+    if isinstance(value, BoundedEventSet):
+        return value.to_list()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
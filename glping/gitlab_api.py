@@ -4,33 +4,77 @@ from typing import Any, Dict, List, Optional
 import gitlab
 from .base_gitlab_api import BaseGitLabAPI
 from .config import Config
+from .utils.pagination import ENDPOINT_ORDER, Watermark, iter_until_watermark
 
 
 class GitLabAPI(BaseGitLabAPI):
     """Синхронный класс для работы с GitLab API."""
 
-    def __init__(self, url: str, token: str):
-        """Инициализация подключения к GitLab."""
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        keyset_projects: bool = False,
+        rate_limit_retries: int = 3,
+    ):
+        """
+        Инициализация подключения к GitLab.
+
+        Args:
+            url: URL GitLab
+            token: Токен доступа
+            keyset_projects: Получать список проектов keyset-пагинацией
+            rate_limit_retries: Сколько раз повторять запрос после ответа 429
+                или 5xx (python-gitlab ждет Retry-After или экспоненциальную
+                задержку перед повтором)
+        """
         # Создаем временную конфигурацию для обратной совместимости
         config = type('Config', (), {'gitlab_url': url, 'private_token': token})()
         super().__init__(config)
-        self.gl = gitlab.Gitlab(url, private_token=token)
+        self.keyset_projects = keyset_projects
+        self.gl = gitlab.Gitlab(
+            url,
+            private_token=token,
+            obey_rate_limit=True,
+            retry_transient_errors=True,
+            max_retries=rate_limit_retries,
+        )
         self.gl.auth()
 
     def get_projects(
-        self, membership: bool = True, project_id: Optional[int] = None, last_activity_after: Optional[str] = None
+        self,
+        membership: bool = True,
+        project_id: Optional[int] = None,
+        last_activity_after: Optional[str] = None,
+        keyset: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
-        """Получить список проектов с опциональной фильтрацией по активности"""
+        """
+        Получить список проектов с опциональной фильтрацией по активности.
+
+        С keyset-пагинацией python-gitlab следует по ссылке Link rel="next",
+        и стоимость страницы не растет с глубиной листания.
+        По умолчанию используется значение keyset_projects.
+        """
         if project_id:
             project = self.gl.projects.get(project_id)
             return [project.asdict()]
 
         # Добавляем фильтрацию по дате последней активности если указана
-        kwargs = {"membership": membership, "get_all": True}
+        kwargs = {"membership": membership}
         if last_activity_after:
             kwargs["last_activity_after"] = last_activity_after
-            
-        projects = self.gl.projects.list(**kwargs)
+
+        if self.keyset_projects if keyset is None else keyset:
+            projects = self.gl.projects.list(
+                iterator=True,
+                pagination="keyset",
+                order_by="id",
+                sort="asc",
+                per_page=100,
+                **kwargs,
+            )
+        else:
+            projects = self.gl.projects.list(get_all=True, **kwargs)
         return [project.asdict() for project in projects]
 
     def get_project_events(
@@ -39,8 +83,14 @@ class GitLabAPI(BaseGitLabAPI):
         after: Optional[str] = None,
         sort: str = "desc",
         action: Optional[str] = None,
+        since_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Получить события проекта."""
+        """
+        Получить события проекта.
+
+        Если указан since_id, события читаются от новых к старым
+        и листание прекращается на первом событии с ID не выше since_id.
+        """
         project = self.gl.projects.get(project_id)
 
         params = {}
@@ -51,9 +101,34 @@ class GitLabAPI(BaseGitLabAPI):
         if action:
             params["action"] = action
 
+        if since_id is not None:
+            params["sort"] = "desc"
+            # Страницы запрашиваются по мере чтения итератора
+            events = project.events.list(iterator=True, per_page=100, **params)
+            return list(iter_until_watermark(events, since_id, "id"))
+
         events = project.events.list(get_all=True, **params)
         return [event.asdict() for event in events]
 
+    def get_user_events(
+        self,
+        after: Optional[str] = None,
+        since_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Получить ленту событий всех проектов пользователя одним списком.
+
+        События читаются от новых к старым, и листание прекращается
+        на первом событии с ID не выше since_id.
+        """
+        params = {"scope": "all", "sort": "desc"}
+        if after:
+            params["after"] = after
+
+        # Страницы запрашиваются по мере чтения итератора
+        events = self.gl.events.list(iterator=True, per_page=100, **params)
+        return list(iter_until_watermark(events, since_id, "id"))
+
     def get_recent_events(
         self, project_id: int, limit: int = 10
     ) -> List[Dict[str, Any]]:
@@ -82,59 +157,93 @@ class GitLabAPI(BaseGitLabAPI):
         project = self.gl.projects.get(project_id)
         return project.asdict()
 
+    def _list_project_resource(
+        self, manager: Any, resource: str, watermark: Watermark = None, **params
+    ) -> List[Dict[str, Any]]:
+        """
+        Получить список объектов проекта до водяного знака.
+
+        Объекты читаются ленивым итератором по убыванию поля сортировки,
+        поэтому страницы за водяным знаком не запрашиваются.
+        """
+        order_by, watermark_field = ENDPOINT_ORDER[resource]
+        if order_by:
+            params["order_by"] = order_by
+            params["sort"] = "desc"
+        items = manager.list(iterator=True, per_page=100, **params)
+        return list(iter_until_watermark(items, watermark, watermark_field))
+
     def get_project_merge_requests(
-        self, project_id: int, state: str = "opened", updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        state: str = "opened",
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Получить merge requests проекта."""
         project = self.gl.projects.get(project_id)
         params = {"state": state}
         if updated_after:
             params["updated_after"] = updated_after
-        mrs = project.mergerequests.list(get_all=True, **params)
-        return [mr.asdict() for mr in mrs]
+        return self._list_project_resource(
+            project.mergerequests, "merge_requests", watermark, **params
+        )
 
     def get_project_issues(
-        self, project_id: int, state: str = "opened", updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        state: str = "opened",
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Получить задачи проекта."""
         project = self.gl.projects.get(project_id)
         params = {"state": state}
         if updated_after:
             params["updated_after"] = updated_after
-        issues = project.issues.list(get_all=True, **params)
-        return [issue.asdict() for issue in issues]
+        return self._list_project_resource(project.issues, "issues", watermark, **params)
 
     def get_project_pipelines(
-        self, project_id: int, updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Получить pipelines проекта."""
         project = self.gl.projects.get(project_id)
         params = {}
         if updated_after:
             params["updated_after"] = updated_after
-        pipelines = project.pipelines.list(get_all=True, **params)
-        return [pipeline.asdict() for pipeline in pipelines]
+        return self._list_project_resource(project.pipelines, "pipelines", watermark, **params)
 
     def get_project_jobs(
-        self, project_id: int, updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Получить jobs проекта."""
+        """
+        Получить jobs проекта.
+
+        API jobs не фильтрует по дате обновления, поэтому updated_after
+        используется как водяной знак по дате создания, если он не задан.
+        """
         project = self.gl.projects.get(project_id)
-        params = {}
-        if updated_after:
-            params["updated_after"] = updated_after
-        jobs = project.jobs.list(get_all=True, **params)
-        return [job.asdict() for job in jobs]
+        return self._list_project_resource(project.jobs, "jobs", watermark or updated_after)
 
     def get_project_deployments(
-        self, project_id: int, updated_after: Optional[str] = None
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Получить deployments проекта."""
         project = self.gl.projects.get(project_id)
         params = {}
         if updated_after:
             params["updated_after"] = updated_after
-        deployments = project.deployments.list(get_all=True, **params)
-        return [deployment.asdict() for deployment in deployments]
+        return self._list_project_resource(
+            project.deployments, "deployments", watermark, **params
+        )
 
     # Методы форматирования дат и событий теперь наследуются от базового класса
@@ -0,0 +1,237 @@
+"""Пакетное получение pipelines и jobs многих проектов через GraphQL API."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from .resilience import APIRequestError
+
+PIPELINES_QUERY = """
+query($paths: [String!], $count: Int, $updatedAfter: Time, $pipelines: Int, $jobs: Int) {
+  projects(fullPaths: $paths, first: $count) {
+    nodes {
+      fullPath
+      pipelines(updatedAfter: $updatedAfter, first: $pipelines) {
+        pageInfo { hasNextPage }
+        nodes {
+          id
+          status
+          ref
+          sha
+          source
+          path
+          duration
+          createdAt
+          updatedAt
+          user { username name }
+          jobs(first: $jobs) {
+            pageInfo { hasNextPage }
+            nodes {
+              id
+              name
+              status
+              stage { name }
+              webPath
+              duration
+              createdAt
+              finishedAt
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def parse_global_id(global_id: Any) -> Optional[int]:
+    """Получить числовой ID из глобального ID GraphQL (gid://gitlab/Ci::Pipeline/123)"""
+    try:
+        return int(str(global_id).rsplit("/", 1)[-1])
+    except ValueError:
+        return None
+
+
+def pipeline_from_node(node: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+    """Привести pipeline из GraphQL к виду ответа REST API"""
+    path = node.get("path")
+    return {
+        "id": parse_global_id(node.get("id")),
+        "status": (node.get("status") or "").lower(),
+        "ref": node.get("ref"),
+        "sha": node.get("sha"),
+        "source": (node.get("source") or "").lower(),
+        "duration": node.get("duration"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "web_url": f"{base_url}{path}" if path else "",
+        "user": node.get("user"),
+    }
+
+
+def job_from_node(
+    node: Dict[str, Any], pipeline: Dict[str, Any], base_url: str
+) -> Dict[str, Any]:
+    """Привести job из GraphQL к виду ответа REST API"""
+    web_path = node.get("webPath")
+    return {
+        "id": parse_global_id(node.get("id")),
+        "name": node.get("name"),
+        "status": (node.get("status") or "").lower(),
+        "stage": (node.get("stage") or {}).get("name", ""),
+        "ref": pipeline.get("ref"),
+        "duration": node.get("duration"),
+        "created_at": node.get("createdAt"),
+        "finished_at": node.get("finishedAt"),
+        "web_url": f"{base_url}{web_path}" if web_path else "",
+        "user": pipeline.get("user"),
+        "pipeline": {"id": pipeline.get("id"), "status": pipeline.get("status")},
+    }
+
+
+class GraphQLCIFetcher:
+    """
+    Получение pipelines и jobs пакетами проектов одним GraphQL запросом.
+
+    prefetch() запрашивает свежие pipelines вместе со статусами их jobs
+    для проектов по их полным путям, разбивая проекты на пакеты по
+    batch_size, чтобы не превысить ограничение сложности запроса.
+    get_project_pipelines() и get_project_jobs() повторяют интерфейс
+    AsyncGitLabAPI: для проектов, полностью покрытых пакетным запросом,
+    возвращаются подготовленные данные, остальные запрашиваются через REST.
+    """
+
+    def __init__(
+        self,
+        api,
+        batch_size: int = 10,
+        pipelines_per_project: int = 20,
+        jobs_per_pipeline: int = 50,
+    ):
+        """
+        Инициализация загрузчика.
+
+        Args:
+            api: Асинхронный клиент GitLab API
+            batch_size: Число проектов в одном GraphQL запросе
+            pipelines_per_project: Сколько pipelines проекта запрашивать
+            jobs_per_pipeline: Сколько jobs pipeline запрашивать
+        """
+        self.api = api
+        self.batch_size = batch_size
+        self.pipelines_per_project = pipelines_per_project
+        self.jobs_per_pipeline = jobs_per_pipeline
+        self._pipelines: Dict[int, List[Dict[str, Any]]] = {}
+        self._jobs: Dict[int, List[Dict[str, Any]]] = {}
+        # Число GraphQL запросов с последнего reset()
+        self.requests = 0
+
+    def reset(self):
+        """Забыть данные предыдущего цикла"""
+        self._pipelines.clear()
+        self._jobs.clear()
+        self.requests = 0
+
+    async def prefetch(self, projects: List[Dict[str, Any]], updated_after: Optional[str] = None):
+        """
+        Загрузить pipelines и jobs проектов для текущего цикла.
+
+        Данные добавляются к уже загруженным, поэтому проекты можно
+        загружать по мере получения страниц списка; в начале цикла
+        нужно вызвать reset().
+
+        Если данных проекта больше, чем помещается в одну страницу запроса,
+        проект остается на REST API. Ошибка пакетного запроса не прерывает
+        цикл: его проекты тоже проверяются через REST API.
+
+        Args:
+            projects: Проекты с полем path_with_namespace
+            updated_after: Дата, после которой обновлены pipelines
+        """
+        ids_by_path = {
+            project["path_with_namespace"]: project["id"]
+            for project in projects
+            if project.get("path_with_namespace")
+        }
+        paths = list(ids_by_path)
+        chunks = [paths[i:i + self.batch_size] for i in range(0, len(paths), self.batch_size)]
+        results = await asyncio.gather(
+            *(self._fetch_chunk(chunk, updated_after) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, APIRequestError):
+                print(f"⚠️  GraphQL запрос pipelines не выполнен, используется REST API: {result}")
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            for node in result:
+                project_id = ids_by_path.get(node.get("fullPath"))
+                if project_id is not None:
+                    self._store_project(project_id, node)
+
+    async def _fetch_chunk(
+        self, paths: List[str], updated_after: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Запросить pipelines пакета проектов"""
+        self.requests += 1
+        data = await self.api.graphql(
+            PIPELINES_QUERY,
+            {
+                "paths": paths,
+                "count": len(paths),
+                "updatedAfter": updated_after,
+                "pipelines": self.pipelines_per_project,
+                "jobs": self.jobs_per_pipeline,
+            },
+        )
+        return ((data.get("projects") or {}).get("nodes")) or []
+
+    def _store_project(self, project_id: int, node: Dict[str, Any]):
+        """Сохранить pipelines и jobs проекта в виде ответов REST API"""
+        connection = node.get("pipelines") or {}
+        if (connection.get("pageInfo") or {}).get("hasNextPage"):
+            # Не все pipelines поместились в запрос
+            return
+
+        pipelines = []
+        jobs = []
+        jobs_complete = True
+        for pipeline_node in connection.get("nodes") or []:
+            pipeline = pipeline_from_node(pipeline_node, self.api.url)
+            pipelines.append(pipeline)
+            job_connection = pipeline_node.get("jobs") or {}
+            if (job_connection.get("pageInfo") or {}).get("hasNextPage"):
+                jobs_complete = False
+            for job_node in job_connection.get("nodes") or []:
+                jobs.append(job_from_node(job_node, pipeline, self.api.url))
+
+        self._pipelines[project_id] = pipelines
+        if jobs_complete:
+            self._jobs[project_id] = sorted(jobs, key=lambda job: job["id"] or 0, reverse=True)
+
+    async def get_project_pipelines(
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Получить pipelines проекта из пакетного запроса или через REST API"""
+        if project_id in self._pipelines:
+            return self._pipelines[project_id]
+        return await self.api.get_project_pipelines(
+            project_id, updated_after=updated_after, watermark=watermark
+        )
+
+    async def get_project_jobs(
+        self,
+        project_id: int,
+        updated_after: Optional[str] = None,
+        watermark: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Получить jobs проекта из пакетного запроса или через REST API"""
+        if project_id in self._jobs:
+            return self._jobs[project_id]
+        return await self.api.get_project_jobs(
+            project_id, updated_after=updated_after, watermark=watermark
+        )
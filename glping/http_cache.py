@@ -0,0 +1,131 @@
+"""Кеш валидаторов HTTP (ETag) для условных запросов к GitLab API."""
+
+import json
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Заголовки ответа, которые нужны при повторном использовании тела:
+# без них пагинатор не найдет следующую страницу
+STORED_HEADERS = ("X-Next-Page", "X-Total-Pages", "X-Total", "X-Page", "X-Per-Page", "Link")
+
+# Списки, ответы которых между циклами обычно не меняются: проекты, pipelines
+# и deployments проекта. Страницы событий и jobs каждый раз другие, и их
+# тела только занимали бы память и файл кеша
+CACHEABLE_PATH = re.compile(r"/api/v4/projects(/[^/]+/(pipelines|deployments))?$")
+
+
+class ValidatorCache:
+    """
+    Кеш ETag и тел ответов, ключом служат URL и параметры запроса.
+
+    Для сохраненного ответа запрос отправляется с If-None-Match, и на
+    304 Not Modified возвращается сохраненное тело без повторного разбора
+    JSON. Сохраняются только ответы списков из CACHEABLE_PATH, и не более
+    max_entries, давно не использованные вытесняются. При указании
+    cache_file кеш сохраняется между запусками.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, max_entries: int = 1000):
+        """
+        Инициализация кеша.
+
+        Args:
+            cache_file: Файл для сохранения кеша между запусками (None — только в памяти)
+            max_entries: Максимальное число сохраненных ответов
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if cache_file:
+            self._load()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Построить ключ кеша по URL и параметрам запроса"""
+        if not params:
+            return url
+        query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+        return f"{url}?{query}"
+
+    @staticmethod
+    def is_cacheable(url: str) -> bool:
+        """Сохранять ли ответы на запросы к этому URL"""
+        return bool(CACHEABLE_PATH.search(urlsplit(url).path))
+
+    def get_etag(self, key: str) -> Optional[str]:
+        """Получить ETag сохраненного ответа"""
+        entry = self._entries.get(key)
+        return entry["etag"] if entry else None
+
+    def store(self, key: str, etag: str, body: Any, headers: Mapping[str, str]):
+        """
+        Сохранить ответ с ETag.
+
+        Args:
+            key: Ключ запроса
+            etag: Значение заголовка ETag
+            body: Разобранное тело ответа
+            headers: Заголовки ответа
+        """
+        self.misses += 1
+        self._entries[key] = {
+            "etag": etag,
+            "body": body,
+            "headers": {name: headers[name] for name in STORED_HEADERS if name in headers},
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def reuse(self, key: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """
+        Получить сохраненный ответ после 304 Not Modified.
+
+        Returns:
+            Кортеж (тело, заголовки) или None, если ответа нет
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry["body"], dict(entry["headers"])
+
+    def discard(self, key: str):
+        """Удалить сохраненный ответ"""
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self):
+        """Загрузить кеш из файла"""
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            for key, entry in entries.items():
+                self._entries[key] = entry
+        except (json.JSONDecodeError, IOError, AttributeError) as e:
+            print(f"⚠️  Ошибка при загрузке HTTP кеша {self.cache_file}: {e}")
+            self._entries.clear()
+
+    def save(self):
+        """Сохранить кеш в файл, если он задан"""
+        if not self.cache_file:
+            return
+        try:
+            directory = os.path.dirname(self.cache_file) or "."
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_file)
+        except IOError as e:
+            print(f"Предупреждение: Не удалось сохранить HTTP кеш: {e}")
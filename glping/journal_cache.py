@@ -0,0 +1,197 @@
+"""Кеш событий GitLab с журналом изменений (append-only)."""
+
+import json
+import os
+import threading
+from typing import Any, Dict, IO, Iterable, List, Optional, Tuple
+
+from .cache import Cache, encode_cache_value
+
+
+class JournalCache(Cache):
+    """
+    Кеш со снимком в JSON файле и журналом изменений.
+
+    Каждое изменение дописывается в журнал отдельной строкой JSON, поэтому
+    стоимость записи не зависит от размера кеша. Когда журнал превышает
+    journal_max_bytes, он сворачивается в снимок в фоновом потоке.
+    При запуске состояние восстанавливается из снимка и хвоста журнала.
+    """
+
+    def __init__(
+        self,
+        cache_file: str = "cache.json",
+        journal_max_bytes: int = 1024 * 1024,
+        **options,
+    ):
+        """
+        Инициализация кеша.
+
+        Args:
+            cache_file: Путь к файлу снимка кеша
+            journal_max_bytes: Размер журнала, после которого выполняется компактизация
+            **options: Параметры отложенной записи базового кеша
+        """
+        self.journal_max_bytes = journal_max_bytes
+        self.journal_file = ""
+        self._journal: Optional[IO[str]] = None
+        self._journal_size = 0
+        self._replayed_records = 0
+        self._lock = threading.RLock()
+        self._compaction: Optional[threading.Thread] = None
+        super().__init__(cache_file, **options)
+
+        # Восстановленный журнал сразу сворачиваем в снимок,
+        # заодно отбрасывая оборванную при сбое последнюю запись
+        if self._replayed_records or os.path.exists(self._rotated_journal_file):
+            self._save_cache()
+
+    @property
+    def _rotated_journal_file(self) -> str:
+        """Путь к журналу, который сворачивается в снимок"""
+        return self.journal_file + ".old"
+
+    def _resolve_cache_path(self, cache_file: str) -> str:
+        """Получить путь к снимку и журналу кеша"""
+        path = super()._resolve_cache_path(cache_file)
+        self.journal_file = path + ".journal"
+        return path
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Загрузка снимка кеша и воспроизведение журнала"""
+        self.data = super()._load_cache()
+        for journal_file in (self._rotated_journal_file, self.journal_file):
+            for section, key, value in self._read_journal(journal_file):
+                self._set_record(section, key, value)
+                self._replayed_records += 1
+        if self._replayed_records:
+            print(f"🔄 Восстановлено записей из журнала кеша: {self._replayed_records}")
+        return self.data
+
+    def _read_journal(self, journal_file: str) -> List[Tuple[str, str, Any]]:
+        """Прочитать записи журнала до первой поврежденной строки"""
+        records: List[Tuple[str, str, Any]] = []
+        if not os.path.exists(journal_file):
+            return records
+        try:
+            with open(journal_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        records.append((record["s"], record["k"], record["v"]))
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        # Запись оборвана при сбое, дальше данных нет
+                        break
+        except IOError as e:
+            print(f"⚠️  Ошибка при чтении журнала кеша {journal_file}: {e}")
+        return records
+
+    def _encode_changes(self, changes: Iterable[Tuple[str, str]]) -> str:
+        """Сериализовать изменения в строки журнала"""
+        return "".join(
+            json.dumps(
+                {"s": section, "k": key, "v": self._get_record(section, key)},
+                ensure_ascii=False,
+                default=encode_cache_value,
+            )
+            + "\n"
+            for section, key in changes
+        )
+
+    def _append(self, lines: str):
+        """Дописать строки в журнал и сбросить их на диск"""
+        if not lines:
+            return
+        try:
+            with self._lock:
+                if self._journal is None:
+                    self._journal = open(self.journal_file, "a", encoding="utf-8")
+                    self._journal_size = os.path.getsize(self.journal_file)
+                self._journal.write(lines)
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+                self._journal_size += len(lines.encode("utf-8"))
+        except IOError as e:
+            print(f"Предупреждение: Не удалось записать журнал кеша: {e}")
+
+    def _prepare_write(self, changes: Iterable[Tuple[str, str]]) -> str:
+        """Сериализовать изменения в строки журнала"""
+        return self._encode_changes(changes)
+
+    def _commit_write(self, payload: str):
+        """Дописать изменения в журнал"""
+        self._append(payload)
+
+    def _after_write(self):
+        """Запустить компактизацию, если журнал превысил порог"""
+        if self._journal_size >= self.journal_max_bytes:
+            self.compact()
+
+    def compact(self):
+        """
+        Свернуть журнал в снимок в фоновом потоке.
+
+        Данные сериализуются сразу, журнал переименовывается, а новые
+        изменения пишутся в новый журнал, пока снимок сохраняется на диск.
+        """
+        with self._lock:
+            if self._compaction is not None and self._compaction.is_alive():
+                return
+            if os.path.exists(self._rotated_journal_file):
+                # Предыдущая компактизация не завершилась, сворачиваем синхронно
+                self._save_cache()
+                return
+
+            content = self._dump_data()
+            self._close_journal()
+            if os.path.exists(self.journal_file):
+                os.replace(self.journal_file, self._rotated_journal_file)
+
+            self._compaction = threading.Thread(
+                target=self._write_snapshot, args=(content,), daemon=True
+            )
+            self._compaction.start()
+
+    def _write_snapshot(self, content: str):
+        """Сохранить снимок и удалить свернутый журнал"""
+        if self._write_cache_file(content):
+            self._remove_file(self._rotated_journal_file)
+
+    def _save_cache(self):
+        """Синхронно сохранить снимок и очистить журнал"""
+        with self._lock:
+            self._wait_compaction()
+            if self._write_cache_file(self._dump_data()):
+                self._close_journal()
+                self._remove_file(self._rotated_journal_file)
+                self._remove_file(self.journal_file)
+
+    def _wait_compaction(self):
+        """Дождаться завершения фоновой компактизации"""
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+
+    def _close_journal(self):
+        """Закрыть файл журнала"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._journal_size = 0
+
+    @staticmethod
+    def _remove_file(path: str):
+        """Удалить файл, если он существует"""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Предупреждение: Не удалось удалить {path}: {e}")
+
+    def close(self):
+        """Записать несохраненные изменения и закрыть журнал"""
+        super().close()
+        with self._lock:
+            self._wait_compaction()
+            self._close_journal()
@@ -30,15 +30,15 @@ def _handle_test_operations(test_notification, test_stacking, reset_cache, reset
         return True
     
     if reset_cache:
-        from .cache import Cache
-        cache = Cache(config.cache_file)
+        from .cache import create_cache
+        cache = create_cache(config.cache_file, **config.get_cache_options())
         cache.reset()
         print("Кеш успешно очищен")
         return True
     
     if reset_installation_date:
-        from .cache import Cache
-        cache = Cache(config.cache_file)
+        from .cache import create_cache
+        cache = create_cache(config.cache_file, **config.get_cache_options())
         cache.reset_installation_date()
         return True
     
@@ -0,0 +1,160 @@
+"""Клиентское ограничение частоты запросов по заголовкам RateLimit GitLab."""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from .resilience import APIRequestError
+
+
+class RateLimitError(APIRequestError):
+    """GitLab продолжает отвечать 429 Too Many Requests после ожидания"""
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Разобрать заголовок Retry-After.
+
+    Args:
+        value: Число секунд или HTTP-дата
+        now: Текущее время UNIX (по умолчанию time.time())
+
+    Returns:
+        Сколько секунд ждать или None, если заголовок не разобран
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class RateLimiter:
+    """
+    Корзина токенов, следующая за бюджетом запросов, который сообщает GitLab.
+
+    Пока остаток RateLimit-Remaining больше reserve от RateLimit-Limit,
+    запросы не задерживаются. Ниже этого порога оставшиеся запросы
+    равномерно распределяются до RateLimit-Reset, а при исчерпании бюджета
+    или ответе 429 все запросы ждут Retry-After (или сброса лимита).
+    Ожидание общее для всех задач, поэтому замедляется весь конвейер.
+    """
+
+    def __init__(
+        self,
+        reserve: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ):
+        """
+        Инициализация ограничителя.
+
+        Args:
+            reserve: Доля бюджета, ниже которой запросы распределяются до сброса лимита
+            clock: Монотонные часы
+            sleep: Функция асинхронного ожидания
+        """
+        self.reserve = reserve
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = asyncio.Lock()
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._blocked_until = 0.0
+        self._last_request = 0.0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.throttled_responses = 0
+
+    def _delay(self) -> float:
+        """Сколько ждать перед следующим запросом"""
+        now = self._clock()
+        if self._blocked_until > now:
+            return self._blocked_until - now
+        if self.limit is None or self.remaining is None or self._reset_at is None:
+            return 0.0
+        if now >= self._reset_at:
+            # Окно лимита сменилось, бюджет восстановлен
+            self.remaining = self.limit
+            self._reset_at = None
+            return 0.0
+        if self.remaining > self.limit * self.reserve:
+            return 0.0
+        if self.remaining <= 0:
+            return self._reset_at - now
+        interval = (self._reset_at - now) / self.remaining
+        return max(0.0, self._last_request + interval - now)
+
+    async def acquire(self):
+        """Дождаться разрешения на запрос"""
+        async with self._lock:
+            delay = self._delay()
+            if delay > 0:
+                self.waits += 1
+                self.wait_time += delay
+                await self._sleep(delay)
+            self._last_request = self._clock()
+            if self.remaining is not None and self.remaining > 0:
+                self.remaining -= 1
+
+    def update(self, headers: Mapping[str, str], status: int = 200) -> Optional[float]:
+        """
+        Учесть заголовки ответа.
+
+        Args:
+            headers: Заголовки ответа GitLab
+            status: HTTP статус ответа
+
+        Returns:
+            Сколько секунд ждать перед повтором для ответа 429, иначе None
+        """
+        now = self._clock()
+        try:
+            if headers.get("RateLimit-Limit"):
+                self.limit = int(headers["RateLimit-Limit"])
+            if headers.get("RateLimit-Remaining"):
+                self.remaining = int(headers["RateLimit-Remaining"])
+            if headers.get("RateLimit-Reset"):
+                # RateLimit-Reset — время сброса в секундах UNIX
+                reset_in = max(0.0, float(headers["RateLimit-Reset"]) - time.time())
+                self._reset_at = now + reset_in
+        except ValueError:
+            pass
+
+        if status != 429:
+            return None
+
+        self.throttled_responses += 1
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is None:
+            retry_after = self._reset_at - now if self._reset_at is not None else 1.0
+        self._blocked_until = max(self._blocked_until, now + retry_after)
+        return retry_after
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Получить состояние ограничителя для вывода и метрик.
+
+        Returns:
+            Словарь: limit, remaining, reset_in (сек), waits, wait_time,
+            throttled_responses (число ответов 429)
+        """
+        reset_in = None
+        if self._reset_at is not None:
+            reset_in = max(0.0, self._reset_at - self._clock())
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_in": reset_in,
+            "waits": self.waits,
+            "wait_time": self.wait_time,
+            "throttled_responses": self.throttled_responses,
+        }
@@ -0,0 +1,151 @@
+"""Повторы запросов с экспоненциальной задержкой и автоматический выключатель."""
+
+import asyncio
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Статусы, после которых GET запрос имеет смысл повторить
+RETRYABLE_STATUSES = frozenset({408, 500, 502, 503, 504})
+
+
+class APIRequestError(Exception):
+    """Данные не получены: вызывающий код не должен считать их пустыми"""
+
+
+class CircuitOpenError(APIRequestError):
+    """Автоматический выключатель разомкнут, запрос не отправлялся"""
+
+
+class RetryPolicy:
+    """
+    Политика повторов с ограниченной экспоненциальной задержкой.
+
+    Перед повтором номер attempt (с нуля) выжидается случайное время
+    от 0 до min(max_delay, base_delay * 2 ** attempt) — «полный джиттер»,
+    чтобы одновременно упавшие запросы не повторялись синхронно.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        rng: Callable[[], float] = random.random,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ):
+        """
+        Инициализация политики.
+
+        Args:
+            max_retries: Сколько раз повторять запрос после ошибки
+            base_delay: Верхняя граница задержки перед первым повтором (сек)
+            max_delay: Предельная задержка (сек)
+            rng: Генератор случайных чисел в [0, 1)
+            sleep: Функция асинхронного ожидания
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng
+        self._sleep = sleep
+        self.retries = 0
+
+    def backoff(self, attempt: int) -> float:
+        """Задержка перед повтором номер attempt"""
+        return self._rng() * min(self.max_delay, self.base_delay * 2 ** attempt)
+
+    async def wait(self, attempt: int):
+        """Выждать перед повтором номер attempt"""
+        self.retries += 1
+        await self._sleep(self.backoff(attempt))
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель для одного хоста.
+
+    После failure_threshold ошибок подряд выключатель размыкается, и запросы
+    сразу завершаются CircuitOpenError. Через reset_timeout секунд один
+    пробный запрос пропускается: успех замыкает выключатель, ошибка
+    размыкает его снова.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Инициализация выключателя.
+
+        Args:
+            failure_threshold: Число ошибок подряд до размыкания
+            reset_timeout: Через сколько секунд пропустить пробный запрос
+            clock: Монотонные часы
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+
+    def before_request(self):
+        """
+        Проверить, можно ли отправить запрос.
+
+        Raises:
+            CircuitOpenError: Выключатель разомкнут или пробный запрос уже отправлен
+        """
+        if self.state == self.CLOSED:
+            return
+        if self.state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError(
+            f"GitLab недоступен: {self.failures} ошибок подряд, "
+            f"запросы приостановлены на {self.reset_timeout:.0f}с"
+        )
+
+    def record_success(self):
+        """Учесть успешный запрос"""
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        """Учесть неудачный запрос"""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """Освободить пробный запрос, не учитывая его исход (например, после отмены)"""
+        self._probe_in_flight = False
+
+    def get_state(self) -> Dict[str, Any]:
+        """Получить состояние выключателя для вывода и метрик"""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+        }
+
+
+def is_retryable_status(status: Optional[int]) -> bool:
+    """Можно ли повторить запрос, завершившийся этим HTTP статусом"""
+    return status in RETRYABLE_STATUSES
@@ -0,0 +1,204 @@
+"""Расписание проверки проектов с горячим и холодным уровнями."""
+
+import heapq
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Статусы незавершенных pipelines, jobs и deployments: пока они есть,
+# проект остается горячим
+ACTIVE_CI_STATUSES = frozenset({
+    "created",
+    "waiting_for_resource",
+    "preparing",
+    "pending",
+    "running",
+    "scheduled",
+})
+
+
+def has_active_ci(items: Iterable[Dict[str, Any]]) -> bool:
+    """Есть ли среди pipelines, jobs или deployments незавершенные"""
+    return any(item.get("status") in ACTIVE_CI_STATUSES for item in items)
+
+
+class PollScheduler:
+    """
+    Очередь проектов с приоритетом по времени следующей проверки.
+
+    Проект попадает в расписание после первой проверки. Пока с его последней
+    активности (новых событий, незавершенного CI или более нового
+    last_activity_at в списке проектов) прошло меньше hot_window секунд,
+    проект горячий и проверяется каждые hot_interval секунд. Затем интервал
+    удваивается после каждой проверки без активности до max_interval, а
+    после проверки с этим интервалом проект покидает расписание: дальше его
+    будит только активность в списке проектов. Поэтому расписание не
+    добавляет постоянных запросов к проектам без активности.
+
+    Незавершенные pipelines, jobs и deployments запоминаются до получения
+    их конечного статуса: списки CI отбираются по updated_after, и долго
+    идущий pipeline без изменений в них не попадает, но проект с ним
+    остается горячим.
+
+    Проверки, время которых наступает в пределах tolerance секунд,
+    извлекаются вместе, чтобы разнесенные по времени проекты не дробили
+    циклы проверки.
+
+    Кроме времени следующей проверки запоминается время начала последней
+    успешной проверки проекта: после долгого перерыва события проекта
+    отбираются с этого момента, а не с последнего цикла.
+
+    Расписание хранится в памяти процесса.
+    """
+
+    def __init__(
+        self,
+        hot_interval: float = 60,
+        max_interval: float = 3600,
+        hot_window: float = 1800,
+        backoff: float = 2.0,
+        tolerance: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Инициализация расписания.
+
+        Args:
+            hot_interval: Интервал проверки горячего проекта (сек)
+            max_interval: Наибольший интервал проверки холодного проекта (сек)
+            hot_window: Сколько секунд после активности проект остается горячим
+            backoff: Множитель интервала после проверки без активности
+            tolerance: На сколько секунд раньше срока можно проверить проект
+                (по умолчанию половина hot_interval)
+            clock: Монотонные часы
+        """
+        self.hot_interval = hot_interval
+        self.max_interval = max(hot_interval, max_interval)
+        self.hot_window = hot_window
+        self.backoff = backoff
+        self.tolerance = hot_interval / 2 if tolerance is None else tolerance
+        self._clock = clock
+        # Куча (время проверки, ID проекта); устаревшие записи пропускаются
+        self._heap: List[Tuple[float, int]] = []
+        self._due: Dict[int, float] = {}
+        self._interval: Dict[int, float] = {}
+        self._active_at: Dict[int, float] = {}
+        self._checked_at: Dict[int, str] = {}
+        # Незавершенные объекты CI проекта: (тип, ID)
+        self._running_ci: Dict[int, Set[Tuple[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        """Число проектов в расписании"""
+        return len(self._due)
+
+    def __contains__(self, project_id: int) -> bool:
+        return project_id in self._due
+
+    def record(self, project_id: int, active: bool, checked_at: str):
+        """
+        Запланировать следующую проверку после успешной проверки проекта.
+
+        Проект с незавершенным CI считается активным. Холодный проект,
+        уже проверенный с интервалом max_interval, убирается из расписания.
+
+        Args:
+            project_id: ID проекта
+            active: Найдена ли активность проекта
+            checked_at: Время начала проверки (ISO 8601)
+        """
+        now = self._clock()
+        if active or project_id in self._running_ci:
+            self._active_at[project_id] = now
+        if now - self._active_at.get(project_id, float("-inf")) < self.hot_window:
+            interval = self.hot_interval
+        else:
+            previous = self._interval.get(project_id, self.hot_interval)
+            if previous >= self.max_interval:
+                self.forget(project_id)
+                return
+            interval = min(self.max_interval, previous * self.backoff)
+        self._interval[project_id] = interval
+        self._checked_at[project_id] = checked_at
+        self._schedule(project_id, now + interval)
+
+    def track_ci(self, project_id: int, kind: str, items: Iterable[Dict[str, Any]]):
+        """
+        Обновить незавершенные объекты CI проекта по полученному списку.
+
+        Args:
+            project_id: ID проекта
+            kind: Тип объектов: pipeline, job или deployment
+            items: Объекты, полученные в этом цикле
+        """
+        running = self._running_ci.get(project_id, set())
+        for item in items:
+            key = (kind, item.get("id"))
+            if item.get("status") in ACTIVE_CI_STATUSES:
+                running.add(key)
+            else:
+                running.discard(key)
+        if running:
+            self._running_ci[project_id] = running
+        else:
+            self._running_ci.pop(project_id, None)
+
+    def has_running_ci(self, project_id: int) -> bool:
+        """Есть ли у проекта незавершенные pipelines, jobs или deployments"""
+        return project_id in self._running_ci
+
+    def retry(self, project_id: int):
+        """Повторить неудавшуюся проверку через интервал горячего проекта"""
+        self._schedule(project_id, self._clock() + self.hot_interval)
+
+    def forget(self, project_id: int):
+        """Убрать проект из расписания"""
+        self._due.pop(project_id, None)
+        self._interval.pop(project_id, None)
+        self._active_at.pop(project_id, None)
+        self._checked_at.pop(project_id, None)
+        self._running_ci.pop(project_id, None)
+
+    def pop_due(self) -> List[int]:
+        """Извлечь проекты, время проверки которых наступило или наступит в пределах tolerance"""
+        now = self._clock()
+        due = []
+        while self._heap and self._heap[0][0] <= now + self.tolerance:
+            when, project_id = heapq.heappop(self._heap)
+            if self._due.get(project_id) == when:
+                del self._due[project_id]
+                due.append(project_id)
+        return due
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Секунд до ближайшей проверки по расписанию или None, если расписание пусто"""
+        while self._heap:
+            when, project_id = self._heap[0]
+            if self._due.get(project_id) == when:
+                return max(0.0, when - self._clock())
+            heapq.heappop(self._heap)
+        return None
+
+    def get_checked_at(self, project_id: int) -> Optional[str]:
+        """Время начала последней успешной проверки проекта (ISO 8601)"""
+        return self._checked_at.get(project_id)
+
+    def is_hot(self, project_id: int) -> bool:
+        """Проверяется ли проект с интервалом горячего проекта"""
+        return self._interval.get(project_id) == self.hot_interval
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Получить состояние расписания для подробного вывода.
+
+        Returns:
+            Словарь: scheduled, hot, next_due_in (сек или None)
+        """
+        return {
+            "scheduled": len(self._due),
+            "hot": sum(1 for project_id in self._due if self.is_hot(project_id)),
+            "next_due_in": self.seconds_until_due(),
+        }
+
+    def _schedule(self, project_id: int, when: float):
+        """Назначить время проверки проекта"""
+        self._due[project_id] = when
+        heapq.heappush(self._heap, (when, project_id))
@@ -0,0 +1,85 @@
+"""Объединение одинаковых одновременных запросов (singleflight)."""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """
+    Группа одновременно выполняемых вызовов с общими результатами.
+
+    Пока вызов с ключом выполняется, повторные вызовы с тем же ключом не
+    запускают его заново, а ждут тот же результат (или то же исключение).
+    После завершения ключ освобождается: результат не кешируется, и
+    следующий вызов выполняется заново.
+    """
+
+    def __init__(self):
+        """Инициализация группы"""
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        # Число вызовов, получивших результат уже выполняемого вызова
+        self.shared = 0
+
+    def __len__(self) -> int:
+        """Число выполняемых вызовов"""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Выполнить вызов или присоединиться к уже выполняемому.
+
+        Отмена одного из ожидающих не отменяет вызов для остальных.
+
+        Args:
+            key: Ключ вызова
+            func: Функция без аргументов, возвращающая корутину
+
+        Returns:
+            Результат вызова
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(functools.partial(self._forget, key))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        """Освободить ключ завершенного вызова"""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Исключение вызова, который больше никто не ждет, не попадает в лог asyncio
+        if not task.cancelled():
+            task.exception()
+
+
+def singleflight(key: Optional[Callable[..., Hashable]] = None):
+    """
+    Декоратор асинхронного метода, объединяющий одинаковые одновременные вызовы.
+
+    Вызовы объединяются в пределах одного объекта; группа создается при
+    первом вызове и хранится в атрибуте _singleflight объекта.
+
+    Args:
+        key: Функция, строящая ключ по аргументам вызова (без self);
+            по умолчанию ключом служат имя метода и все аргументы
+
+    Returns:
+        Декоратор
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            group = self.__dict__.get("_singleflight")
+            if group is None:
+                group = self.__dict__["_singleflight"] = SingleFlight()
+            if key is not None:
+                call_key = (method.__name__, key(*args, **kwargs))
+            else:
+                call_key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            return await group.do(call_key, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
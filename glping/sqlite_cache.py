@@ -0,0 +1,245 @@
+"""Кеш событий GitLab на базе SQLite."""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .cache import Cache, encode_cache_value
+
+
+# SQL-запрос и его параметры
+Statement = Tuple[str, Tuple[Any, ...]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS projects (
+    project_id INTEGER PRIMARY KEY,
+    last_event_id INTEGER,
+    events TEXT,
+    watermarks TEXT
+);
+CREATE TABLE IF NOT EXISTS project_activity (
+    project_id INTEGER PRIMARY KEY,
+    last_activity_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_project_activity_last_activity_at
+    ON project_activity (last_activity_at);
+CREATE TABLE IF NOT EXISTS project_paths (
+    project_id INTEGER PRIMARY KEY,
+    path TEXT
+);
+CREATE TABLE IF NOT EXISTS project_catalogue (
+    project_id INTEGER PRIMARY KEY,
+    path TEXT,
+    name TEXT,
+    last_activity_at TEXT
+);
+"""
+
+
+class SQLiteCache(Cache):
+    """
+    Кеш с хранением в SQLite (режим WAL).
+
+    Данные по-прежнему доступны через self.data, но каждое изменение
+    сохраняется построчным upsert вместо перезаписи всего файла.
+    При первом запуске автоматически импортируется существующий JSON кеш.
+    """
+
+    def __init__(self, cache_file: str = "cache.json", **options):
+        """Инициализация кеша"""
+        self.json_file = ""
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        super().__init__(cache_file, **options)
+
+    def _resolve_cache_path(self, cache_file: str) -> str:
+        """Получить путь к базе данных рядом с JSON файлом кеша"""
+        self.json_file = super()._resolve_cache_path(cache_file)
+        return os.path.splitext(self.json_file)[0] + ".db"
+
+    def _connect(self) -> sqlite3.Connection:
+        """Открыть соединение с базой и создать схему"""
+        conn = sqlite3.connect(
+            self.cache_file, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(projects)")}
+        if "watermarks" not in columns:
+            # База создана предыдущей версией
+            conn.execute("ALTER TABLE projects ADD COLUMN watermarks TEXT")
+        return conn
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Загрузка кеша из базы данных"""
+        try:
+            self._conn = self._connect()
+            has_data = self._conn.execute("SELECT 1 FROM metadata LIMIT 1").fetchone()
+        except sqlite3.Error as e:
+            print(f"⚠️  Ошибка при открытии базы кеша {self.cache_file}: {e}")
+            raise
+
+        if not has_data:
+            # Первый запуск: импортируем существующий JSON кеш
+            data = self._read_cache_file(self.json_file)
+            data["project_activity"] = {
+                int(k): v for k, v in data.get("project_activity", {}).items()
+            }
+            if os.path.exists(self.json_file):
+                print(f"🔄 Импорт данных из {self.json_file}")
+            self._write_all(data)
+            return data
+
+        data: Dict[str, Any] = {
+            "metadata": {},
+            "projects": {},
+            "project_activity": {},
+            "project_paths": {},
+            "project_catalogue": {},
+        }
+        for key, value in self._conn.execute("SELECT key, value FROM metadata"):
+            data["metadata"][key] = json.loads(value)
+        for project_id, last_event_id, events, watermarks in self._conn.execute(
+            "SELECT project_id, last_event_id, events, watermarks FROM projects"
+        ):
+            project: Dict[str, Any] = {}
+            if last_event_id is not None:
+                project["last_event_id"] = last_event_id
+            if events is not None:
+                project["events"] = json.loads(events)
+            if watermarks is not None:
+                project["watermarks"] = json.loads(watermarks)
+            data["projects"][str(project_id)] = project
+        for project_id, activity in self._conn.execute(
+            "SELECT project_id, last_activity_at FROM project_activity"
+        ):
+            data["project_activity"][project_id] = activity
+        for project_id, path in self._conn.execute(
+            "SELECT project_id, path FROM project_paths"
+        ):
+            data["project_paths"][str(project_id)] = path
+        for project_id, path, name, last_activity_at in self._conn.execute(
+            "SELECT project_id, path, name, last_activity_at FROM project_catalogue"
+        ):
+            data["project_catalogue"][str(project_id)] = {
+                "path": path,
+                "name": name,
+                "last_activity_at": last_activity_at,
+            }
+        return data
+
+    def _write_all(self, data: Dict[str, Any]):
+        """Перезаписать содержимое базы одной транзакцией"""
+        statements: List[Statement] = [
+            (f"DELETE FROM {table}", ())
+            for table in (
+                "metadata", "projects", "project_activity", "project_paths", "project_catalogue"
+            )
+        ]
+        for key in data.get("metadata", {}):
+            statements.append(self._upsert_statement(data, "metadata", key))
+        for section in ("projects", "project_activity", "project_paths", "project_catalogue"):
+            for key in data.get(section, {}):
+                statements.append(self._upsert_statement(data, section, str(key)))
+        self._execute_transaction(statements)
+
+    def _execute_transaction(self, statements: List[Statement]):
+        """Выполнить запросы одной транзакцией"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for sql, params in statements:
+                    self._conn.execute(sql, params)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _upsert_statement(self, data: Dict[str, Any], section: str, key: str) -> Statement:
+        """Построить upsert для одной записи раздела кеша"""
+        if section == "metadata":
+            return (
+                "INSERT INTO metadata (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, json.dumps(data["metadata"].get(key), ensure_ascii=False)),
+            )
+        if section == "projects":
+            project = data["projects"].get(key, {})
+            events = project.get("events")
+            watermarks = project.get("watermarks")
+            return (
+                "INSERT INTO projects (project_id, last_event_id, events, watermarks) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(project_id) DO UPDATE SET "
+                "last_event_id = excluded.last_event_id, events = excluded.events, "
+                "watermarks = excluded.watermarks",
+                (
+                    int(key),
+                    project.get("last_event_id"),
+                    (
+                        json.dumps(events, ensure_ascii=False, default=encode_cache_value)
+                        if events is not None
+                        else None
+                    ),
+                    json.dumps(watermarks) if watermarks is not None else None,
+                ),
+            )
+        if section == "project_activity":
+            activity = data["project_activity"]
+            return (
+                "INSERT INTO project_activity (project_id, last_activity_at) VALUES (?, ?) "
+                "ON CONFLICT(project_id) DO UPDATE SET "
+                "last_activity_at = excluded.last_activity_at",
+                (int(key), activity.get(int(key), activity.get(key))),
+            )
+        if section == "project_paths":
+            return (
+                "INSERT INTO project_paths (project_id, path) VALUES (?, ?) "
+                "ON CONFLICT(project_id) DO UPDATE SET path = excluded.path",
+                (int(key), data["project_paths"].get(key)),
+            )
+        if section == "project_catalogue":
+            entry = data.get("project_catalogue", {}).get(key)
+            if entry is None:
+                # Проект удален из каталога при полной сверке
+                return ("DELETE FROM project_catalogue WHERE project_id = ?", (int(key),))
+            return (
+                "INSERT INTO project_catalogue (project_id, path, name, last_activity_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(project_id) DO UPDATE SET path = excluded.path, "
+                "name = excluded.name, last_activity_at = excluded.last_activity_at",
+                (int(key), entry.get("path"), entry.get("name"), entry.get("last_activity_at")),
+            )
+        raise ValueError(f"Неизвестный раздел кеша: {section}")
+
+    def _save_cache(self):
+        """Сохранение всего кеша в базу"""
+        try:
+            self._write_all(self.data)
+        except sqlite3.Error as e:
+            print(f"Предупреждение: Не удалось сохранить кеш: {e}")
+
+    def _prepare_write(self, changes: Iterable[Tuple[str, str]]) -> List[Statement]:
+        """Построить upsert для каждой измененной записи"""
+        return [self._upsert_statement(self.data, section, key) for section, key in changes]
+
+    def _commit_write(self, payload: List[Statement]):
+        """Выполнить upsert измененных записей одной транзакцией"""
+        try:
+            self._execute_transaction(payload)
+        except sqlite3.Error as e:
+            print(f"Предупреждение: Не удалось сохранить кеш: {e}")
+
+    def close(self):
+        """Записать несохраненные изменения и закрыть соединение с базой"""
+        if self._conn is not None:
+            super().close()
+            self._conn.close()
+            self._conn = None
@@ -485,9 +485,7 @@ def pipeline_to_event(pipeline: Dict[str, Any], project: Dict[str, Any]) -> Dict
         Словарь в формате события
     """
     # Создаем уникальный ID для pipeline события с учетом статуса
-    pipeline_id = pipeline["id"]
-    status = pipeline["status"]
-    event_id = f"pipeline_{pipeline_id}_{status}"
+    event_id = ci_event_key("pipeline", pipeline)
     
     # Определяем автора pipeline
     user = pipeline.get("user") or {}
@@ -522,49 +520,64 @@ def pipeline_to_event(pipeline: Dict[str, Any], project: Dict[str, Any]) -> Dict
     }
 
 
-def is_new_pipeline_event(pipeline: Dict[str, Any], project_id: int, cache) -> bool:
+def ci_event_key(kind: str, item: Dict[str, Any]) -> str:
     """
-    Проверить, является ли pipeline событие новым или изменился ли его статус.
-    
+    Получить ключ дедупликации CI/CD события с учетом статуса.
+
     Args:
-        pipeline: Данные pipeline
+        kind: Тип объекта ('pipeline', 'job', 'deployment')
+        item: Данные объекта из GitLab API
+
+    Returns:
+        Ключ вида '{kind}_{id}_{status}'
+    """
+    return f"{kind}_{item['id']}_{item['status']}"
+
+
+def is_new_ci_event(kind: str, item: Dict[str, Any], project_id: int, cache) -> bool:
+    """
+    Проверить, является ли CI/CD событие новым или изменился ли его статус.
+
+    Args:
+        kind: Тип объекта ('pipeline', 'job', 'deployment')
+        item: Данные объекта из GitLab API
         project_id: ID проекта
         cache: Объект кеша
-        
+
     Returns:
-        True если pipeline новый или изменился статус, False если уже обработан с этим статусом
+        True если объект новый или изменился статус, False если уже обработан с этим статусом
     """
-    pipeline_id = pipeline["id"]
-    status = pipeline["status"]
-    event_id = f"pipeline_{pipeline_id}_{status}"
-    
-    # Проверяем кеш событий
+    event_id = ci_event_key(kind, item)
+
+    # Индекс событий кеша проверяет наличие ключа за O(1)
     cached_events = cache.get_project_events(project_id)
     if cached_events and event_id in cached_events:
+        # Объект все еще возвращается API — не даем вытеснить его ключ
+        if hasattr(cache, 'touch_project_event'):
+            cache.touch_project_event(project_id, event_id)
         return False
-    
+
     return True
 
 
-def save_pipeline_event_to_cache(pipeline: Dict[str, Any], project_id: int, cache):
+def save_ci_event_to_cache(kind: str, item: Dict[str, Any], project_id: int, cache):
     """
-    Сохранить pipeline событие в кеш с учетом статуса.
-    
+    Сохранить CI/CD событие в кеш с учетом статуса.
+
     Args:
-        pipeline: Данные pipeline
+        kind: Тип объекта ('pipeline', 'job', 'deployment')
+        item: Данные объекта из GitLab API
         project_id: ID проекта
         cache: Объект кеша
     """
-    pipeline_id = pipeline["id"]
-    status = pipeline["status"]
-    event_id = f"pipeline_{pipeline_id}_{status}"
-    
+    event_id = ci_event_key(kind, item)
+
     # Проверяем наличие метода
     if hasattr(cache, 'save_project_event'):
         cache.save_project_event(project_id, event_id)
     else:
         # Альтернативный способ сохранения для совместимости
-        cached_events = cache.get_project_events(project_id) or set()
+        cached_events = set(cache.get_project_events(project_id) or ())
         cached_events.add(event_id)
         if hasattr(cache, 'data'):
             if 'project_events' not in cache.data:
@@ -572,6 +585,33 @@ def save_pipeline_event_to_cache(pipeline: Dict[str, Any], project_id: int, cach
             cache.data['project_events'][str(project_id)] = list(cached_events)
 
 
+def is_new_pipeline_event(pipeline: Dict[str, Any], project_id: int, cache) -> bool:
+    """
+    Проверить, является ли pipeline событие новым или изменился ли его статус.
+    
+    Args:
+        pipeline: Данные pipeline
+        project_id: ID проекта
+        cache: Объект кеша
+        
+    Returns:
+        True если pipeline новый или изменился статус, False если уже обработан с этим статусом
+    """
+    return is_new_ci_event("pipeline", pipeline, project_id, cache)
+
+
+def save_pipeline_event_to_cache(pipeline: Dict[str, Any], project_id: int, cache):
+    """
+    Сохранить pipeline событие в кеш с учетом статуса.
+    
+    Args:
+        pipeline: Данные pipeline
+        project_id: ID проекта
+        cache: Объект кеша
+    """
+    save_ci_event_to_cache("pipeline", pipeline, project_id, cache)
+
+
 def is_new_job_event(job: Dict[str, Any], project_id: int, cache) -> bool:
     """
     Проверить, является ли job событие новым или изменился ли его статус.
@@ -584,16 +624,7 @@ def is_new_job_event(job: Dict[str, Any], project_id: int, cache) -> bool:
     Returns:
         True если job новый или изменился статус, False если уже обработан с этим статусом
     """
-    job_id = job["id"]
-    status = job["status"]
-    event_id = f"job_{job_id}_{status}"
-    
-    # Проверяем кеш событий
-    cached_events = cache.get_project_events(project_id)
-    if cached_events and event_id in cached_events:
-        return False
-    
-    return True
+    return is_new_ci_event("job", job, project_id, cache)
 
 
 def save_job_event_to_cache(job: Dict[str, Any], project_id: int, cache):
@@ -605,21 +636,7 @@ def save_job_event_to_cache(job: Dict[str, Any], project_id: int, cache):
         project_id: ID проекта
         cache: Объект кеша
     """
-    job_id = job["id"]
-    status = job["status"]
-    event_id = f"job_{job_id}_{status}"
-    
-    # Проверяем наличие метода
-    if hasattr(cache, 'save_project_event'):
-        cache.save_project_event(project_id, event_id)
-    else:
-        # Альтернативный способ сохранения для совместимости
-        cached_events = cache.get_project_events(project_id) or set()
-        cached_events.add(event_id)
-        if hasattr(cache, 'data'):
-            if 'project_events' not in cache.data:
-                cache.data['project_events'] = {}
-            cache.data['project_events'][str(project_id)] = list(cached_events)
+    save_ci_event_to_cache("job", job, project_id, cache)
 
 
 def is_new_deployment_event(deployment: Dict[str, Any], project_id: int, cache) -> bool:
@@ -634,16 +651,7 @@ def is_new_deployment_event(deployment: Dict[str, Any], project_id: int, cache)
     Returns:
         True если deployment новый или изменился статус, False если уже обработан с этим статусом
     """
-    deployment_id = deployment["id"]
-    status = deployment["status"]
-    event_id = f"deployment_{deployment_id}_{status}"
-    
-    # Проверяем кеш событий
-    cached_events = cache.get_project_events(project_id)
-    if cached_events and event_id in cached_events:
-        return False
-    
-    return True
+    return is_new_ci_event("deployment", deployment, project_id, cache)
 
 
 def save_deployment_event_to_cache(deployment: Dict[str, Any], project_id: int, cache):
@@ -655,21 +663,7 @@ def save_deployment_event_to_cache(deployment: Dict[str, Any], project_id: int,
         project_id: ID проекта
         cache: Объект кеша
     """
-    deployment_id = deployment["id"]
-    status = deployment["status"]
-    event_id = f"deployment_{deployment_id}_{status}"
-    
-    # Проверяем наличие метода
-    if hasattr(cache, 'save_project_event'):
-        cache.save_project_event(project_id, event_id)
-    else:
-        # Альтернативный способ сохранения для совместимости
-        cached_events = cache.get_project_events(project_id) or set()
-        cached_events.add(event_id)
-        if hasattr(cache, 'data'):
-            if 'project_events' not in cache.data:
-                cache.data['project_events'] = {}
-            cache.data['project_events'][str(project_id)] = list(cached_events)
+    save_ci_event_to_cache("deployment", deployment, project_id, cache)
 
 
 def job_to_event(job: Dict[str, Any], project: Dict[str, Any]) -> Dict[str, Any]:
@@ -684,9 +678,7 @@ def job_to_event(job: Dict[str, Any], project: Dict[str, Any]) -> Dict[str, Any]
         Словарь в формате события
     """
     # Создаем уникальный ID для job события с учетом статуса
-    job_id = job["id"]
-    status = job["status"]
-    event_id = f"job_{job_id}_{status}"
+    event_id = ci_event_key("job", job)
     
     # Определяем автора job
     user = job.get("user") or {}
@@ -734,9 +726,7 @@ def deployment_to_event(deployment: Dict[str, Any], project: Dict[str, Any]) ->
         Словарь в формате события
     """
     # Создаем уникальный ID для deployment события с учетом статуса
-    deployment_id = deployment["id"]
-    status = deployment["status"]
-    event_id = f"deployment_{deployment_id}_{status}"
+    event_id = ci_event_key("deployment", deployment)
     
     # Определяем автора deployment
     user = deployment.get("user") or {}
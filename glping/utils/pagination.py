@@ -0,0 +1,161 @@
+"""Утилиты для постраничного получения списков GitLab API."""
+
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .date_utils import parse_gitlab_date
+
+
+# Водяной знак: ID (целое число) или дата ISO 8601
+Watermark = Union[int, str, None]
+
+# Поле сортировки и водяного знака для списков проекта.
+# Jobs не поддерживают order_by и отдаются по убыванию ID,
+# поэтому для них граница проверяется по дате создания.
+ENDPOINT_ORDER: Dict[str, Tuple[Optional[str], str]] = {
+    "merge_requests": ("updated_at", "updated_at"),
+    "issues": ("updated_at", "updated_at"),
+    "pipelines": ("updated_at", "updated_at"),
+    "deployments": ("updated_at", "updated_at"),
+    "jobs": (None, "created_at"),
+}
+
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="?([^";]+)"?')
+
+
+def parse_link_header(header: Optional[str]) -> Dict[str, str]:
+    """
+    Разобрать заголовок Link.
+
+    Args:
+        header: Значение заголовка Link
+
+    Returns:
+        Словарь {rel: url}
+    """
+    if not header:
+        return {}
+    return {rel: url for url, rel in _LINK_RE.findall(header)}
+
+
+def get_next_page(headers: Mapping[str, str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Определить следующую страницу по заголовкам ответа.
+
+    Args:
+        headers: Заголовки ответа GitLab
+
+    Returns:
+        Кортеж (номер страницы из X-Next-Page, URL из Link rel="next");
+        оба None, если заголовки не указывают следующую страницу
+    """
+    next_page = headers.get("X-Next-Page") or None
+    next_url = parse_link_header(headers.get("Link")).get("next")
+    return next_page, next_url
+
+
+def get_total_pages(headers: Mapping[str, str], per_page: int) -> Optional[int]:
+    """
+    Получить число страниц списка из заголовков ответа.
+
+    Args:
+        headers: Заголовки ответа GitLab
+        per_page: Размер страницы запроса
+
+    Returns:
+        Значение X-Total-Pages (или вычисленное по X-Total) либо None,
+        если GitLab не сообщил размер списка
+    """
+    try:
+        if headers.get("X-Total-Pages"):
+            return int(headers["X-Total-Pages"])
+        if headers.get("X-Total"):
+            return -(-int(headers["X-Total"]) // per_page)
+    except ValueError:
+        pass
+    return None
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Считать дату без часового пояса датой в UTC"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _is_past_watermark(item: Dict[str, Any], field: str, watermark: Watermark) -> bool:
+    """Проверить, что объект не новее водяного знака"""
+    value = item.get(field)
+    if value is None or watermark is None:
+        return False
+    if isinstance(watermark, int):
+        # ID не выше водяного знака уже обработаны
+        return value <= watermark
+    item_dt = _as_utc(parse_gitlab_date(value))
+    watermark_dt = _as_utc(parse_gitlab_date(watermark))
+    if item_dt is None or watermark_dt is None:
+        return False
+    # Объекты с той же датой оставляем: их отсеет индекс дедупликации
+    return item_dt < watermark_dt
+
+
+def split_at_watermark(
+    items: List[Dict[str, Any]], watermark: Watermark, field: str
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Отрезать страницу, отсортированную по убыванию field, на водяном знаке.
+
+    Args:
+        items: Объекты страницы
+        watermark: Водяной знак (ID или дата)
+        field: Поле, по которому отсортирована страница
+
+    Returns:
+        Кортеж (объекты новее водяного знака, достигнут ли водяной знак)
+    """
+    for index, item in enumerate(items):
+        if _is_past_watermark(item, field, watermark):
+            return items[:index], True
+    return items, False
+
+
+def iter_until_watermark(
+    items: Iterable[Any], watermark: Watermark, field: str
+) -> Iterator[Dict[str, Any]]:
+    """
+    Читать объекты ленивого итератора до водяного знака.
+
+    Args:
+        items: Итератор объектов python-gitlab или словарей
+        watermark: Водяной знак (ID или дата)
+        field: Поле, по которому отсортированы объекты
+
+    Yields:
+        Словари объектов новее водяного знака
+    """
+    for item in items:
+        data = item if isinstance(item, dict) else item.asdict()
+        if _is_past_watermark(data, field, watermark):
+            return
+        yield data
+
+
+def newest_value(items: Iterable[Dict[str, Any]], field: str) -> Optional[str]:
+    """
+    Найти самое позднее значение даты среди объектов.
+
+    Args:
+        items: Объекты API
+        field: Поле с датой
+
+    Returns:
+        Значение поля самого нового объекта или None
+    """
+    newest: Optional[Tuple[datetime, str]] = None
+    for item in items:
+        value = item.get(field)
+        parsed = _as_utc(parse_gitlab_date(value)) if value else None
+        if parsed is not None and (newest is None or parsed > newest[0]):
+            newest = (parsed, value)
+    return newest[1] if newest else None
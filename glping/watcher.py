@@ -1,6 +1,6 @@
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base_watcher import BaseWatcher
 from .cache import Cache
@@ -16,7 +16,12 @@ class GitLabWatcher(BaseWatcher):
     def __init__(self, config: Config):
         """Инициализация наблюдателя."""
         super().__init__(config)
-        self.api = GitLabAPI(config.gitlab_url, config.gitlab_token)
+        self.api = GitLabAPI(
+            config.gitlab_url,
+            config.gitlab_token,
+            keyset_projects=config.projects_keyset_pagination,
+            rate_limit_retries=config.rate_limit_retries,
+        )
         self.notifier = Notifier()
         # _project_paths уже инициализирован в базовом классе
 
@@ -28,8 +33,9 @@ class GitLabWatcher(BaseWatcher):
         # Получаем дату последней проверки для фильтрации
         last_checked = self.cache.get_last_checked()
         
-        # Если есть дата последней проверки, используем серверную фильтрацию
-        if last_checked:
+        # Каталог проектов полностью сверяется раз в PROJECT_CATALOGUE_REFRESH_HOURS,
+        # в остальных циклах сервер возвращает только проекты с новой активностью
+        if last_checked and not self.cache.is_catalogue_refresh_due():
             if verbose:
                 last_checked_dt = datetime.fromisoformat(
                     last_checked.replace("Z", "+00:00")
@@ -41,27 +47,101 @@ class GitLabWatcher(BaseWatcher):
                 **self.config.get_project_filter(),
                 last_activity_after=last_checked,
             )
+            self.cache.update_catalogue(projects)
             
             if verbose:
                 print(f"📊 Найдено {len(projects)} активных проектов (серверная фильтрация)")
         else:
-            # Первый запуск - получаем все проекты
+            # Первый запуск или полная сверка - получаем все проекты
             if verbose:
-                print("🔍 Первый запуск, получаем все проекты")
+                if last_checked:
+                    print("🔍 Полная сверка каталога проектов")
+                else:
+                    print("🔍 Первый запуск, получаем все проекты")
             
             projects = self.api.get_projects(**self.config.get_project_filter())
+            self.cache.replace_catalogue(projects, datetime.now(timezone.utc).isoformat())
             
             if verbose:
-                print(f"📊 Найдено {len(projects)} проектов для первоначальной проверки")
+                print(f"📊 Найдено {len(projects)} проектов в каталоге")
+
+            if last_checked:
+                # Проверяем только проекты с активностью после последней проверки
+                projects = [
+                    project for project in projects
+                    if self._is_active_since(project, last_checked)
+                ]
+
+        # В режиме ленты события всех проектов приходят одним списком,
+        # а запросы по проектам остаются только для CI/CD
+        events_by_project = None
+        feed_event_id = None
+        if self._use_events_feed():
+            events_by_project, feed_event_id = self._fetch_events_feed(last_checked, verbose)
+            known = {project["id"] for project in projects}
+            for project_id in events_by_project:
+                if project_id in known:
+                    continue
+                project = self._project_from_catalogue(project_id)
+                if project:
+                    projects.append(project)
+                else:
+                    fetched = self.api.get_projects(project_id=project_id)
+                    self.cache.update_catalogue(fetched)
+                    projects.extend(fetched)
 
         # Проверяем события для отфильтрованных проектов
         for project in projects:
-            self._check_project_events(project, verbose)
+            project_events = (
+                events_by_project.get(project["id"], [])
+                if events_by_project is not None
+                else None
+            )
+            self._check_project_events(project, verbose, project_events)
 
+        self._end_cache_cycle(verbose)
         self.cache.set_last_checked(datetime.now(timezone.utc).isoformat())
+        if feed_event_id is not None:
+            self.cache.set_feed_event_id(feed_event_id)
+        # Сохраняем все изменения цикла одной записью
+        self.cache.flush()
+
+    def _fetch_events_feed(
+        self, last_checked: Optional[str], verbose: bool = False
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], Optional[int]]:
+        """
+        Получить новые события ленты пользователя, разложенные по проектам.
+
+        Returns:
+            Кортеж (события по ID проекта, ID самого нового события ленты)
+        """
+        since_id = self.cache.get_feed_event_id()
+        if since_id is None:
+            events = self.api.get_user_events(after=self._get_feed_after(last_checked))
+        else:
+            events = self.api.get_user_events(since_id=since_id)
 
-    def _check_project_events(self, project: Dict[str, Any], verbose: bool = False):
-        """Проверить события конкретного проекта"""
+        if verbose:
+            print(f"📰 Лента событий пользователя: получено {len(events)}")
+
+        newest_id = max((event.get("id", 0) for event in events), default=None)
+        return self._group_events_by_project(events), newest_id or since_id
+
+    def _check_project_events(
+        self,
+        project: Dict[str, Any],
+        verbose: bool = False,
+        events: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """
+        Проверить события конкретного проекта.
+
+        Args:
+            project: Проект
+            verbose: Выводить подробную информацию
+            events: События проекта из ленты пользователя; если не заданы,
+                они запрашиваются у API проекта
+        """
         project_id = project["id"]
         project_name = project.get(
             "name_with_namespace", project.get("name", f"Проект {project_id}")
@@ -74,7 +154,10 @@ class GitLabWatcher(BaseWatcher):
         last_checked = self.cache.get_last_checked()
 
         try:
-            if last_event_id is None:
+            if events is not None:
+                if verbose:
+                    print(f"    Событий из ленты пользователя: {len(events)}")
+            elif last_event_id is None:
                 # Для первого запуска проекта всегда используем дату последней проверки
                 # Пробуем использовать after параметр с правильным форматом
                 try:
@@ -105,10 +188,10 @@ class GitLabWatcher(BaseWatcher):
                     if verbose:
                         print(f"    Получено событий от API (без after): {len(events)}")
             else:
-                events = self.api.get_project_events(project_id)
+                events = self.api.get_project_events(project_id, since_id=last_event_id)
                 if verbose:
                     print(
-                        f"    Проверка всех событий (последний известный ID: {last_event_id})"
+                        f"    Проверка событий после ID {last_event_id}: получено {len(events)}"
                     )
 
             # Фильтруем события по дате последней проверки
@@ -263,7 +346,10 @@ class GitLabWatcher(BaseWatcher):
         print(
             f"[{datetime.now().isoformat()}] Запуск GitLab watcher (однократный запуск)..."
         )
-        self.check_projects(verbose)
+        try:
+            self.check_projects(verbose)
+        finally:
+            self.cache.close()
         print(f"[{datetime.now().isoformat()}] Проверка завершена")
         return True
 
@@ -283,6 +369,8 @@ class GitLabWatcher(BaseWatcher):
         except KeyboardInterrupt:
             print(f"\n[{datetime.now().isoformat()}] Остановка GitLab watcher...")
             return True
+        finally:
+            self.cache.close()
 
     def reset_cache(self):
         """Сбросить кеш"""
@@ -301,7 +389,10 @@ class GitLabWatcher(BaseWatcher):
         try:
             # Получаем pipelines, обновленные после последней проверки
             updated_after = last_checked_dt.isoformat() if last_checked_dt else None
-            pipelines = self.api.get_project_pipelines(project_id, updated_after=updated_after)
+            watermark = self.cache.get_endpoint_watermark(project_id, "pipelines") or updated_after
+            pipelines = self.api.get_project_pipelines(
+                project_id, updated_after=updated_after, watermark=watermark
+            )
             
             if verbose:
                 print(f"    Найдено pipelines: {len(pipelines)}")
@@ -345,6 +436,8 @@ class GitLabWatcher(BaseWatcher):
                 
                 if verbose:
                     print(f"    Pipeline события обработаны и сохранены в кеш")
+
+            self._update_endpoint_watermark(project_id, "pipelines", pipelines)
             
         except Exception as e:
             if verbose:
@@ -364,7 +457,10 @@ class GitLabWatcher(BaseWatcher):
         try:
             # Получаем jobs, обновленные после последней проверки
             updated_after = last_checked_dt.isoformat() if last_checked_dt else None
-            jobs = self.api.get_project_jobs(project_id, updated_after=updated_after)
+            watermark = self.cache.get_endpoint_watermark(project_id, "jobs") or updated_after
+            jobs = self.api.get_project_jobs(
+                project_id, updated_after=updated_after, watermark=watermark
+            )
             
             if verbose:
                 print(f"    Найдено jobs: {len(jobs)}")
@@ -408,6 +504,8 @@ class GitLabWatcher(BaseWatcher):
                 
                 if verbose:
                     print(f"    Job события обработаны и сохранены в кеш")
+
+            self._update_endpoint_watermark(project_id, "jobs", jobs)
             
         except Exception as e:
             if verbose:
@@ -427,7 +525,10 @@ class GitLabWatcher(BaseWatcher):
         try:
             # Получаем deployments, обновленные после последней проверки
             updated_after = last_checked_dt.isoformat() if last_checked_dt else None
-            deployments = self.api.get_project_deployments(project_id, updated_after=updated_after)
+            watermark = self.cache.get_endpoint_watermark(project_id, "deployments") or updated_after
+            deployments = self.api.get_project_deployments(
+                project_id, updated_after=updated_after, watermark=watermark
+            )
             
             if verbose:
                 print(f"    Найдено deployments: {len(deployments)}")
@@ -471,6 +572,8 @@ class GitLabWatcher(BaseWatcher):
                 
                 if verbose:
                     print(f"    Deployment события обработаны и сохранены в кеш")
+
+            self._update_endpoint_watermark(project_id, "deployments", deployments)
             
         except Exception as e:
             if verbose:
@@ -0,0 +1,100 @@
+"""Ограниченный пул асинхронных обработчиков с очередью заданий."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+
+class WorkerPool:
+    """
+    Фиксированное число обработчиков, разбирающих задания из очереди.
+
+    Вместо отдельной задачи asyncio на каждое задание создается size
+    обработчиков, а очередь ограничена, поэтому submit() ждет, пока
+    обработчики освободятся. Память и накладные расходы планировщика не
+    зависят от числа заданий. Обработка одного задания ограничена timeout
+    секундами. Ошибки заданий не прерывают пул, а собираются в errors.
+
+    Используется как асинхронный контекстный менеджер: при выходе пул
+    дожидается всех заданий, а при исключении в блоке отменяет их.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[Any]],
+        size: int = 10,
+        timeout: Optional[float] = None,
+        queue_size: Optional[int] = None,
+    ):
+        """
+        Инициализация пула.
+
+        Args:
+            handler: Асинхронная функция обработки одного задания
+            size: Число обработчиков
+            timeout: Максимальное время обработки задания (сек, None — без ограничения)
+            queue_size: Емкость очереди (по умолчанию удвоенное число обработчиков)
+        """
+        self.handler = handler
+        self.size = max(1, size)
+        self.timeout = timeout or None
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or self.size * 2)
+        self._workers: List[asyncio.Task] = []
+        # Задания, завершившиеся ошибкой, и их исключения
+        # (asyncio.TimeoutError для превысивших timeout)
+        self.errors: List[Tuple[Any, BaseException]] = []
+        self.completed = 0
+        self.timed_out = 0
+
+    async def __aenter__(self):
+        """Запустить обработчики"""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Дождаться заданий или отменить их при исключении"""
+        if exc_type is None:
+            await self.join()
+        else:
+            await self.cancel()
+
+    def start(self):
+        """Запустить обработчики"""
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._work()) for _ in range(self.size)]
+
+    async def submit(self, item: Any):
+        """Поставить задание в очередь, дождавшись места в ней"""
+        await self._queue.put(item)
+
+    async def join(self):
+        """Дождаться обработки всех заданий и остановить обработчики"""
+        await self._queue.join()
+        await self.cancel()
+
+    async def cancel(self):
+        """Отменить выполняемые задания и остановить обработчики"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    @property
+    def failed(self) -> int:
+        """Число заданий, завершившихся ошибкой"""
+        return len(self.errors)
+
+    async def _work(self):
+        """Обрабатывать задания, пока пул не остановлен"""
+        while True:
+            item = await self._queue.get()
+            try:
+                await asyncio.wait_for(self.handler(item), self.timeout)
+            except asyncio.TimeoutError as e:
+                self.timed_out += 1
+                self.errors.append((item, e))
+            except Exception as e:
+                self.errors.append((item, e))
+            else:
+                self.completed += 1
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,126 @@
+"""
+Общие подмены API, сессии aiohttp, часов и конфигурации для тестов
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import aiohttp
+
+
+def paged(*pages):
+    """
+    Подмена iter_projects/iter_project_events: каждый вызов отдает страницы заново.
+
+    Используется как side_effect мока API.
+    """
+    async def iterate(*args, **kwargs):
+        for page in pages:
+            yield page
+    return iterate
+
+
+class FakeClock:
+    """Часы, управляемые тестом: двигаются только при ожидании или вручную"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class FakeResponse:
+    """Ответ aiohttp с заданным статусом, телом и заголовками"""
+
+    def __init__(self, status=200, body=None, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.json_calls = 0
+
+    async def json(self):
+        self.json_calls += 1
+        return self.body
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise AssertionError(f"unexpected status {self.status}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class StatusResponse(FakeResponse):
+    """Ответ, который aiohttp превращает в ClientResponseError"""
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                MagicMock(real_url="https://gitlab.example.com"), (), status=self.status
+            )
+
+
+class FakeSession:
+    """Сессия aiohttp, возвращающая ответы по очереди и запоминающая запросы"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, params=None, headers=None):
+        self.requests.append({"method": method, "url": url, "params": params, "headers": headers})
+        return self.responses.pop(0)
+
+
+class FailingSession(FakeSession):
+    """Сессия, в которой вместо ответа может быть исключение"""
+
+    def request(self, method, url, params=None, headers=None, json=None):
+        response = super().request(method, url, params, headers)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def make_watcher_config(cache_file):
+    """
+    Конфигурация-заглушка для наблюдателя.
+
+    Необязательные режимы выключены явно, остальные параметры
+    возвращает MagicMock.
+    """
+    config = MagicMock()
+    config.gitlab_url = "https://gitlab.example.com"
+    config.gitlab_token = "test_token"
+    config.cache_file = cache_file
+    config.project_id = None
+    config.events_feed = False
+    config.graphql_ci = False
+    config.adaptive_polling = False
+    config.get_project_filter.return_value = {"membership": True}
+    return config
+
+
+class WatcherTestCase(unittest.IsolatedAsyncioTestCase):
+    """Тесты наблюдателя с кешем во временном каталоге"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = make_watcher_config(os.path.join(self.temp_dir, "test_cache.json"))
+
+    def tearDown(self):
+        """Очистка тестового окружения"""
+        shutil.rmtree(self.temp_dir)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Тесты асинхронной проверки CI/CD объектов проекта
+"""
+
+import asyncio
+import unittest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, patch
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.async_watcher import AsyncGitLabWatcher
+from tests.helpers import WatcherTestCase, paged
+
+
+class TestAsyncCIChecks(WatcherTestCase):
+    """Тесты параллельной проверки pipelines, jobs и deployments"""
+
+    async def test_ci_endpoints_awaited_concurrently(self):
+        """Тест одновременного ожидания трех CI/CD запросов"""
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        mock_api.iter_project_events.side_effect = paged()
+        started = []
+        timed_out = []
+        all_started = asyncio.Event()
+
+        async def slow_list(*args, **kwargs):
+            started.append(kwargs)
+            if len(started) == 3:
+                all_started.set()
+            try:
+                # При последовательном выполнении второй запрос не начнется
+                await asyncio.wait_for(all_started.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                timed_out.append(kwargs)
+            return []
+
+        mock_api.get_project_pipelines.side_effect = slow_list
+        mock_api.get_project_jobs.side_effect = slow_list
+        mock_api.get_project_deployments.side_effect = slow_list
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            last_checked = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+            await watcher.cache.set_last_checked_async(last_checked)
+
+            await watcher._check_project_events({"id": 1, "name": "Project"})
+
+        self.assertEqual(len(started), 3)
+        self.assertEqual(timed_out, [])
+
+    async def test_ci_check_error_returns_false(self):
+        """Тест результата False при ошибке обработки CI/CD"""
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        mock_api.get_project_pipelines.side_effect = ValueError("bad response")
+        mock_api.get_project_jobs.side_effect = ValueError("bad response")
+        mock_api.get_project_deployments.side_effect = ValueError("bad response")
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            project = {"id": 1, "name": "Project"}
+
+            self.assertIs(await watcher._check_pipeline_events(project), False)
+            self.assertIs(await watcher._check_job_events(project), False)
+            self.assertIs(await watcher._check_deployment_events(project), False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Тесты фонового писателя асинхронного сохранения кеша
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from glping.cache import Cache
+from glping.journal_cache import JournalCache
+from glping.sqlite_cache import SQLiteCache
+
+
+class TestCacheAsyncWriter(unittest.IsolatedAsyncioTestCase):
+    """Тесты объединения одновременных асинхронных сохранений"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, "test_cache.json")
+
+    def tearDown(self):
+        """Очистка тестового окружения"""
+        shutil.rmtree(self.temp_dir)
+
+    async def test_concurrent_saves_coalesce_into_one_write(self):
+        """Тест объединения N одновременных сохранений в одну запись"""
+        cache = Cache(self.cache_file)
+
+        with patch.object(cache, "_commit_write", wraps=cache._commit_write) as mock_commit:
+            await asyncio.gather(
+                *(cache.set_last_event_id_async(project_id, project_id + 1) for project_id in range(20))
+            )
+            self.assertEqual(mock_commit.call_count, 1)
+
+        with open(self.cache_file, "r") as f:
+            data = json.load(f)
+        for project_id in range(20):
+            self.assertEqual(data["projects"][str(project_id)]["last_event_id"], project_id + 1)
+
+    async def test_snapshot_taken_on_event_loop_thread(self):
+        """Тест сериализации данных в цикле событий, а не в потоке записи"""
+        cache = Cache(self.cache_file)
+        loop_thread = threading.get_ident()
+        prepare_threads = []
+        commit_threads = []
+        original_prepare = cache._prepare_write
+        original_commit = cache._commit_write
+
+        def prepare(changes):
+            prepare_threads.append(threading.get_ident())
+            return original_prepare(changes)
+
+        def commit(payload):
+            commit_threads.append(threading.get_ident())
+            self.assertIsInstance(payload, str)
+            original_commit(payload)
+
+        with patch.object(cache, "_prepare_write", side_effect=prepare), \
+             patch.object(cache, "_commit_write", side_effect=commit):
+            await cache.set_project_activity_async(123, "2025-09-30T15:30:00Z")
+
+        self.assertEqual(prepare_threads, [loop_thread])
+        self.assertNotEqual(commit_threads, [loop_thread])
+
+    async def test_writes_during_commit_are_not_lost(self):
+        """Тест записи изменений, поступивших во время предыдущей записи"""
+        cache = Cache(self.cache_file)
+        first = asyncio.create_task(cache.set_last_event_id_async(1, 10))
+        await asyncio.sleep(0)
+        await asyncio.gather(first, cache.set_last_event_id_async(2, 20))
+
+        cache2 = Cache(self.cache_file)
+        self.assertEqual(cache2.get_last_event_id(1), 10)
+        self.assertEqual(cache2.get_last_event_id(2), 20)
+
+    async def test_write_behind_flush_uses_writer(self):
+        """Тест сохранения отложенных изменений через фонового писателя"""
+        for cache_class in (JournalCache, SQLiteCache):
+            with self.subTest(cache_class=cache_class.__name__):
+                cache_file = os.path.join(self.temp_dir, f"{cache_class.__name__}.json")
+                cache = cache_class(cache_file, write_behind=True, flush_interval=3600)
+                await asyncio.gather(
+                    *(cache.set_last_event_id_async(project_id, 1) for project_id in range(10))
+                )
+                await cache.flush_async()
+                self.assertFalse(cache.has_unsaved_changes())
+                cache.close()
+
+                cache2 = cache_class(cache_file)
+                self.assertEqual(cache2.get_last_event_id(9), 1)
+                cache2.close()
+
+    async def test_sync_setters_in_event_loop_use_writer(self):
+        """Тест записи синхронных методов кеша из корутин через фонового писателя"""
+        loop_thread = threading.get_ident()
+        for write_behind in (False, True):
+            with self.subTest(write_behind=write_behind):
+                cache_file = os.path.join(self.temp_dir, f"sync_{write_behind}.json")
+                cache = Cache(cache_file, write_behind=write_behind, max_dirty=1)
+                commit_threads = []
+                original_commit = cache._commit_write
+
+                def commit(payload):
+                    commit_threads.append(threading.get_ident())
+                    original_commit(payload)
+
+                with patch.object(cache, "_commit_write", side_effect=commit):
+                    cache.update_catalogue([{"id": 1, "path_with_namespace": "group/project"}])
+                    cache.set_endpoint_watermark(1, "pipelines", "2025-09-30T15:30:00Z")
+                    cache.save_project_event(1, "pipeline_1_success")
+                    # Запись не выполняется внутри вызова
+                    self.assertEqual(commit_threads, [])
+                    await cache.flush_async()
+
+                self.assertTrue(commit_threads)
+                self.assertNotIn(loop_thread, commit_threads)
+                cache2 = Cache(cache_file)
+                self.assertEqual(
+                    cache2.get_endpoint_watermark(1, "pipelines"), "2025-09-30T15:30:00Z"
+                )
+                self.assertEqual(cache2.get_project_path(1), "group/project")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Тесты отложенной записи кеша (write-behind)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from glping.cache import Cache
+from glping.sqlite_cache import SQLiteCache
+
+
+class TestCacheWriteBehind(unittest.TestCase):
+    """Тесты отложенной записи кеша"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, "test_cache.json")
+
+    def tearDown(self):
+        """Очистка тестового окружения"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_setters_do_not_write_until_flush(self):
+        """Тест отсутствия записи на диск до flush()"""
+        cache = Cache(self.cache_file, write_behind=True, flush_interval=3600)
+
+        with patch.object(cache, "_write_cache_file") as mock_save:
+            for project_id in range(50):
+                cache.set_last_event_id(project_id, project_id + 1)
+                cache.save_project_event(project_id, project_id + 1)
+                cache.set_project_activity(project_id, "2025-09-30T15:30:00Z")
+            mock_save.assert_not_called()
+            self.assertTrue(cache.has_unsaved_changes())
+
+            cache.flush()
+            mock_save.assert_called_once()
+            self.assertFalse(cache.has_unsaved_changes())
+
+    def test_flush_persists_changes(self):
+        """Тест сохранения отложенных изменений"""
+        cache = Cache(self.cache_file, write_behind=True, flush_interval=3600)
+        cache.set_last_event_id(123, 456)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+        cache.close()
+        with open(self.cache_file, "r") as f:
+            data = json.load(f)
+        self.assertEqual(data["projects"]["123"]["last_event_id"], 456)
+
+    def test_max_dirty_bounds_unsaved_changes(self):
+        """Тест досрочной записи при превышении max_dirty"""
+        cache = Cache(self.cache_file, write_behind=True, flush_interval=3600, max_dirty=3)
+
+        with patch.object(cache, "_write_cache_file") as mock_save:
+            cache.set_last_event_id(1, 10)
+            cache.set_last_event_id(2, 20)
+            mock_save.assert_not_called()
+            cache.set_last_event_id(3, 30)
+            mock_save.assert_called_once()
+
+    def test_flush_interval_bounds_unsaved_changes(self):
+        """Тест досрочной записи по истечении flush_interval"""
+        cache = Cache(self.cache_file, write_behind=True, flush_interval=30, max_dirty=0)
+
+        with patch.object(cache, "_write_cache_file") as mock_save, \
+             patch("glping.cache.time.monotonic", return_value=cache._last_flush + 10):
+            cache.set_last_event_id(1, 10)
+            mock_save.assert_not_called()
+
+        with patch.object(cache, "_write_cache_file") as mock_save, \
+             patch("glping.cache.time.monotonic", return_value=cache._last_flush + 31):
+            cache.set_last_event_id(2, 20)
+            mock_save.assert_called_once()
+
+    def test_sqlite_flush_writes_dirty_rows_only(self):
+        """Тест построчной записи отложенных изменений в SQLite"""
+        cache = SQLiteCache(self.cache_file, write_behind=True, flush_interval=3600)
+        cache.set_last_event_id(123, 456)
+        cache.save_project_path(123, "group/project")
+
+        with patch.object(cache, "_upsert_statement", wraps=cache._upsert_statement) as mock_upsert:
+            cache.flush()
+            self.assertEqual(mock_upsert.call_count, 2)
+        cache.close()
+
+        cache2 = SQLiteCache(self.cache_file)
+        self.assertEqual(cache2.get_last_event_id(123), 456)
+        self.assertEqual(cache2.get_project_path(123), "group/project")
+        cache2.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
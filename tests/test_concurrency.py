@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Тесты адаптивного ограничения одновременных запросов
+"""
+
+import asyncio
+import unittest
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.concurrency import AdaptiveLimiter, percentile
+from glping.resilience import RetryPolicy
+from tests.helpers import FailingSession, FakeClock, FakeResponse, StatusResponse
+
+
+class TestAdaptiveLimiter(unittest.IsolatedAsyncioTestCase):
+    """Тесты подбора лимита по принципу AIMD"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.clock = FakeClock()
+        self.limiter = AdaptiveLimiter(
+            initial=2, min_limit=1, max_limit=4, min_window=2, clock=self.clock
+        )
+
+    async def run_window(self, latency, status=200):
+        """Занять весь лимит и завершить запросы с заданной задержкой"""
+        started = [await self.limiter.acquire() for _ in range(self.limiter.limit)]
+        self.clock.now += latency
+        for value in started:
+            self.limiter.release(value, status)
+
+    def test_percentile(self):
+        """Тест вычисления перцентиля"""
+        self.assertEqual(percentile([float(i) for i in range(1, 101)], 0.95), 96.0)
+        self.assertIsNone(percentile([], 0.95))
+
+    async def test_additive_increase_while_healthy(self):
+        """Тест роста лимита на единицу за здоровое окно"""
+        await self.run_window(0.1)
+        await self.run_window(0.1)
+        self.assertEqual(self.limiter.limit, 3)
+        await self.run_window(0.1)
+        await self.run_window(0.1)
+        # Верхняя граница
+        self.assertEqual(self.limiter.limit, 4)
+
+    async def test_no_increase_without_saturation(self):
+        """Тест неизменного лимита, если он не был занят полностью"""
+        for _ in range(4):
+            started = await self.limiter.acquire()
+            self.clock.now += 0.1
+            self.limiter.release(started, 200)
+        self.assertEqual(self.limiter.limit, 2)
+
+    async def test_multiplicative_decrease_once_per_overload(self):
+        """Тест одного снижения на перегрузку, видимую несколькими запросами"""
+        limiter = AdaptiveLimiter(initial=10, clock=self.clock)
+        started = [await limiter.acquire() for _ in range(3)]
+        self.clock.now += 1
+        limiter.release(started[0], 429)
+        self.assertEqual(limiter.limit, 7)
+        # Запросы начаты до снижения: лимит повторно не снижается
+        limiter.release(started[1], 503)
+        limiter.release(started[2], None)
+        self.assertEqual(limiter.limit, 7)
+
+        self.clock.now += 1
+        limiter.release(await limiter.acquire(), 502)
+        self.assertEqual(limiter.limit, 4)
+
+    async def test_latency_spike_decreases(self):
+        """Тест снижения лимита при всплеске p95 задержки"""
+        limiter = AdaptiveLimiter(initial=4, min_window=2, clock=self.clock)
+        # Окно оценки — max(min_window, limit) = 4 ответа
+        for latency in [0.1] * 4 + [0.5] * 4:
+            started = await limiter.acquire()
+            self.clock.now += latency
+            limiter.release(started, 200)
+        self.assertEqual(limiter.limit, 2)
+        self.assertEqual(limiter.get_state()["decreases"], 1)
+
+    async def test_waits_for_free_slot(self):
+        """Тест ожидания свободного места под лимитом"""
+        limiter = AdaptiveLimiter(initial=1, min_limit=1, max_limit=1, clock=self.clock)
+        started = await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        self.assertEqual(limiter.get_state()["waiting"], 1)
+
+        limiter.release(started, 200)
+        await waiter
+        self.assertEqual(limiter.in_flight, 1)
+
+    async def test_cancelled_slot_not_counted(self):
+        """Тест освобождения места без снижения лимита при отмене запроса"""
+        limiter = AdaptiveLimiter(initial=3, clock=self.clock)
+
+        async def request():
+            async with limiter.slot():
+                await asyncio.sleep(10)
+
+        task = asyncio.ensure_future(request())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(limiter.limit, 3)
+
+
+class TestAPIConcurrency(unittest.IsolatedAsyncioTestCase):
+    """Тесты ограничения одновременных запросов в AsyncGitLabAPI"""
+
+    async def test_server_errors_reduce_limit(self):
+        """Тест снижения лимита после ответа 5xx"""
+        async def sleep(delay):
+            pass
+
+        api = AsyncGitLabAPI(
+            "https://gitlab.example.com", "test_token",
+            retry_policy=RetryPolicy(max_retries=1, sleep=sleep),
+            concurrency_limiter=AdaptiveLimiter(initial=10),
+        )
+        api.session = FailingSession([StatusResponse(status=503), FakeResponse(body=[{"id": 1}])])
+
+        result = await api._make_request("GET", "projects/1/events")
+
+        self.assertEqual(result, [{"id": 1}])
+        state = api.get_metrics()["concurrency"]
+        self.assertEqual(state["limit"], 7)
+        self.assertEqual(state["in_flight"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
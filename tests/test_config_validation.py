@@ -106,6 +106,7 @@ CHECK_INTERVAL=60
         }, clear=True):
             config = Config()
             self.assertEqual(config.check_interval, 60)  # значение по умолчанию
+            self.assertFalse(config.cache_write_behind)
 
 
 if __name__ == '__main__':
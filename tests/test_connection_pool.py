@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Тесты пула соединений асинхронного клиента
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import aiohttp
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.async_watcher import AsyncGitLabWatcher
+from glping.config import Config
+
+
+class TestConnectionPool(unittest.IsolatedAsyncioTestCase):
+    """Тесты настройки и переиспользования сессии aiohttp"""
+
+    async def test_connector_settings(self):
+        """Тест параметров пула соединений и таймаутов"""
+        api = AsyncGitLabAPI(
+            "https://gitlab.example.com", "test_token",
+            limit_per_host=7, keepalive_timeout=45, dns_cache_ttl=120,
+            timeout=5, connect_timeout=1, read_timeout=2,
+        )
+        async with api:
+            connector = api.session.connector
+            self.assertEqual(connector.limit_per_host, 7)
+            self.assertEqual(connector._keepalive_timeout, 45)
+            self.assertTrue(connector.use_dns_cache)
+            self.assertEqual(
+                api.session.timeout, aiohttp.ClientTimeout(total=5, connect=1, sock_read=2)
+            )
+        self.assertIsNone(api.session)
+
+    async def test_session_reused(self):
+        """Тест повторного использования открытой сессии"""
+        api = AsyncGitLabAPI("https://gitlab.example.com", "test_token")
+        await api.init_session()
+        session = api.session
+        await api.init_session()
+        self.assertIs(api.session, session)
+        await api.close()
+
+    async def test_prewarm_connections(self):
+        """Тест заранее открываемых соединений"""
+        api = AsyncGitLabAPI(
+            "https://gitlab.example.com", "test_token",
+            limit_per_host=2, prewarm_connections=5,
+        )
+        urls = []
+
+        class WarmResponse:
+            async def read(self):
+                return b""
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return False
+
+        def fake_get(self, url, **kwargs):
+            urls.append(url)
+            return WarmResponse()
+
+        with patch.object(aiohttp.ClientSession, "get", fake_get):
+            await api.init_session()
+        await api.close()
+
+        # Не больше соединений, чем позволяет пул
+        self.assertEqual(urls, ["https://gitlab.example.com/api/v4/version"] * 2)
+
+    async def test_watcher_builds_client_from_config(self):
+        """Тест создания клиента наблюдателем из параметров конфигурации"""
+        env = {
+            "GITLAB_URL": "https://gitlab.com",
+            "GITLAB_TOKEN": "test_token_123456789",
+            "WORKER_POOL_SIZE": "8",
+            "ADAPTIVE_CONCURRENCY": "false",
+            "RETRY_MAX": "5",
+            "HTTP_TIMEOUT_TOTAL": "20",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = Config()
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        config.cache_file = os.path.join(temp_dir, "cache.json")
+
+        api = AsyncGitLabWatcher(config).api
+
+        self.assertEqual(api.timeout.total, 20)
+        self.assertEqual(api.retry_policy.max_retries, 5)
+        self.assertEqual(api.concurrency_limiter.get_state()["max_limit"], 8)
+        self.assertEqual(api.limit_per_host, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Тесты индекса дедупликации обработанных событий
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from glping.cache import PROJECT_EVENTS_LIMIT, Cache
+from glping.event_index import BoundedEventSet, EventIdRanges, ProjectEventIndex, encode_event_key
+from glping.utils.event_utils import (
+    is_new_job_event, is_new_pipeline_event, save_job_event_to_cache,
+    save_pipeline_event_to_cache
+)
+
+
+class TestBoundedEventSet(unittest.TestCase):
+    """Тесты ограниченного множества ключей событий"""
+
+    def test_add_and_contains(self):
+        """Тест добавления и проверки наличия ключей"""
+        events = BoundedEventSet(maxlen=3)
+        self.assertTrue(events.add(1))
+        self.assertFalse(events.add(1))
+        self.assertIn(1, events)
+        self.assertNotIn(2, events)
+        self.assertEqual(len(events), 1)
+
+    def test_oldest_keys_are_evicted(self):
+        """Тест вытеснения самых старых ключей"""
+        events = BoundedEventSet([1, 2, 3], maxlen=3)
+        events.add(4)
+        self.assertEqual(events.to_list(), [2, 3, 4])
+        self.assertNotIn(1, events)
+
+    def test_readding_refreshes_order(self):
+        """Тест обновления ключа при повторном добавлении"""
+        events = BoundedEventSet([1, 2, 3], maxlen=3)
+        events.add(1)
+        events.add(4)
+        self.assertEqual(events.to_list(), [3, 1, 4])
+
+    def test_live_evictions_counted(self):
+        """Тест подсчета вытеснений ключей текущего цикла"""
+        events = BoundedEventSet([1, 2], maxlen=2)
+        events.add(3, cycle=1)
+        events.add(4, cycle=1)
+        events.add(5, cycle=1)
+        self.assertEqual(events.evictions, 3)
+        self.assertEqual(events.live_evictions, 1)
+
+
+class TestEventIdRanges(unittest.TestCase):
+    """Тесты множества ID событий с водяным знаком"""
+
+    def test_contiguous_ids_collapse(self):
+        """Тест склейки соседних ID в диапазоны"""
+        events = EventIdRanges()
+        for event_id in (5, 7, 6, 10):
+            self.assertTrue(events.add(event_id))
+        self.assertFalse(events.add(6))
+        self.assertEqual(events.to_dict(), {"r": [[5, 7], 10]})
+        self.assertIn(6, events)
+        self.assertNotIn(8, events)
+
+    def test_watermark_absorbs_ranges(self):
+        """Тест поглощения диапазонов водяным знаком"""
+        events = EventIdRanges([3, 20, 21])
+        events.advance(10)
+        self.assertIn(1, events)
+        self.assertNotIn(15, events)
+        self.assertEqual(events.to_dict(), {"w": 10, "r": [[20, 21]]})
+
+        events.add(11)
+        events.advance(19)
+        self.assertEqual(events.to_dict(), {"w": 21, "r": []})
+        self.assertFalse(events.add(21))
+
+    def test_excess_ranges_dropped(self):
+        """Тест ограничения числа диапазонов без сдвига водяного знака"""
+        events = EventIdRanges([1, 3, 5], maxlen=2)
+        self.assertEqual(events.to_dict(), {"r": [3, 5]})
+        self.assertEqual(events.evictions, 1)
+
+        # Неполученные ID между диапазонами не считаются обработанными
+        events = EventIdRanges({"w": 10, "r": [12, 20, 30]}, maxlen=2)
+        self.assertEqual(events.watermark, 10)
+        for event_id in (11, 12, 13, 19):
+            self.assertNotIn(event_id, events)
+        self.assertIn(20, events)
+
+    def test_round_trip(self):
+        """Тест восстановления из сериализованного вида"""
+        events = EventIdRanges([2, 3, 4, 7])
+        events.advance(0)
+        restored = EventIdRanges(events.to_dict())
+        self.assertEqual(list(restored), [2, 3, 4, 7])
+        self.assertEqual(restored.watermark, 0)
+
+
+class TestProjectEventIndex(unittest.TestCase):
+    """Тесты индекса событий проекта по типам"""
+
+    def test_kinds_do_not_evict_each_other(self):
+        """Тест раздельной емкости для типов событий"""
+        index = ProjectEventIndex(capacity=5)
+        for event_id in range(5):
+            index.add(event_id)
+        for pipeline_id in range(50):
+            index.add(f"pipeline_{pipeline_id}_success")
+
+        for event_id in range(5):
+            self.assertIn(event_id, index)
+        self.assertEqual(len(index.stores["pipeline"]), 5)
+
+    def test_legacy_list_is_split_by_kind(self):
+        """Тест загрузки общего списка старого формата"""
+        index = ProjectEventIndex([1, "job_2_failed", "deployment_3_success"], capacity=1)
+        self.assertIn(1, index)
+        self.assertIn("job_2_failed", index)
+        self.assertIn(encode_event_key("job_2_failed"), index.stores["job"])
+        self.assertEqual(
+            index.to_dict(),
+            {"event": {"r": [1]}, "job": [[2, 6]], "deployment": [[3, 5]]},
+        )
+
+    def test_ci_keys_encoded_as_integers(self):
+        """Тест компактного кодирования CI/CD ключей"""
+        self.assertEqual(encode_event_key("pipeline_5_success"), (1, 5, 5))
+        self.assertEqual(encode_event_key("job_7_waiting_for_resource"), (2, 7, 1))
+        self.assertEqual(encode_event_key("deployment_9_unknown"), (3, 9, "unknown"))
+        self.assertEqual(encode_event_key(42), 42)
+        self.assertEqual(encode_event_key("note_1"), "note_1")
+
+    def test_capacity_follows_cycle_throughput(self):
+        """Тест подбора емкости по числу ключей за цикл"""
+        index = ProjectEventIndex(capacity=10, max_capacity=100)
+        for job_id in range(20):
+            index.add(f"job_{job_id}_success", cycle=0)
+        stats = index.end_cycle(0)
+        self.assertEqual(stats["job"]["capacity"], 60)
+        self.assertEqual(stats["job"]["live_evictions"], 10)
+
+        for job_id in range(50):
+            index.add(f"job_{job_id}_success", cycle=1)
+        self.assertEqual(index.end_cycle(1)["job"]["capacity"], 100)
+
+        # При спаде нагрузки емкость уменьшается постепенно
+        index.add("job_1_success", cycle=2)
+        self.assertEqual(index.end_cycle(2)["job"]["capacity"], 50)
+
+
+class TestCacheEventIndex(unittest.TestCase):
+    """Тесты индекса событий в кеше"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, "test_cache.json")
+
+    def tearDown(self):
+        """Очистка тестового окружения"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_events_serialized_by_kind(self):
+        """Тест компактной сериализации индекса в файл кеша"""
+        cache = Cache(self.cache_file)
+        cache.save_project_event(123, 1)
+        cache.save_project_event(123, "pipeline_5_success")
+
+        with open(self.cache_file, "r") as f:
+            data = json.load(f)
+        self.assertEqual(
+            data["projects"]["123"]["events"],
+            {"event": {"r": [1]}, "pipeline": [[5, 5]]},
+        )
+
+        cache2 = Cache(self.cache_file)
+        self.assertIn(1, cache2.get_project_events(123))
+        self.assertIn("pipeline_5_success", cache2.get_project_events(123))
+
+    def test_events_limit(self):
+        """Тест ограничения числа хранимых диапазонов ID событий проекта"""
+        cache = Cache(self.cache_file, write_behind=True)
+        for event_id in range(0, 2 * (PROJECT_EVENTS_LIMIT + 10), 2):
+            cache.save_project_event(123, event_id)
+
+        events = cache.get_project_events(123).stores["event"]
+        self.assertEqual(len(events), PROJECT_EVENTS_LIMIT)
+        # Вытесненные диапазоны забыты, водяной знак не сдвинут
+        self.assertIsNone(events.watermark)
+        self.assertNotIn(0, events)
+        self.assertIn(20, events)
+        self.assertNotIn(21, events)
+        self.assertIn(2 * (PROJECT_EVENTS_LIMIT + 9), events)
+
+    def test_last_event_id_advances_watermark(self):
+        """Тест сжатия индекса событий после обновления last_event_id"""
+        cache = Cache(self.cache_file)
+        for event_id in (100, 250, 400):
+            cache.save_project_event(123, event_id)
+        cache.set_last_event_id(123, 400)
+
+        with open(self.cache_file, "r") as f:
+            data = json.load(f)
+        self.assertEqual(data["projects"]["123"]["events"], {"event": {"w": 400, "r": []}})
+        self.assertIn(250, cache.get_project_events(123))
+        self.assertNotIn(401, cache.get_project_events(123))
+
+    def test_ci_helpers_share_index(self):
+        """Тест общего индекса для is_new_*/save_*_to_cache"""
+        cache = Cache(self.cache_file, write_behind=True)
+        pipeline = {"id": 1001, "status": "running"}
+        job = {"id": 2001, "status": "running"}
+
+        self.assertTrue(is_new_pipeline_event(pipeline, 123, cache))
+        save_pipeline_event_to_cache(pipeline, 123, cache)
+        self.assertFalse(is_new_pipeline_event(pipeline, 123, cache))
+
+        # Job с тем же ID и статусом — другой ключ
+        self.assertTrue(is_new_job_event(job, 123, cache))
+        save_job_event_to_cache(job, 123, cache)
+        self.assertFalse(is_new_job_event(job, 123, cache))
+
+        pipeline["status"] = "success"
+        self.assertTrue(is_new_pipeline_event(pipeline, 123, cache))
+
+    def test_seen_keys_are_not_evicted(self):
+        """Тест защиты от вытеснения объектов, которые API возвращает каждый цикл"""
+        cache = Cache(self.cache_file, write_behind=True, events_capacity=3, events_capacity_max=3)
+        running = {"id": 1, "status": "running"}
+        save_pipeline_event_to_cache(running, 123, cache)
+        for pipeline_id in range(2, 6):
+            self.assertFalse(is_new_pipeline_event(running, 123, cache))
+            save_pipeline_event_to_cache({"id": pipeline_id, "status": "success"}, 123, cache)
+
+        self.assertFalse(is_new_pipeline_event(running, 123, cache))
+
+    def test_end_cycle_collects_metrics(self):
+        """Тест метрик вытеснений и подбора емкости по итогам цикла"""
+        cache = Cache(self.cache_file, write_behind=True, events_capacity=5, events_capacity_max=20)
+        for job_id in range(10):
+            save_job_event_to_cache({"id": job_id, "status": "success"}, 123, cache)
+
+        cycle_metrics = cache.end_cycle()
+        self.assertEqual(cycle_metrics["job"], {"evictions": 5, "live_evictions": 5})
+
+        metrics = cache.get_dedup_metrics()
+        self.assertEqual(metrics["job"]["live_evictions"], 5)
+        self.assertEqual(metrics["job"]["capacity"], 20)
+        self.assertEqual(metrics["pipeline"]["keys"], 0)
+
+        # После увеличения емкости тот же объем не вызывает вытеснений
+        for job_id in range(10, 20):
+            save_job_event_to_cache({"id": job_id, "status": "success"}, 123, cache)
+        self.assertEqual(cache.end_cycle()["job"]["live_evictions"], 0)
+
+    def test_unknown_project_has_no_events(self):
+        """Тест пустого индекса для неизвестного проекта"""
+        cache = Cache(self.cache_file)
+        self.assertEqual(len(cache.get_project_events(999)), 0)
+        self.assertNotIn("999", cache.data["projects"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Тесты листания событий проекта до последнего известного ID
+"""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+
+
+def make_page(first_id, count):
+    """Страница событий с убывающими ID"""
+    return [{"id": first_id - i} for i in range(count)]
+
+
+class TestAsyncSinceIdPagination(unittest.IsolatedAsyncioTestCase):
+    """Тесты асинхронного получения событий после since_id"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.api = AsyncGitLabAPI("https://gitlab.example.com", "test_token")
+
+    async def test_stops_on_known_event(self):
+        """Тест остановки листания на первом известном событии"""
+        pages = [(make_page(1000, 100), {}), (make_page(900, 100), {}), (make_page(800, 100), {})]
+        self.api._request_page = AsyncMock(side_effect=pages)
+
+        events = await self.api.get_project_events(123, since_id=850)
+
+        self.assertEqual(self.api._request_page.call_count, 2)
+        self.assertEqual([e["id"] for e in events], list(range(1000, 850, -1)))
+        params = self.api._request_page.call_args.args[2]
+        self.assertEqual(params["sort"], "desc")
+
+    async def test_steady_state_costs_one_request(self):
+        """Тест одного запроса, когда новых событий нет"""
+        self.api._request_page = AsyncMock(return_value=(make_page(500, 100), {}))
+
+        events = await self.api.get_project_events(123, since_id=500)
+
+        self.assertEqual(events, [])
+        self.api._request_page.assert_called_once()
+
+
+class TestSyncSinceIdPagination(unittest.TestCase):
+    """Тесты синхронного получения событий после since_id"""
+
+    def test_iterator_stops_on_known_event(self):
+        """Тест прекращения чтения итератора на известном событии"""
+        from glping.gitlab_api import GitLabAPI
+
+        with patch('glping.gitlab_api.gitlab') as mock_gitlab:
+            mock_gl = MagicMock()
+            mock_gitlab.Gitlab.return_value = mock_gl
+            project = mock_gl.projects.get.return_value
+
+            consumed = []
+
+            def events_iterator(**kwargs):
+                for event_id in range(1000, 0, -1):
+                    consumed.append(event_id)
+                    yield MagicMock(asdict=lambda event_id=event_id: {"id": event_id})
+
+            project.events.list.side_effect = events_iterator
+
+            api = GitLabAPI("https://gitlab.example.com", "test_token")
+            events = api.get_project_events(123, since_id=995)
+
+            self.assertEqual([e["id"] for e in events], [1000, 999, 998, 997, 996])
+            self.assertEqual(len(consumed), 6)
+            kwargs = project.events.list.call_args.kwargs
+            self.assertTrue(kwargs["iterator"])
+            self.assertEqual(kwargs["sort"], "desc")
+
+
+if __name__ == '__main__':
+    unittest.main()
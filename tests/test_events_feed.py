@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Тесты получения событий лентой пользователя
+"""
+
+import unittest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, patch
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.async_watcher import AsyncGitLabWatcher
+from tests.helpers import WatcherTestCase, paged
+
+
+class TestUserEventsRequest(unittest.IsolatedAsyncioTestCase):
+    """Тесты запроса ленты событий пользователя"""
+
+    async def test_feed_stops_on_known_event(self):
+        """Тест листания ленты до последнего обработанного события"""
+        api = AsyncGitLabAPI("https://gitlab.example.com", "test_token")
+        page = [{"id": 30, "project_id": 1}, {"id": 20, "project_id": 2}, {"id": 10, "project_id": 1}]
+        api._request_page = AsyncMock(return_value=(page, {}))
+
+        events = await api.get_user_events(since_id=15)
+
+        self.assertEqual([e["id"] for e in events], [30, 20])
+        endpoint, params = api._request_page.call_args.args[1:3]
+        self.assertEqual(endpoint, "events")
+        self.assertEqual(params["scope"], "all")
+        self.assertEqual(params["sort"], "desc")
+        self.assertIn("project_id", params["fields"])
+
+
+class TestAsyncEventsFeed(WatcherTestCase):
+    """Тесты режима ленты событий в асинхронном наблюдателе"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        super().setUp()
+        self.config.events_feed = True
+
+    async def test_events_routed_to_projects(self):
+        """Тест раскладки событий ленты по проектам без запросов событий проектов"""
+        now = datetime.now(timezone.utc)
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        mock_api.iter_projects.side_effect = paged([{"id": 1, "name": "One"}, {"id": 2, "name": "Two"}])
+        mock_api.get_project.return_value = {"id": 3, "name": "Three"}
+        mock_api.get_user_events.return_value = [
+            {"id": 103, "project_id": 3, "created_at": now.isoformat()},
+            {"id": 102, "project_id": 1, "created_at": now.isoformat()},
+            {"id": 101, "project_id": 1, "created_at": now.isoformat()},
+        ]
+        for method in ("get_project_pipelines", "get_project_jobs", "get_project_deployments"):
+            getattr(mock_api, method).return_value = []
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            watcher._process_event_async = AsyncMock()
+            await watcher.cache.set_last_checked_async((now - timedelta(hours=1)).isoformat())
+
+            await watcher.check_projects()
+
+            mock_api.iter_project_events.assert_not_called()
+            mock_api.get_project.assert_awaited_once_with(3)
+            self.assertEqual(watcher.cache.get_last_event_id(1), 102)
+            self.assertEqual(watcher.cache.get_last_event_id(3), 103)
+            self.assertIsNone(watcher.cache.get_last_event_id(2))
+            self.assertEqual(watcher.cache.get_feed_event_id(), 103)
+            # CI/CD по-прежнему запрашивается по проектам
+            self.assertEqual(mock_api.get_project_pipelines.await_count, 3)
+
+            await watcher.check_projects()
+            self.assertEqual(mock_api.get_user_events.call_args.kwargs, {"since_id": 103})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Тесты пакетной загрузки pipelines через GraphQL
+"""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from glping.graphql_ci import GraphQLCIFetcher
+from glping.resilience import APIRequestError
+
+
+def project_node(path, pipeline_ids, has_next=False):
+    """Узел проекта из ответа GraphQL"""
+    return {
+        "fullPath": path,
+        "pipelines": {
+            "pageInfo": {"hasNextPage": has_next},
+            "nodes": [
+                {
+                    "id": f"gid://gitlab/Ci::Pipeline/{pipeline_id}",
+                    "status": "SUCCESS",
+                    "ref": "main",
+                    "path": f"/{path}/-/pipelines/{pipeline_id}",
+                    "createdAt": "2024-01-01T10:00:00Z",
+                    "jobs": {
+                        "pageInfo": {"hasNextPage": False},
+                        "nodes": [
+                            {
+                                "id": f"gid://gitlab/Ci::Build/{pipeline_id * 10}",
+                                "name": "test",
+                                "status": "FAILED",
+                                "stage": {"name": "test"},
+                                "createdAt": "2024-01-01T10:00:00Z",
+                            }
+                        ],
+                    },
+                }
+                for pipeline_id in pipeline_ids
+            ],
+        },
+    }
+
+
+class TestGraphQLCIFetcher(unittest.IsolatedAsyncioTestCase):
+    """Тесты загрузчика pipelines и jobs"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.api = MagicMock()
+        self.api.url = "https://gitlab.example.com"
+        self.api.get_project_pipelines = AsyncMock(return_value=[{"id": 99}])
+        self.api.get_project_jobs = AsyncMock(return_value=[])
+        self.projects = [
+            {"id": 1, "path_with_namespace": "g/a"},
+            {"id": 2, "path_with_namespace": "g/b"},
+            {"id": 3, "path_with_namespace": "g/c"},
+        ]
+
+    async def test_batches_and_converts(self):
+        """Тест разбиения на пакеты и приведения к виду REST API"""
+        async def graphql(query, variables):
+            nodes = {
+                "g/a": project_node("g/a", [11]),
+                "g/b": project_node("g/b", [21, 22]),
+                "g/c": project_node("g/c", [], has_next=True),
+            }
+            return {"projects": {"nodes": [nodes[path] for path in variables["paths"]]}}
+
+        self.api.graphql = AsyncMock(side_effect=graphql)
+        fetcher = GraphQLCIFetcher(self.api, batch_size=2)
+
+        await fetcher.prefetch(self.projects, updated_after="2024-01-01T00:00:00Z")
+
+        self.assertEqual(self.api.graphql.await_count, 2)
+        self.assertEqual(fetcher.requests, 2)
+        pipelines = await fetcher.get_project_pipelines(2)
+        self.assertEqual([p["id"] for p in pipelines], [21, 22])
+        self.assertEqual(pipelines[0]["status"], "success")
+        self.assertEqual(pipelines[0]["web_url"], "https://gitlab.example.com/g/b/-/pipelines/21")
+        jobs = await fetcher.get_project_jobs(2)
+        self.assertEqual([(j["id"], j["status"], j["stage"]) for j in jobs],
+                         [(220, "failed", "test"), (210, "failed", "test")])
+        self.api.get_project_pipelines.assert_not_called()
+
+        # Не поместившийся в запрос проект проверяется через REST
+        self.assertEqual(await fetcher.get_project_pipelines(3, updated_after="x"), [{"id": 99}])
+        self.api.get_project_pipelines.assert_awaited_once_with(3, updated_after="x", watermark=None)
+
+    async def test_failed_batch_falls_back_to_rest(self):
+        """Тест использования REST API после ошибки GraphQL запроса"""
+        self.api.graphql = AsyncMock(side_effect=APIRequestError("complexity"))
+        fetcher = GraphQLCIFetcher(self.api)
+
+        await fetcher.prefetch(self.projects)
+
+        self.assertEqual(await fetcher.get_project_pipelines(1), [{"id": 99}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Тесты условных запросов с ETag / If-None-Match
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.http_cache import ValidatorCache
+from tests.helpers import FakeResponse, FakeSession
+
+
+class TestValidatorCache(unittest.TestCase):
+    """Тесты кеша валидаторов"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Очистка тестового окружения"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_key_ignores_param_order(self):
+        """Тест ключа, не зависящего от порядка параметров"""
+        self.assertEqual(
+            ValidatorCache.make_key("u", {"a": 1, "b": 2}),
+            ValidatorCache.make_key("u", {"b": 2, "a": 1}),
+        )
+
+    def test_max_entries(self):
+        """Тест вытеснения давно не использованных ответов"""
+        cache = ValidatorCache(max_entries=2)
+        cache.store("a", '"1"', [1], {})
+        cache.store("b", '"2"', [2], {})
+        cache.reuse("a")
+        cache.store("c", '"3"', [3], {})
+        self.assertIsNotNone(cache.get_etag("a"))
+        self.assertIsNone(cache.get_etag("b"))
+
+    def test_persistence(self):
+        """Тест сохранения кеша между запусками"""
+        cache_file = os.path.join(self.temp_dir, "http_cache.json")
+        cache = ValidatorCache(cache_file)
+        cache.store("a", 'W/"1"', [{"id": 1}], {"X-Next-Page": "", "Content-Type": "json"})
+        cache.save()
+
+        cache2 = ValidatorCache(cache_file)
+        self.assertEqual(cache2.get_etag("a"), 'W/"1"')
+        self.assertEqual(cache2.reuse("a"), ([{"id": 1}], {"X-Next-Page": ""}))
+
+
+class TestConditionalRequests(unittest.IsolatedAsyncioTestCase):
+    """Тесты условных запросов AsyncGitLabAPI"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.api = AsyncGitLabAPI("https://gitlab.example.com", "test_token")
+
+    async def test_not_modified_returns_cached_body(self):
+        """Тест возврата сохраненного тела на 304 Not Modified"""
+        body = [{"id": 1, "status": "success"}]
+        not_modified = FakeResponse(status=304)
+        self.api.session = FakeSession([
+            FakeResponse(body=body, headers={"ETag": 'W/"abc"', "X-Next-Page": ""}),
+            not_modified,
+        ])
+
+        first = await self.api._make_request("GET", "projects/1/pipelines", {"page": "1"})
+        second, headers = await self.api._request_page("GET", "projects/1/pipelines", {"page": "1"})
+
+        self.assertEqual(first, body)
+        self.assertEqual(second, body)
+        self.assertEqual(headers, {"X-Next-Page": ""})
+        self.assertEqual(not_modified.json_calls, 0)
+        self.assertIsNone(self.api.session.requests[0]["headers"])
+        self.assertEqual(self.api.session.requests[1]["headers"], {"If-None-Match": 'W/"abc"'})
+        self.assertEqual(self.api.validator_cache.hits, 1)
+
+    async def test_changed_response_replaces_entry(self):
+        """Тест обновления сохраненного ответа при изменении данных"""
+        self.api.session = FakeSession([
+            FakeResponse(body=[{"id": 1}], headers={"ETag": '"v1"'}),
+            FakeResponse(body=[{"id": 2}], headers={"ETag": '"v2"'}),
+            FakeResponse(status=304),
+        ])
+
+        await self.api._make_request("GET", "projects")
+        await self.api._make_request("GET", "projects")
+        result = await self.api._make_request("GET", "projects")
+
+        self.assertEqual(result, [{"id": 2}])
+        self.assertEqual(self.api.session.requests[2]["headers"], {"If-None-Match": '"v2"'})
+
+    async def test_event_pages_not_stored(self):
+        """Тест запросов событий без сохранения тела и If-None-Match"""
+        self.api.session = FakeSession([
+            FakeResponse(body=[{"id": 1}], headers={"ETag": '"v1"'}),
+            FakeResponse(body=[{"id": 1}], headers={"ETag": '"v1"'}),
+        ])
+
+        await self.api._make_request("GET", "projects/1/events")
+        await self.api._make_request("GET", "projects/1/events")
+
+        self.assertEqual(len(self.api.validator_cache), 0)
+        self.assertIsNone(self.api.session.requests[1]["headers"])
+
+    def test_cacheable_paths(self):
+        """Тест списков, ответы которых сохраняются"""
+        base = "https://gitlab.example.com/api/v4"
+        self.assertTrue(ValidatorCache.is_cacheable(f"{base}/projects"))
+        self.assertTrue(ValidatorCache.is_cacheable(f"{base}/projects?pagination=keyset&id_after=5"))
+        self.assertTrue(ValidatorCache.is_cacheable(f"{base}/projects/12/deployments"))
+        self.assertFalse(ValidatorCache.is_cacheable(f"{base}/projects/12/events"))
+        self.assertFalse(ValidatorCache.is_cacheable(f"{base}/projects/12/jobs"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Тесты кеша с журналом изменений
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from glping.cache import create_cache
+from glping.journal_cache import JournalCache
+
+
+class TestJournalCache(unittest.TestCase):
+    """Тесты журнала изменений кеша"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, "test_cache.json")
+        self.journal_file = self.cache_file + ".journal"
+
+    def tearDown(self):
+        """Очистка тестового окружения"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_factory_creates_journal_cache(self):
+        """Тест выбора хранилища через фабрику"""
+        cache = create_cache(self.cache_file, backend="journal", journal_max_bytes=4096)
+        self.assertIsInstance(cache, JournalCache)
+        self.assertEqual(cache.journal_max_bytes, 4096)
+        cache.close()
+
+    def test_changes_are_appended_without_snapshot_rewrite(self):
+        """Тест записи изменений в журнал без перезаписи снимка"""
+        cache = JournalCache(self.cache_file)
+
+        with patch.object(cache, "_write_cache_file") as mock_write:
+            cache.set_last_event_id(123, 456)
+            cache.save_project_event(123, 456)
+            cache.set_project_activity(123, "2025-09-30T15:30:00Z")
+            mock_write.assert_not_called()
+
+        with open(self.journal_file, "r") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0]["s"], "projects")
+        self.assertEqual(records[0]["k"], "123")
+        self.assertEqual(records[-1]["v"], "2025-09-30T15:30:00Z")
+        cache.close()
+
+    def test_replay_restores_exact_state(self):
+        """Тест восстановления состояния из снимка и журнала после сбоя"""
+        cache = JournalCache(self.cache_file)
+        cache.set_last_event_id(123, 456)
+        cache.save_project_path(123, "group/project")
+        cache.set_project_activity(123, "2025-09-30T15:30:00Z")
+        cache.set_last_checked("2025-09-30T16:00:00+00:00")
+        # Имитируем сбой: журнал не закрыт, последняя запись оборвана
+        with open(self.journal_file, "a") as f:
+            f.write('{"s": "projects", "k": "1')
+
+        cache2 = JournalCache(self.cache_file)
+        self.assertEqual(cache2.get_last_event_id(123), 456)
+        self.assertEqual(cache2.get_project_path(123), "group/project")
+        self.assertEqual(cache2.get_project_activity(123), "2025-09-30T15:30:00Z")
+        self.assertEqual(cache2.get_last_checked(), "2025-09-30T16:00:00+00:00")
+        self.assertNotIn("1", cache2.data["projects"])
+
+        # Восстановленный журнал свернут в снимок
+        self.assertFalse(os.path.exists(self.journal_file))
+        cache2.close()
+
+    def test_compaction_after_size_threshold(self):
+        """Тест компактизации журнала после превышения порога"""
+        cache = JournalCache(self.cache_file, journal_max_bytes=512)
+        for project_id in range(20):
+            cache.set_last_event_id(project_id, project_id * 10)
+        cache.close()
+
+        self.assertTrue(os.path.exists(self.cache_file))
+        self.assertFalse(os.path.exists(self.journal_file + ".old"))
+        self.assertLess(os.path.getsize(self.journal_file), 512)
+
+        cache2 = JournalCache(self.cache_file)
+        for project_id in range(20):
+            self.assertEqual(cache2.get_last_event_id(project_id), project_id * 10)
+        cache2.close()
+
+    def test_rotated_journal_is_replayed(self):
+        """Тест воспроизведения журнала прерванной компактизации"""
+        cache = JournalCache(self.cache_file)
+        cache.set_last_event_id(123, 456)
+        cache.close()
+        os.replace(self.journal_file, self.journal_file + ".old")
+
+        cache2 = JournalCache(self.cache_file)
+        self.assertEqual(cache2.get_last_event_id(123), 456)
+        self.assertFalse(os.path.exists(self.journal_file + ".old"))
+        cache2.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,8 +5,6 @@
 
 import asyncio
 import json
-import os
-import tempfile
 import unittest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -15,29 +13,12 @@ from glping.async_gitlab_api import AsyncGitLabAPI
 from glping.async_watcher import AsyncGitLabWatcher
 from glping.cache import Cache
 from glping.config import Config
+from tests.helpers import WatcherTestCase, paged
 
 
-class TestOptimizedFiltering(unittest.IsolatedAsyncioTestCase):
+class TestOptimizedFiltering(WatcherTestCase):
     """Тесты оптимизированной фильтрации проектов"""
 
-    def setUp(self):
-        """Подготовка тестового окружения"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.cache_file = os.path.join(self.temp_dir, "test_cache.json")
-        
-        # Создаем тестовую конфигурацию
-        self.config = MagicMock()
-        self.config.gitlab_url = "https://gitlab.example.com"
-        self.config.gitlab_token = "test_token"
-        self.config.cache_file = self.cache_file
-        self.config.get_project_filter.return_value = {"membership": True}
-
-    def tearDown(self):
-        """Очистка тестового окружения"""
-        if os.path.exists(self.cache_file):
-            os.unlink(self.cache_file)
-        os.rmdir(self.temp_dir)
-
     async def test_server_side_filtering_with_last_activity_after(self):
         """Тест серверной фильтрации с параметром last_activity_after"""
         # Создаем мок API
@@ -59,7 +40,7 @@ class TestOptimizedFiltering(unittest.IsolatedAsyncioTestCase):
             }
         ]
         
-        mock_api.get_projects.return_value = active_projects
+        mock_api.iter_projects.side_effect = paged(active_projects)
         
         # Создаем watcher с мок API
         with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
@@ -69,12 +50,14 @@ class TestOptimizedFiltering(unittest.IsolatedAsyncioTestCase):
             # Устанавливаем дату последней проверки
             last_checked = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
             await watcher.cache.set_last_checked_async(last_checked)
+            # Каталог проектов недавно сверен: запрашиваются только активные проекты
+            watcher.cache.replace_catalogue(active_projects, datetime.now(timezone.utc).isoformat())
             
             # Выполняем проверку
             await watcher.check_projects(verbose=False)
             
             # Проверяем, что API был вызван с фильтрацией
-            mock_api.get_projects.assert_called_once_with(
+            mock_api.iter_projects.assert_called_once_with(
                 membership=True,
                 fields=[
                     "id",
@@ -86,6 +69,77 @@ class TestOptimizedFiltering(unittest.IsolatedAsyncioTestCase):
                 last_activity_after=last_checked
             )
 
+    async def test_periodic_catalogue_refresh(self):
+        """Тест полной сверки каталога проектов по истечении периода"""
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        mock_api.iter_projects.side_effect = paged([
+            {"id": 1, "name": "Project 1", "path_with_namespace": "group/project-1",
+             "last_activity_at": "2025-09-28T10:00:00Z"},
+        ])
+        mock_api.iter_project_events.side_effect = paged()
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            now = datetime.now(timezone.utc)
+            await watcher.cache.set_last_checked_async((now - timedelta(hours=2)).isoformat())
+            watcher.cache.replace_catalogue(
+                [{"id": 1, "path_with_namespace": "group/project-1"},
+                 {"id": 2, "path_with_namespace": "group/removed"}],
+                (now - timedelta(days=2)).isoformat(),
+            )
+
+            await watcher.check_projects(verbose=False)
+
+            # Полный список без last_activity_after
+            self.assertNotIn("last_activity_after", mock_api.iter_projects.call_args.kwargs)
+            self.assertEqual(list(watcher.cache.get_catalogue()), [1])
+            self.assertFalse(watcher.cache.is_catalogue_refresh_due())
+
+    async def test_catalogue_rename_updates_project_path(self):
+        """Тест нового пути проекта после переименования, найденного сверкой каталога"""
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            watcher.cache.update_catalogue([{"id": 1, "path_with_namespace": "group/old"}])
+            self.assertEqual(await watcher._get_project_path_async(1), "group/old")
+
+            watcher.cache.replace_catalogue(
+                [{"id": 1, "path_with_namespace": "other-group/new"}],
+                datetime.now(timezone.utc).isoformat(),
+            )
+
+            self.assertEqual(await watcher._get_project_path_async(1), "other-group/new")
+            mock_api.get_projects.assert_not_awaited()
+            await watcher.cache.flush_async()
+
+    async def test_checks_start_before_listing_ends(self):
+        """Тест проверки проектов первой страницы до получения следующих страниц"""
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        first_checked = asyncio.Event()
+
+        async def iter_projects(**kwargs):
+            yield [{"id": 1, "name": "Project 1"}]
+            # Вторая страница придет только после проверки проекта первой
+            await asyncio.wait_for(first_checked.wait(), timeout=1)
+            yield [{"id": 2, "name": "Project 2"}]
+
+        mock_api.iter_projects.side_effect = iter_projects
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            checked = []
+
+            async def check(project, verbose=False, events=None, since=None):
+                checked.append(project["id"])
+                first_checked.set()
+
+            watcher._check_project_events = check
+            await watcher.check_projects(verbose=False)
+
+        self.assertEqual(checked, [1, 2])
+        self.assertEqual(sorted(watcher.cache.get_catalogue()), [1, 2])
+
     async def test_first_run_without_filtering(self):
         """Тест первого запуска без фильтрации"""
         # Создаем мок API
@@ -107,7 +161,7 @@ class TestOptimizedFiltering(unittest.IsolatedAsyncioTestCase):
             }
         ]
         
-        mock_api.get_projects.return_value = all_projects
+        mock_api.iter_projects.side_effect = paged(all_projects)
         
  # Создаем watcher с мок API
         with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
@@ -125,7 +179,7 @@ class TestOptimizedFiltering(unittest.IsolatedAsyncioTestCase):
             await watcher.check_projects(verbose=False)
             
             # Проверяем, что API был вызван БЕЗ параметра last_activity_after
-            mock_api.get_projects.assert_called_once_with(
+            mock_api.iter_projects.assert_called_once_with(
                 membership=True,
                 fields=[
                     "id",
@@ -148,8 +202,8 @@ class TestOptimizedFiltering(unittest.IsolatedAsyncioTestCase):
             "last_activity_at": "2025-09-30T15:30:00Z"
         }
         
-        mock_api.get_projects.return_value = [test_project]
-        mock_api.get_project_events.return_value = []
+        mock_api.iter_projects.side_effect = paged([test_project])
+        mock_api.iter_project_events.side_effect = paged()
         
         # Создаем watcher с мок API
         with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Тесты общего пагинатора списков GitLab API
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.utils.pagination import (
+    get_next_page, get_total_pages, iter_until_watermark, newest_value, parse_link_header,
+    split_at_watermark
+)
+from tests.helpers import paged
+
+
+def make_pipelines(*updated_at):
+    """Pipelines с указанными датами обновления"""
+    return [{"id": i, "status": "success", "updated_at": value} for i, value in enumerate(updated_at)]
+
+
+class TestPaginationUtils(unittest.TestCase):
+    """Тесты вспомогательных функций пагинации"""
+
+    def test_parse_link_header(self):
+        """Тест разбора заголовка Link"""
+        header = (
+            '<https://gitlab.example.com/api/v4/projects?page=2>; rel="next", '
+            '<https://gitlab.example.com/api/v4/projects?page=1>; rel="first"'
+        )
+        links = parse_link_header(header)
+        self.assertEqual(links["next"], "https://gitlab.example.com/api/v4/projects?page=2")
+        self.assertIn("first", links)
+        self.assertEqual(parse_link_header(None), {})
+
+    def test_get_next_page(self):
+        """Тест определения следующей страницы"""
+        self.assertEqual(get_next_page({"X-Next-Page": "3"}), ("3", None))
+        self.assertEqual(get_next_page({"X-Next-Page": ""}), (None, None))
+        self.assertEqual(
+            get_next_page({"Link": '<https://x/api/v4/p?cursor=a>; rel="next"'}),
+            (None, "https://x/api/v4/p?cursor=a"),
+        )
+
+    def test_get_total_pages(self):
+        """Тест определения числа страниц по заголовкам"""
+        self.assertEqual(get_total_pages({"X-Total-Pages": "42"}, 100), 42)
+        self.assertEqual(get_total_pages({"X-Total": "201"}, 100), 3)
+        self.assertIsNone(get_total_pages({"X-Next-Page": "2"}, 100))
+
+    def test_split_at_watermark(self):
+        """Тест отсечения страницы на водяном знаке"""
+        items = make_pipelines(
+            "2025-09-30T12:00:00Z", "2025-09-30T11:00:00.000Z", "2025-09-30T10:00:00Z"
+        )
+        kept, reached = split_at_watermark(items, "2025-09-30T11:00:00+00:00", "updated_at")
+        self.assertTrue(reached)
+        self.assertEqual([item["id"] for item in kept], [0, 1])
+
+        kept, reached = split_at_watermark(items, None, "updated_at")
+        self.assertFalse(reached)
+        self.assertEqual(len(kept), 3)
+
+    def test_iter_until_watermark_by_id(self):
+        """Тест чтения итератора до известного ID"""
+        items = iter([{"id": 5}, {"id": 4}, {"id": 3}])
+        self.assertEqual([item["id"] for item in iter_until_watermark(items, 4, "id")], [5])
+
+    def test_newest_value(self):
+        """Тест выбора самой поздней даты"""
+        items = make_pipelines("2025-09-30T10:00:00Z", "2025-09-30T12:00:00Z", None)
+        self.assertEqual(newest_value(items, "updated_at"), "2025-09-30T12:00:00Z")
+        self.assertIsNone(newest_value([], "updated_at"))
+
+
+class TestAsyncPaginator(unittest.IsolatedAsyncioTestCase):
+    """Тесты асинхронного пагинатора"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.api = AsyncGitLabAPI("https://gitlab.example.com", "test_token")
+
+    async def test_follows_next_page_header(self):
+        """Тест перехода по X-Next-Page за пределы первых 20 объектов"""
+        first = make_pipelines(*["2025-09-30T12:00:00Z"] * 100)
+        second = make_pipelines(*["2025-09-30T11:00:00Z"] * 30)
+        self.api._request_page = AsyncMock(side_effect=[
+            (first, {"X-Next-Page": "2"}),
+            (second, {"X-Next-Page": ""}),
+        ])
+
+        pipelines = await self.api.get_project_pipelines(123)
+
+        self.assertEqual(len(pipelines), 130)
+        first_params = self.api._request_page.call_args_list[0].args[2]
+        self.assertEqual(first_params["order_by"], "updated_at")
+        self.assertEqual(first_params["sort"], "desc")
+        self.assertEqual(self.api._request_page.call_args_list[1].args[2]["page"], "2")
+
+    async def test_follows_link_header(self):
+        """Тест перехода по ссылке rel="next" без номера страницы"""
+        next_url = "https://gitlab.example.com/api/v4/projects/123/deployments?cursor=abc"
+        self.api._request_page = AsyncMock(side_effect=[
+            (make_pipelines("2025-09-30T12:00:00Z"), {"Link": f'<{next_url}>; rel="next"'}),
+            (make_pipelines("2025-09-30T11:00:00Z"), {"X-Next-Page": ""}),
+        ])
+
+        deployments = await self.api.get_project_deployments(123)
+
+        self.assertEqual(len(deployments), 2)
+        self.assertEqual(self.api._request_page.call_args_list[1].args[1:], (next_url, None))
+
+    async def test_stops_at_watermark(self):
+        """Тест остановки листания на водяном знаке"""
+        first = make_pipelines(*["2025-09-30T12:00:00Z"] * 99, "2025-09-30T09:00:00Z")
+        self.api._request_page = AsyncMock(return_value=(first, {"X-Next-Page": "2"}))
+
+        pipelines = await self.api.get_project_pipelines(
+            123, updated_after="2025-09-29T00:00:00Z", watermark="2025-09-30T10:00:00Z"
+        )
+
+        self.assertEqual(len(pipelines), 99)
+        self.api._request_page.assert_called_once()
+        self.assertEqual(
+            self.api._request_page.call_args.args[2]["updated_after"], "2025-09-29T00:00:00Z"
+        )
+
+    async def test_jobs_use_created_at_watermark(self):
+        """Тест водяного знака jobs по дате создания без order_by"""
+        jobs = [
+            {"id": 2, "status": "running", "created_at": "2025-09-30T12:00:00Z"},
+            {"id": 1, "status": "success", "created_at": "2025-09-30T08:00:00Z"},
+        ]
+        self.api._request_page = AsyncMock(return_value=(jobs, {"X-Next-Page": "2"}))
+
+        result = await self.api.get_project_jobs(123, updated_after="2025-09-30T10:00:00Z")
+
+        self.assertEqual([job["id"] for job in result], [2])
+        self.assertNotIn("order_by", self.api._request_page.call_args.args[2])
+
+
+class TestParallelPages(unittest.IsolatedAsyncioTestCase):
+    """Тесты параллельного получения страниц по X-Total-Pages"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.api = AsyncGitLabAPI(
+            "https://gitlab.example.com", "test_token", max_parallel_pages=3
+        )
+
+    async def test_remaining_pages_fetched_concurrently(self):
+        """Тест одновременного запроса оставшихся страниц под семафором"""
+        in_flight = 0
+        peak = 0
+
+        async def request_page(method, endpoint, params):
+            nonlocal in_flight, peak
+            page = int(params["page"])
+            if page == 1:
+                return [{"id": 1}] * 100, {"X-Next-Page": "2", "X-Total-Pages": "10"}
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [{"id": page}] * 100, {"X-Next-Page": ""}
+
+        self.api._request_page = request_page
+        projects = await self.api.get_projects()
+
+        self.assertEqual(len(projects), 1000)
+        # Порядок страниц сохраняется
+        self.assertEqual(projects[-1]["id"], 10)
+        self.assertEqual(peak, 3)
+
+    async def test_pages_streamed_in_window(self):
+        """Тест выдачи страниц до загрузки всего списка"""
+        requested = []
+
+        async def request_page(method, endpoint, params):
+            page = int(params["page"])
+            requested.append(page)
+            if page == 1:
+                return [{"id": 1}] * 100, {"X-Next-Page": "2", "X-Total-Pages": "10"}
+            await asyncio.sleep(0)
+            return [{"id": page}] * 100, {"X-Next-Page": ""}
+
+        self.api._request_page = request_page
+        pages = self.api.iter_projects()
+
+        self.assertEqual((await pages.__anext__())[0]["id"], 1)
+        self.assertEqual(requested, [1])
+        self.assertEqual((await pages.__anext__())[0]["id"], 2)
+        await asyncio.sleep(0)
+        # Вперед запрашивается не больше max_parallel_pages страниц
+        self.assertEqual(requested, [1, 2, 3, 4, 5])
+        await pages.aclose()
+
+    async def test_keyset_fallback_without_totals(self):
+        """Тест перехода на keyset-курсор, когда GitLab не сообщает число страниц"""
+        next_url = "https://gitlab.example.com/api/v4/projects?cursor=xyz"
+        self.api._request_page = AsyncMock(side_effect=[
+            ([{"id": i} for i in range(1, 101)], {"X-Next-Page": "2"}),
+            ([{"id": i} for i in range(101, 201)], {"Link": f'<{next_url}>; rel="next"'}),
+            ([{"id": 201}], {}),
+        ])
+
+        projects = await self.api.get_projects()
+
+        self.assertEqual(len(projects), 201)
+        calls = self.api._request_page.call_args_list
+        self.assertEqual(calls[1].args[2]["pagination"], "keyset")
+        self.assertEqual(calls[1].args[2]["id_after"], "100")
+        self.assertEqual(calls[2].args[1:], (next_url, None))
+
+    async def test_events_with_since_id_stay_sequential(self):
+        """Тест последовательного листания при наличии водяного знака"""
+        self.api._request_page = AsyncMock(return_value=(
+            [{"id": 10}, {"id": 5}], {"X-Next-Page": "2", "X-Total-Pages": "50"}
+        ))
+
+        events = await self.api.get_project_events(123, since_id=5)
+
+        self.assertEqual(events, [{"id": 10}])
+        self.api._request_page.assert_called_once()
+
+
+class TestKeysetProjects(unittest.IsolatedAsyncioTestCase):
+    """Тесты keyset-пагинации списка проектов"""
+
+    async def test_async_keyset_follows_link(self):
+        """Тест листания проектов keyset-курсором с первой страницы"""
+        api = AsyncGitLabAPI("https://gitlab.example.com", "test_token", keyset_projects=True)
+        next_url = "https://gitlab.example.com/api/v4/projects?cursor=abc"
+        api._request_page = AsyncMock(side_effect=[
+            ([{"id": i} for i in range(1, 101)], {"Link": f'<{next_url}>; rel="next"'}),
+            ([{"id": 101}], {}),
+        ])
+
+        projects = await api.get_projects()
+
+        self.assertEqual(len(projects), 101)
+        first_params = api._request_page.call_args_list[0].args[2]
+        self.assertEqual(first_params["pagination"], "keyset")
+        self.assertEqual(first_params["order_by"], "id")
+        self.assertNotIn("page", first_params)
+        self.assertEqual(api._request_page.call_args_list[1].args[1:], (next_url, None))
+
+    def test_sync_keyset_list(self):
+        """Тест keyset-пагинации в синхронном API"""
+        from glping.gitlab_api import GitLabAPI
+
+        with patch('glping.gitlab_api.gitlab') as mock_gitlab:
+            mock_gl = MagicMock()
+            mock_gitlab.Gitlab.return_value = mock_gl
+            mock_gl.projects.list.return_value = iter([MagicMock(asdict=lambda: {"id": 1})])
+
+            api = GitLabAPI("https://gitlab.example.com", "test_token", keyset_projects=True)
+            projects = api.get_projects(membership=True)
+
+            self.assertEqual(projects, [{"id": 1}])
+            mock_gl.projects.list.assert_called_once_with(
+                iterator=True,
+                pagination="keyset",
+                order_by="id",
+                sort="asc",
+                per_page=100,
+                membership=True,
+            )
+
+
+class TestSyncPaginator(unittest.TestCase):
+    """Тесты синхронного получения списков до водяного знака"""
+
+    def test_pipelines_iterator_stops_at_watermark(self):
+        """Тест ленивого чтения pipelines до водяного знака"""
+        from glping.gitlab_api import GitLabAPI
+
+        with patch('glping.gitlab_api.gitlab') as mock_gitlab:
+            mock_gl = MagicMock()
+            mock_gitlab.Gitlab.return_value = mock_gl
+            project = mock_gl.projects.get.return_value
+            project.pipelines.list.return_value = iter(
+                MagicMock(asdict=lambda item=item: item)
+                for item in make_pipelines("2025-09-30T12:00:00Z", "2025-09-30T09:00:00Z")
+            )
+
+            api = GitLabAPI("https://gitlab.example.com", "test_token")
+            pipelines = api.get_project_pipelines(123, watermark="2025-09-30T10:00:00Z")
+
+            self.assertEqual(len(pipelines), 1)
+            kwargs = project.pipelines.list.call_args.kwargs
+            self.assertTrue(kwargs["iterator"])
+            self.assertEqual(kwargs["order_by"], "updated_at")
+            self.assertEqual(kwargs["sort"], "desc")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,11 +6,12 @@
 import time
 import asyncio
 from datetime import datetime, timezone, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 from glping.async_gitlab_api import AsyncGitLabAPI
 from glping.async_watcher import AsyncGitLabWatcher
 from glping.config import Config
+from tests.helpers import make_watcher_config, paged
 
 
 def create_mock_projects(count: int, active_only: bool = False):
@@ -50,15 +51,11 @@ async def simulate_old_approach(project_count: int = 100):
     
     # Старый подход: получаем ВСЕ проекты
     all_projects = create_mock_projects(project_count, active_only=False)
-    mock_api.get_projects.return_value = all_projects
-    mock_api.get_project_events.return_value = []
+    mock_api.iter_projects.side_effect = paged(all_projects)
+    mock_api.iter_project_events.side_effect = paged()
     
     # Создаем watcher
-    config = MagicMock()
-    config.gitlab_url = "https://gitlab.example.com"
-    config.gitlab_token = "test_token"
-    config.cache_file = ":memory:"
-    config.get_project_filter.return_value = {"membership": True}
+    config = make_watcher_config(":memory:")
     
     with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
         watcher = AsyncGitLabWatcher(config)
@@ -74,7 +71,7 @@ async def simulate_old_approach(project_count: int = 100):
         end_time = time.time()
         
         execution_time = end_time - start_time
-        api_calls = mock_api.get_projects.call_count
+        api_calls = mock_api.iter_projects.call_count
         
         print(f"⏱️  Время выполнения: {execution_time:.3f} сек")
         print(f"📡 API запросы: {api_calls}")
@@ -93,15 +90,11 @@ async def simulate_new_approach(project_count: int = 100):
     
     # Новый подход: получаем только активные проекты
     active_projects = create_mock_projects(project_count // 2, active_only=True)  # Только половина активна
-    mock_api.get_projects.return_value = active_projects
-    mock_api.get_project_events.return_value = []
+    mock_api.iter_projects.side_effect = paged(active_projects)
+    mock_api.iter_project_events.side_effect = paged()
     
     # Создаем watcher
-    config = MagicMock()
-    config.gitlab_url = "https://gitlab.example.com"
-    config.gitlab_token = "test_token"
-    config.cache_file = ":memory:"
-    config.get_project_filter.return_value = {"membership": True}
+    config = make_watcher_config(":memory:")
     
     with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
         watcher = AsyncGitLabWatcher(config)
@@ -117,7 +110,7 @@ async def simulate_new_approach(project_count: int = 100):
         end_time = time.time()
         
         execution_time = end_time - start_time
-        api_calls = mock_api.get_projects.call_count
+        api_calls = mock_api.iter_projects.call_count
         
         print(f"⏱️  Время выполнения: {execution_time:.3f} сек")
         print(f"📡 API запросы: {api_calls}")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Тесты ограничения частоты запросов по заголовкам RateLimit
+"""
+
+import time
+import unittest
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.rate_limit import RateLimiter, RateLimitError, parse_retry_after
+from tests.helpers import FakeClock, FakeResponse, FakeSession
+
+
+def rate_headers(limit, remaining, reset_in):
+    """Заголовки RateLimit со сбросом через reset_in секунд"""
+    return {
+        "RateLimit-Limit": str(limit),
+        "RateLimit-Remaining": str(remaining),
+        "RateLimit-Reset": str(int(time.time() + reset_in)),
+    }
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    """Тесты корзины токенов"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        # Часы не с нуля, как монотонные часы процесса
+        self.clock = FakeClock(now=1000.0)
+        self.limiter = RateLimiter(reserve=0.1, clock=self.clock, sleep=self.clock.sleep)
+
+    async def test_no_delay_above_reserve(self):
+        """Тест запросов без задержки, пока бюджет больше резерва"""
+        self.limiter.update(rate_headers(600, 300, 60))
+        for _ in range(10):
+            await self.limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(self.limiter.remaining, 290)
+
+    async def test_spreads_requests_below_reserve(self):
+        """Тест равномерного распределения остатка бюджета до сброса"""
+        self.limiter.update(rate_headers(600, 10, 60))
+        for _ in range(3):
+            await self.limiter.acquire()
+        # Первый запрос уходит сразу, следующие — с интервалом до сброса
+        self.assertEqual(len(self.clock.sleeps), 2)
+        self.assertTrue(all(delay > 5 for delay in self.clock.sleeps))
+        self.assertEqual(self.limiter.get_state()["waits"], 2)
+
+    async def test_exhausted_budget_waits_for_reset(self):
+        """Тест ожидания сброса при исчерпанном бюджете"""
+        self.limiter.update(rate_headers(600, 0, 30))
+        await self.limiter.acquire()
+        self.assertAlmostEqual(self.clock.sleeps[0], 30, delta=1)
+        # После сброса бюджет восстановлен
+        await self.limiter.acquire()
+        self.assertEqual(len(self.clock.sleeps), 1)
+
+    async def test_retry_after_blocks_all_requests(self):
+        """Тест ожидания Retry-After после ответа 429"""
+        retry_after = self.limiter.update({"Retry-After": "5"}, status=429)
+        self.assertEqual(retry_after, 5)
+        await self.limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [5])
+        self.assertEqual(self.limiter.get_state()["throttled_responses"], 1)
+
+    def test_parse_retry_after_http_date(self):
+        """Тест разбора Retry-After в формате HTTP-даты"""
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470), 10)
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+class TestRateLimitedRequests(unittest.IsolatedAsyncioTestCase):
+    """Тесты обработки 429 в AsyncGitLabAPI"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.clock = FakeClock(now=1000.0)
+        limiter = RateLimiter(clock=self.clock, sleep=self.clock.sleep)
+        self.api = AsyncGitLabAPI(
+            "https://gitlab.example.com", "test_token",
+            rate_limiter=limiter, rate_limit_retries=2,
+        )
+
+    async def test_retries_after_429(self):
+        """Тест повтора запроса после Retry-After"""
+        self.api.session = FakeSession([
+            FakeResponse(status=429, headers={"Retry-After": "7"}),
+            FakeResponse(body=[{"id": 1}], headers=rate_headers(600, 599, 60)),
+        ])
+
+        result = await self.api._make_request("GET", "projects/1/events")
+
+        self.assertEqual(result, [{"id": 1}])
+        self.assertEqual(self.clock.sleeps, [7])
+        metrics = self.api.get_metrics()["rate_limit"]
+        self.assertEqual(metrics["remaining"], 599)
+        self.assertEqual(metrics["throttled_responses"], 1)
+
+    async def test_persistent_429_raises(self):
+        """Тест ошибки вместо пустого списка, если лимит не снимается"""
+        self.api.session = FakeSession([
+            FakeResponse(status=429, headers={"Retry-After": "1"}) for _ in range(3)
+        ])
+
+        with self.assertRaises(RateLimitError):
+            await self.api._make_request("GET", "projects/1/events")
+        self.assertEqual(len(self.api.session.requests), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Тесты повторов запросов и автоматического выключателя
+"""
+
+import asyncio
+import unittest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.async_watcher import AsyncGitLabWatcher
+from glping.rate_limit import RateLimitError
+from glping.resilience import APIRequestError, CircuitBreaker, CircuitOpenError, RetryPolicy
+from tests.helpers import (
+    FailingSession, FakeClock, FakeResponse, StatusResponse, WatcherTestCase, paged
+)
+
+
+class HangingResponse(FakeResponse):
+    """Ответ, который не приходит до отмены запроса"""
+
+    async def __aenter__(self):
+        await asyncio.Event().wait()
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Тесты экспоненциальной задержки"""
+
+    def test_backoff_is_capped(self):
+        """Тест ограничения задержки сверху"""
+        policy = RetryPolicy(base_delay=1, max_delay=5, rng=lambda: 0.999)
+        delays = [policy.backoff(attempt) for attempt in range(5)]
+        self.assertLess(delays[0], 1)
+        self.assertLess(delays[2], 4)
+        self.assertLess(delays[4], 5)
+        self.assertGreater(delays[4], 4.9)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Тесты автоматического выключателя"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=self.clock)
+
+    def test_opens_after_threshold(self):
+        """Тест размыкания после серии ошибок"""
+        self.breaker.record_failure()
+        self.breaker.before_request()
+        self.breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_request()
+        self.assertEqual(self.breaker.get_state()["rejected"], 1)
+
+    def test_half_open_probe(self):
+        """Тест одного пробного запроса после таймаута"""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+        self.breaker.before_request()
+        # Пока идет пробный запрос, остальные отклоняются
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_request()
+        self.breaker.record_success()
+        self.breaker.before_request()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_failed_probe_reopens(self):
+        """Тест повторного размыкания после неудачной пробы"""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+        self.breaker.before_request()
+        self.breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_request()
+
+
+class TestRequestRetries(unittest.IsolatedAsyncioTestCase):
+    """Тесты повторов в AsyncGitLabAPI"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.sleeps = []
+
+        async def sleep(delay):
+            self.sleeps.append(delay)
+
+        self.api = AsyncGitLabAPI(
+            "https://gitlab.example.com", "test_token",
+            retry_policy=RetryPolicy(max_retries=2, sleep=sleep),
+            breaker_factory=lambda: CircuitBreaker(failure_threshold=3),
+        )
+
+    async def test_retries_server_error(self):
+        """Тест повтора GET после 502"""
+        self.api.session = FailingSession([
+            StatusResponse(status=502),
+            aiohttp.ClientConnectionError("reset"),
+            StatusResponse(body=[{"id": 1}]),
+        ])
+
+        result = await self.api._make_request("GET", "projects/1/events")
+
+        self.assertEqual(result, [{"id": 1}])
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertEqual(self.api.get_metrics()["retries"], 2)
+
+    async def test_exhausted_retries_raise(self):
+        """Тест ошибки вместо пустого списка после всех повторов"""
+        self.api.session = FailingSession([StatusResponse(status=503) for _ in range(3)])
+
+        with self.assertRaises(APIRequestError):
+            await self.api._make_request("GET", "projects/1/events")
+
+        # Выключатель разомкнут: следующий запрос не отправляется
+        with self.assertRaises(CircuitOpenError):
+            await self.api._make_request("GET", "projects/2/events")
+        self.assertEqual(len(self.api.session.requests), 3)
+
+    async def test_probe_outcome_recorded_on_any_exit(self):
+        """Тест освобождения пробного запроса после RateLimitError и отмены"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        self.api = AsyncGitLabAPI(
+            "https://gitlab.example.com", "test_token",
+            retry_policy=RetryPolicy(max_retries=0),
+            breaker_factory=lambda: breaker,
+        )
+        breaker.record_failure()
+
+        # Пробный запрос завершился RateLimitError: выключатель снова разомкнут
+        clock.now = 10
+        self.api.session = FailingSession([RateLimitError("429")])
+        with self.assertRaises(RateLimitError):
+            await self.api._make_request("GET", "projects/1/events")
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        # Отмененный пробный запрос (GraphQL POST) не блокирует следующую пробу
+        clock.now = 20
+        self.api.session = FailingSession([HangingResponse()])
+        task = asyncio.ensure_future(
+            self.api._request_page("POST", "graphql", json_body={"query": "{}"})
+        )
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        self.api.session = FailingSession([StatusResponse(body=[{"id": 1}])])
+        result = await self.api._make_request("GET", "projects/3/events")
+        self.assertEqual(result, [{"id": 1}])
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    async def test_client_error_not_retried(self):
+        """Тест пустого результата без повторов на 404"""
+        self.api.session = FailingSession([StatusResponse(status=404)])
+
+        result = await self.api._make_request("GET", "projects/1/jobs")
+
+        self.assertEqual(result, [])
+        self.assertEqual(self.sleeps, [])
+
+
+class TestWatcherFailures(WatcherTestCase):
+    """Тесты реакции наблюдателя на неполученные данные"""
+
+    async def test_failed_project_keeps_last_checked(self):
+        """Тест сохранения даты последней проверки при ошибке API"""
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        mock_api.iter_projects.side_effect = paged([{"id": 1, "name": "Project"}])
+        mock_api.iter_project_events.side_effect = paged()
+        mock_api.get_project_pipelines.side_effect = APIRequestError("502")
+        mock_api.get_project_jobs.return_value = []
+        mock_api.get_project_deployments.return_value = []
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            last_checked = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+            await watcher.cache.set_last_checked_async(last_checked)
+
+            await watcher.check_projects()
+
+            self.assertEqual(watcher.cache.get_last_checked(), last_checked)
+
+    async def test_events_not_repeated_after_failed_page(self):
+        """Тест отсутствия повторных уведомлений после ошибки на следующей странице"""
+        now = datetime.now(timezone.utc)
+        first_page = [
+            {"id": 12, "created_at": now.isoformat()},
+            {"id": 11, "created_at": now.isoformat()},
+        ]
+        second_page = [{"id": 10, "created_at": now.isoformat()}]
+
+        async def failing_pages(*args, **kwargs):
+            yield first_page
+            raise APIRequestError("502")
+
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        mock_api.iter_project_events.side_effect = failing_pages
+        mock_api.get_project_pipelines.return_value = []
+        mock_api.get_project_jobs.return_value = []
+        mock_api.get_project_deployments.return_value = []
+        project = {"id": 1, "name": "Project"}
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            notified = []
+
+            async def process(event, project_name, project_id):
+                notified.append(event["id"])
+
+            watcher._process_event_async = process
+            since = (now - timedelta(hours=1)).isoformat()
+
+            with self.assertRaises(APIRequestError):
+                await watcher._check_project_events(project, since=since)
+            self.assertIsNone(watcher.cache.get_last_event_id(1))
+
+            mock_api.iter_project_events.side_effect = paged(first_page, second_page)
+            await watcher._check_project_events(project, since=since)
+            await watcher.cache.flush_async()
+
+        self.assertEqual(notified, [11, 12, 10])
+        self.assertEqual(watcher.cache.get_last_event_id(1), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
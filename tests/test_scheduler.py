@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Тесты расписания проверки проектов
+"""
+
+import os
+import unittest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, patch
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.async_watcher import AsyncGitLabWatcher
+from glping.config import Config
+from glping.scheduler import PollScheduler, has_active_ci
+from tests.helpers import FakeClock, WatcherTestCase, paged
+
+
+class TestPollScheduler(unittest.TestCase):
+    """Тесты очереди проверки проектов"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.clock = FakeClock()
+        self.scheduler = PollScheduler(
+            hot_interval=60, max_interval=300, hot_window=120, tolerance=0, clock=self.clock
+        )
+
+    def test_hot_project_polled_every_interval(self):
+        """Тест проверки горячего проекта с интервалом горячего уровня"""
+        self.scheduler.record(1, True, "2025-01-01T00:00:00+00:00")
+        self.assertTrue(self.scheduler.is_hot(1))
+        self.assertEqual(self.scheduler.seconds_until_due(), 60)
+
+        self.clock.now = 59
+        self.assertEqual(self.scheduler.pop_due(), [])
+        self.clock.now = 60
+        self.assertEqual(self.scheduler.pop_due(), [1])
+        self.assertNotIn(1, self.scheduler)
+
+    def test_quiet_project_backs_off_and_leaves(self):
+        """Тест удвоения интервала остывающего проекта и выхода из расписания"""
+        self.scheduler.record(1, True, "t0")
+        intervals = []
+        while 1 in self.scheduler:
+            self.clock.now = self.scheduler._due[1]
+            self.scheduler.pop_due()
+            self.scheduler.record(1, False, "t")
+            if 1 in self.scheduler:
+                intervals.append(self.scheduler._due[1] - self.clock.now)
+        # Первые 120 секунд после активности проект остается горячим
+        self.assertEqual(intervals, [60, 120, 240, 300])
+        self.assertIsNone(self.scheduler.get_checked_at(1))
+
+        # Новая активность возвращает проект в расписание на горячий уровень
+        self.scheduler.record(1, True, "t")
+        self.assertEqual(self.scheduler._due[1] - self.clock.now, 60)
+
+    def test_running_ci_keeps_project_hot(self):
+        """Тест горячего уровня, пока не получен конечный статус pipeline"""
+        self.scheduler.track_ci(1, "pipeline", [{"id": 7, "status": "running"}])
+        self.scheduler.record(1, True, "t")
+
+        # Следующие списки CI не содержат pipeline: он не менялся
+        for _ in range(5):
+            self.clock.now = self.scheduler._due[1]
+            self.scheduler.pop_due()
+            self.scheduler.track_ci(1, "pipeline", [])
+            self.scheduler.record(1, False, "t")
+            self.assertTrue(self.scheduler.is_hot(1))
+
+        self.scheduler.track_ci(1, "pipeline", [{"id": 7, "status": "success"}])
+        self.assertFalse(self.scheduler.has_running_ci(1))
+
+    def test_due_within_tolerance_popped_together(self):
+        """Тест извлечения близких по времени проверок в одном цикле"""
+        scheduler = PollScheduler(hot_interval=60, hot_window=120, clock=self.clock)
+        scheduler.record(1, True, "t")
+        self.clock.now = 20
+        scheduler.record(2, True, "t")
+        self.clock.now = 60
+        self.assertEqual(scheduler.pop_due(), [1, 2])
+
+    def test_due_order_and_rescheduling(self):
+        """Тест порядка проверки и замены времени проверки проекта"""
+        self.scheduler.record(1, True, "t")
+        self.clock.now = 10
+        self.scheduler.record(2, True, "t")
+        self.clock.now = 20
+        self.scheduler.retry(1)
+        self.scheduler.forget(3)
+
+        self.clock.now = 80
+        # Старое время проекта 1 (60) заменено на 80 после retry()
+        self.assertEqual(self.scheduler.pop_due(), [2, 1])
+        self.assertIsNone(self.scheduler.seconds_until_due())
+        self.assertEqual(self.scheduler.get_checked_at(1), "t")
+
+    def test_has_active_ci(self):
+        """Тест определения незавершенного CI"""
+        self.assertTrue(has_active_ci([{"status": "success"}, {"status": "running"}]))
+        self.assertFalse(has_active_ci([{"status": "success"}, {"status": "manual"}]))
+
+    def test_options_from_config(self):
+        """Тест параметров расписания из конфигурации"""
+        env = {
+            "GITLAB_URL": "https://gitlab.com",
+            "GITLAB_TOKEN": "test_token_123456789",
+            "CHECK_INTERVAL": "30",
+            "POLL_INTERVAL_MAX": "900",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = Config()
+        self.assertFalse(config.adaptive_polling)
+        self.assertEqual(
+            config.get_scheduler_options(),
+            {"hot_interval": 30, "max_interval": 900.0, "hot_window": 1800.0},
+        )
+
+
+class TestScheduledChecks(WatcherTestCase):
+    """Тесты проверки проектов по расписанию в наблюдателе"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        super().setUp()
+        self.config.check_interval = 60
+        self.config.adaptive_polling = True
+        self.config.get_scheduler_options.return_value = {
+            "hot_interval": 60, "max_interval": 600, "hot_window": 30,
+        }
+
+    async def test_quiet_cycle_checks_due_projects(self):
+        """Тест проверки проекта по расписанию без активности в списке проектов"""
+        project = {
+            "id": 1,
+            "name": "Project",
+            "name_with_namespace": "Group / Project",
+            "path_with_namespace": "group/project",
+            "last_activity_at": datetime.now(timezone.utc).isoformat(),
+        }
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        mock_api.iter_projects.side_effect = paged([project])
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            clock = FakeClock()
+            watcher.scheduler = PollScheduler(
+                **self.config.get_scheduler_options(), clock=clock
+            )
+            checks = []
+
+            async def check(project, verbose=False, events=None, since=None):
+                checks.append((project["id"], since))
+                return False
+
+            watcher._check_project_events = check
+            last_checked = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+            await watcher.cache.set_last_checked_async(last_checked)
+
+            # Активность из списка проектов: проверка и горячий уровень
+            await watcher.check_projects()
+            self.assertEqual(checks, [(1, last_checked)])
+            first_checked_at = watcher.scheduler.get_checked_at(1)
+            self.assertEqual(watcher._next_cycle_delay(), 60)
+            # Проверка в пределах допуска не выделяется в отдельный цикл
+            clock.now = 15
+            self.assertEqual(watcher._next_cycle_delay(), 60)
+
+            # Список пуст, но время проверки проекта наступило
+            mock_api.iter_projects.side_effect = paged()
+            clock.now = 60
+            await watcher.check_projects()
+            self.assertEqual(checks[1], (1, first_checked_at))
+
+            # Проверка без активности удваивает интервал
+            clock.now = 61
+            await watcher.check_projects()
+            self.assertEqual(len(checks), 2)
+            self.assertEqual(watcher.scheduler.seconds_until_due(), 119)
+
+    async def test_running_pipeline_tracked_between_checks(self):
+        """Тест учета незавершенного pipeline, не попавшего в следующий список"""
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        mock_api.get_project_pipelines.return_value = [
+            {"id": 7, "status": "running", "created_at": "2025-01-01T00:00:00Z"}
+        ]
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            project = {"id": 1, "name": "Project"}
+            self.assertTrue(await watcher._check_pipeline_events(project))
+
+            mock_api.get_project_pipelines.return_value = []
+            self.assertFalse(await watcher._check_pipeline_events(project))
+            await watcher.cache.flush_async()
+
+        self.assertTrue(watcher.scheduler.has_running_ci(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
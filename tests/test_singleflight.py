@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Тесты объединения одинаковых одновременных запросов
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.async_watcher import AsyncGitLabWatcher
+from glping.singleflight import SingleFlight
+from tests.helpers import FakeResponse, WatcherTestCase
+
+
+class DelayedResponse(FakeResponse):
+    """Ответ, который приходит не сразу"""
+
+    async def __aenter__(self):
+        await asyncio.sleep(0)
+        return self
+
+
+class SlowSession:
+    """Сессия, отвечающая одним телом с задержкой и запоминающая запросы"""
+
+    def __init__(self, body):
+        self.body = body
+        self.requests = []
+
+    def request(self, method, url, params=None, headers=None):
+        self.requests.append((method, url, params))
+        return DelayedResponse(body=self.body)
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    """Тесты группы одновременных вызовов"""
+
+    async def test_concurrent_calls_share_result(self):
+        """Тест одного выполнения для одновременных вызовов с одним ключом"""
+        group = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return "result"
+
+        results = await asyncio.gather(*(group.do("key", fetch) for _ in range(5)))
+
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(group.shared, 4)
+        self.assertEqual(len(group), 0)
+
+        # Результат не кешируется после завершения вызова
+        await group.do("key", fetch)
+        self.assertEqual(len(calls), 2)
+
+    async def test_error_shared(self):
+        """Тест передачи исключения всем ожидающим"""
+        group = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            group.do("key", fail), group.do("key", fail), return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+    async def test_cancelled_waiter_does_not_cancel_call(self):
+        """Тест продолжения вызова после отмены одного из ожидающих"""
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "result"
+
+        first = asyncio.ensure_future(group.do("key", fetch))
+        second = asyncio.ensure_future(group.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, "result")
+
+
+class TestRequestCoalescing(unittest.IsolatedAsyncioTestCase):
+    """Тесты объединения GET запросов в AsyncGitLabAPI"""
+
+    async def test_identical_gets_coalesced(self):
+        """Тест одного HTTP запроса для одинаковых одновременных GET"""
+        api = AsyncGitLabAPI("https://gitlab.example.com", "test_token")
+        api.session = SlowSession([{"id": 1}])
+
+        results = await asyncio.gather(
+            *(api._make_request("GET", "projects", {"id": 1}) for _ in range(3)),
+            api._make_request("GET", "projects", {"id": 2}),
+        )
+
+        self.assertEqual(results, [[{"id": 1}]] * 4)
+        self.assertEqual(len(api.session.requests), 2)
+        self.assertEqual(api.get_metrics()["singleflight"]["shared"], 2)
+
+
+class TestProjectPathCoalescing(WatcherTestCase):
+    """Тесты объединения запросов пути проекта в наблюдателе"""
+
+    async def test_burst_costs_one_request(self):
+        """Тест одного запроса проекта для пачки событий с холодным кешем путей"""
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+
+        async def get_projects(**kwargs):
+            await asyncio.sleep(0)
+            return [{"id": 7, "path_with_namespace": "group/project"}]
+
+        mock_api.get_projects.side_effect = get_projects
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            paths = await asyncio.gather(
+                *(watcher._get_project_path_async(7) for _ in range(30))
+            )
+
+        self.assertEqual(set(paths), {"group/project"})
+        mock_api.get_projects.assert_awaited_once_with(project_id=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Тесты кеша на базе SQLite
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from glping.cache import create_cache
+from glping.sqlite_cache import SQLiteCache
+
+
+class TestSQLiteCache(unittest.TestCase):
+    """Тесты хранилища кеша SQLite"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, "test_cache.json")
+        self.db_file = os.path.join(self.temp_dir, "test_cache.db")
+
+    def tearDown(self):
+        """Очистка тестового окружения"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_factory_creates_sqlite_cache(self):
+        """Тест выбора хранилища через фабрику"""
+        cache = create_cache(self.cache_file, backend="sqlite")
+        self.assertIsInstance(cache, SQLiteCache)
+        self.assertEqual(cache.cache_file, self.db_file)
+        self.assertTrue(os.path.exists(self.db_file))
+        cache.close()
+
+    def test_wal_mode_enabled(self):
+        """Тест включения режима WAL"""
+        cache = SQLiteCache(self.cache_file)
+        mode = cache._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+        cache.close()
+
+    def test_row_level_persistence(self):
+        """Тест построчного сохранения всех разделов кеша"""
+        cache = SQLiteCache(self.cache_file)
+        cache.set_last_event_id(123, 456)
+        cache.save_project_event(123, "pipeline_1_success")
+        cache.set_project_activity(123, "2025-09-30T15:30:00Z")
+        cache.save_project_path(123, "group/project")
+        cache.set_last_checked("2025-09-30T16:00:00+00:00")
+        cache.close()
+
+        # JSON файл не создается при построчном сохранении
+        self.assertFalse(os.path.exists(self.cache_file))
+
+        cache2 = SQLiteCache(self.cache_file)
+        self.assertEqual(cache2.get_last_event_id(123), 456)
+        self.assertIn("pipeline_1_success", cache2.get_project_events(123))
+        self.assertEqual(cache2.get_project_activity(123), "2025-09-30T15:30:00Z")
+        self.assertEqual(cache2.get_project_path(123), "group/project")
+        self.assertEqual(cache2.get_last_checked(), "2025-09-30T16:00:00+00:00")
+        cache2.close()
+
+    def test_json_import_on_first_start(self):
+        """Тест импорта существующего JSON кеша при первом запуске"""
+        json_data = {
+            "metadata": {"last_checked": "2025-09-30T15:30:00+00:00"},
+            "projects": {"123": {"last_event_id": 456, "events": [1, 2]}},
+            "project_activity": {"123": "2025-09-30T15:00:00Z"},
+            "project_paths": {"123": "group/project"},
+        }
+        with open(self.cache_file, "w") as f:
+            json.dump(json_data, f)
+
+        cache = SQLiteCache(self.cache_file)
+        self.assertEqual(cache.get_last_checked(), "2025-09-30T15:30:00+00:00")
+        self.assertEqual(cache.get_last_event_id(123), 456)
+        self.assertEqual(cache.get_project_activity(123), "2025-09-30T15:00:00Z")
+        cache.close()
+
+        # Повторный запуск читает данные из базы, а не из JSON
+        os.unlink(self.cache_file)
+        cache2 = SQLiteCache(self.cache_file)
+        self.assertEqual(cache2.get_last_event_id(123), 456)
+        self.assertEqual(cache2.get_project_path(123), "group/project")
+        cache2.close()
+
+    def test_endpoint_watermarks_persisted(self):
+        """Тест сохранения водяных знаков списков и миграции старой схемы"""
+        import sqlite3
+        conn = sqlite3.connect(self.db_file)
+        conn.execute(
+            "CREATE TABLE projects (project_id INTEGER PRIMARY KEY, last_event_id INTEGER, events TEXT)"
+        )
+        conn.close()
+
+        cache = SQLiteCache(self.cache_file)
+        cache.set_endpoint_watermark(123, "pipelines", "2025-09-30T15:30:00Z")
+        cache.close()
+
+        cache2 = SQLiteCache(self.cache_file)
+        self.assertEqual(
+            cache2.get_endpoint_watermark(123, "pipelines"), "2025-09-30T15:30:00Z"
+        )
+        self.assertIsNone(cache2.get_endpoint_watermark(123, "jobs"))
+        cache2.close()
+
+    def test_project_catalogue_persisted(self):
+        """Тест сохранения каталога проектов и удаления исчезнувших проектов"""
+        cache = SQLiteCache(self.cache_file)
+        cache.replace_catalogue(
+            [
+                {"id": 1, "path_with_namespace": "group/one", "name": "One",
+                 "last_activity_at": "2025-09-30T15:00:00Z"},
+                {"id": 2, "path_with_namespace": "group/two", "name": "Two",
+                 "last_activity_at": "2025-09-30T14:00:00Z"},
+            ],
+            "2025-09-30T16:00:00+00:00",
+        )
+        # Дельта без пути проекта сохраняет путь из каталога
+        cache.update_catalogue([{"id": 1, "last_activity_at": "2025-09-30T17:00:00Z"}])
+        cache.close()
+
+        cache2 = SQLiteCache(self.cache_file)
+        self.assertEqual(cache2.get_project_path(1), "group/one")
+        self.assertEqual(
+            cache2.get_catalogue_project(1)["last_activity_at"], "2025-09-30T17:00:00Z"
+        )
+        cache2.replace_catalogue(
+            [{"id": 1, "path_with_namespace": "group/one"}], "2025-10-01T16:00:00+00:00"
+        )
+        cache2.close()
+
+        cache3 = SQLiteCache(self.cache_file)
+        self.assertEqual(list(cache3.get_catalogue()), [1])
+        self.assertIsNone(cache3.get_project_path(2))
+        cache3.close()
+
+    def test_reset(self):
+        """Тест сброса кеша"""
+        cache = SQLiteCache(self.cache_file)
+        cache.set_last_event_id(123, 456)
+        cache.reset()
+        cache.close()
+
+        cache2 = SQLiteCache(self.cache_file)
+        self.assertIsNone(cache2.get_last_event_id(123))
+        self.assertIsNotNone(cache2.get_last_checked())
+        cache2.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
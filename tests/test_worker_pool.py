@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Тесты пула обработчиков проверки проектов
+"""
+
+import asyncio
+import os
+import unittest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, patch
+
+from glping.async_gitlab_api import AsyncGitLabAPI
+from glping.async_watcher import AsyncGitLabWatcher
+from glping.config import Config
+from glping.worker_pool import WorkerPool
+from tests.helpers import WatcherTestCase, paged
+
+
+class TestWorkerPool(unittest.IsolatedAsyncioTestCase):
+    """Тесты ограниченного пула обработчиков"""
+
+    async def test_bounded_concurrency(self):
+        """Тест одновременной обработки не больше size заданий"""
+        running = 0
+        peak = 0
+        done = []
+
+        async def handler(item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            done.append(item)
+
+        async with WorkerPool(handler, size=3) as pool:
+            for item in range(20):
+                await pool.submit(item)
+
+        self.assertEqual(sorted(done), list(range(20)))
+        self.assertEqual(peak, 3)
+        self.assertEqual(pool.completed, 20)
+        # Обработчики остановлены после выхода из пула
+        self.assertEqual(pool._workers, [])
+
+    async def test_timeout_and_errors_collected(self):
+        """Тест прерывания долгого задания и сбора ошибок"""
+        async def handler(item):
+            if item == "slow":
+                await asyncio.sleep(10)
+            if item == "bad":
+                raise ValueError("bad")
+
+        async with WorkerPool(handler, size=2, timeout=0.01) as pool:
+            for item in ("slow", "bad", "ok"):
+                await pool.submit(item)
+
+        self.assertEqual(pool.completed, 1)
+        self.assertEqual(pool.failed, 2)
+        self.assertEqual(pool.timed_out, 1)
+        errors = dict(pool.errors)
+        self.assertIsInstance(errors["slow"], asyncio.TimeoutError)
+        self.assertIsInstance(errors["bad"], ValueError)
+
+    async def test_cancelled_on_error(self):
+        """Тест отмены начатых заданий при исключении в блоке пула"""
+        cancelled = []
+
+        async def handler(item):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+
+        with self.assertRaises(RuntimeError):
+            async with WorkerPool(handler, size=2) as pool:
+                await pool.submit(1)
+                await pool.submit(2)
+                await asyncio.sleep(0)
+                raise RuntimeError("listing failed")
+
+        self.assertEqual(sorted(cancelled), [1, 2])
+
+    def test_worker_options_from_config(self):
+        """Тест параметров пула и лимита соединений при фиксированной параллельности"""
+        env = {
+            "GITLAB_URL": "https://gitlab.com",
+            "GITLAB_TOKEN": "test_token_123456789",
+            "WORKER_POOL_SIZE": "25",
+            "PROJECT_CHECK_TIMEOUT": "0",
+            "ADAPTIVE_CONCURRENCY": "false",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = Config()
+        self.assertEqual(config.get_worker_options(), {"size": 25, "timeout": None})
+        self.assertEqual(config.http_limit_per_host, 25)
+
+
+class TestProjectCheckTimeout(WatcherTestCase):
+    """Тесты таймаута проверки проекта в наблюдателе"""
+
+    def setUp(self):
+        """Подготовка тестового окружения"""
+        super().setUp()
+        self.config.get_worker_options.return_value = {"size": 2, "timeout": 0.05}
+
+    async def test_timed_out_project_keeps_last_checked(self):
+        """Тест сохранения даты последней проверки после прерванной проверки"""
+        mock_api = AsyncMock(spec=AsyncGitLabAPI)
+        mock_api.iter_projects.side_effect = paged(
+            [{"id": 1, "name": "Slow"}, {"id": 2, "name": "Fast"}]
+        )
+
+        with patch('glping.async_watcher.AsyncGitLabAPI', return_value=mock_api):
+            watcher = AsyncGitLabWatcher(self.config)
+            checked = []
+
+            async def check(project, verbose=False, events=None, since=None):
+                if project["id"] == 1:
+                    await asyncio.sleep(10)
+                checked.append(project["id"])
+
+            watcher._check_project_events = check
+            last_checked = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+            await watcher.cache.set_last_checked_async(last_checked)
+
+            await watcher.check_projects()
+
+            self.assertEqual(checked, [2])
+            self.assertEqual(watcher.cache.get_last_checked(), last_checked)
+
+
+if __name__ == '__main__':
+    unittest.main()